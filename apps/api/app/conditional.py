@@ -0,0 +1,130 @@
+"""Entity tags and conditional ``GET`` handling.
+
+Resource tags are strong validators derived from the row's public id and its
+``row_version`` counter, and collection tags hash the ``(id, row_version)``
+pairs of the page in order. Both can therefore be computed from a narrow
+column probe, letting a handler answer ``304 Not Modified`` without loading or
+serializing ORM objects.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Tuple, Type
+
+from fastapi import Response, status
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from .models.mixins import BaseModel
+
+if TYPE_CHECKING:  # pragma: no cover - the async stack is optional
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+
+
+def resource_etag(model: Type[BaseModel], identifier: uuid.UUID, row_version: int) -> str:
+    """Return the strong entity tag of a single resource."""
+
+    return f'"{model.public_id_prefix}-{identifier}.{row_version}"'
+
+
+def set_resource_etag(response: Response, instance: BaseModel) -> None:
+    """Advertise the entity tag of ``instance`` on ``response``."""
+
+    row_version = instance.row_version  # type: ignore[attr-defined]
+    response.headers[ETAG_HEADER] = resource_etag(type(instance), instance.id, row_version)
+
+
+def collection_etag(versions: Iterable[Tuple[uuid.UUID, int]]) -> str:
+    """Return the strong entity tag of an ordered page of ``(id, row_version)`` pairs."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for identifier, row_version in versions:
+        digest.update(identifier.bytes)
+        digest.update(row_version.to_bytes(8, "big"))
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``.
+
+    ``If-None-Match`` uses weak comparison, so a ``W/`` prefix on either side is
+    ignored.
+    """
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """Return an empty ``304`` response carrying ``etag`` and any extra ``headers``."""
+
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(headers or {}))
+    response.headers[ETAG_HEADER] = etag
+    return response
+
+
+def _row_version_statement(model: Type[BaseModel], identifier: uuid.UUID) -> Select:
+    return select(model.row_version).where(model.id == identifier)  # type: ignore[attr-defined]
+
+
+def _unchanged(
+    model: Type[BaseModel], identifier: uuid.UUID, row_version: Optional[int], if_none_match: str
+) -> Optional[Response]:
+    if row_version is None:
+        return None
+    etag = resource_etag(model, identifier, row_version)
+    return not_modified(etag) if etag_matches(if_none_match, etag) else None
+
+
+def probe_resource(
+    session: Session, model: Type[BaseModel], identifier: uuid.UUID, if_none_match: Optional[str]
+) -> Optional[Response]:
+    """Return a ``304`` response if the client's copy of the row is current.
+
+    Only ``row_version`` is read. ``None`` means the caller should load and
+    return the resource as usual, including when the row does not exist.
+    """
+
+    if not if_none_match:
+        return None
+    row_version = session.scalar(_row_version_statement(model, identifier))
+    return _unchanged(model, identifier, row_version, if_none_match)
+
+
+async def probe_resource_async(
+    session: "AsyncSession", model: Type[BaseModel], identifier: uuid.UUID, if_none_match: Optional[str]
+) -> Optional[Response]:
+    """Async counterpart of :func:`probe_resource`."""
+
+    if not if_none_match:
+        return None
+    row_version = await session.scalar(_row_version_statement(model, identifier))
+    return _unchanged(model, identifier, row_version, if_none_match)
+
+
+__all__ = [
+    "ETAG_HEADER",
+    "IF_NONE_MATCH_HEADER",
+    "collection_etag",
+    "etag_matches",
+    "not_modified",
+    "probe_resource",
+    "probe_resource_async",
+    "resource_etag",
+    "set_resource_etag",
+]
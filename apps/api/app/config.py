@@ -29,6 +29,18 @@ class Settings(BaseModel):
 
     image_query_wait_timeout_seconds: float = Field(default=10.0, ge=0.0)
     image_query_wait_poll_seconds: float = Field(default=0.5, ge=0.0)
+    answer_stream_heartbeat_seconds: float = Field(default=15.0, gt=0.0)
+
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0.0)
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1)
+    db_pool_pre_ping: bool = Field(default=True)
+    async_database: bool = Field(default=False)
+    request_metrics_enabled: bool = Field(default=True)
+    reference_cache_ttl_seconds: float = Field(default=30.0, ge=0.0)
+    reference_cache_max_entries: int = Field(default=10000, ge=0)
+    fast_list_serialization: bool = Field(default=False)
 
     
     def database_url(self) -> str:
@@ -38,6 +50,19 @@ class Settings(BaseModel):
             return self.postgres_url.replace("postgresql://", "postgresql+psycopg://", 1)
         return self.postgres_url
 
+    def async_database_url(self) -> str:
+        """Return the database URL rewritten for an asyncio driver."""
+
+        url = self.database_url()
+        for sync_prefix, async_prefix in (
+            ("postgresql+psycopg://", "postgresql+asyncpg://"),
+            ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ):
+            if url.startswith(sync_prefix):
+                return url.replace(sync_prefix, async_prefix, 1)
+        return url
+
     @classmethod
     def from_env(cls) -> "Settings":
         """Create a settings object using environment variables."""
@@ -60,6 +85,20 @@ class Settings(BaseModel):
             image_query_wait_poll_seconds=float(
                 os.getenv("IMAGE_QUERY_WAIT_POLL_SECONDS", 0.5)
             ),
+            answer_stream_heartbeat_seconds=float(
+                os.getenv("ANSWER_STREAM_HEARTBEAT_SECONDS", 15.0)
+            ),
+            db_pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+            db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            db_pool_timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", 30.0)),
+            db_pool_recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", 1800)),
+            db_pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() not in ("0", "false", "no"),
+            async_database=os.getenv("ASYNC_DATABASE", "false").lower() in ("1", "true", "yes"),
+            request_metrics_enabled=os.getenv("REQUEST_METRICS_ENABLED", "true").lower()
+            not in ("0", "false", "no"),
+            reference_cache_ttl_seconds=float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", 30.0)),
+            reference_cache_max_entries=int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", 10000)),
+            fast_list_serialization=os.getenv("FAST_LIST_SERIALIZATION", "false").lower() in ("1", "true", "yes"),
         )
 
 
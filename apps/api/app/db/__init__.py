@@ -1,5 +1,13 @@
 """Database helpers exposed for the FastAPI application."""
 
+from .async_session import (
+    configure_async_engine,
+    configure_default_async_engine,
+    dispose_async_engine,
+    get_async_engine,
+    get_async_session,
+    get_async_session_factory,
+)
 from .base import Base
 from .session import (
     configure_default_engine,
@@ -14,8 +22,14 @@ from .types import GUID
 __all__ = [
     "Base",
     "GUID",
+    "configure_async_engine",
+    "configure_default_async_engine",
     "configure_default_engine",
     "configure_engine",
+    "dispose_async_engine",
+    "get_async_engine",
+    "get_async_session",
+    "get_async_session_factory",
     "get_engine",
     "get_session",
     "get_session_factory",
@@ -0,0 +1,85 @@
+"""Async database engine configuration and FastAPI dependency wiring.
+
+The async engine is opt-in (``ASYNC_DATABASE=true``) and mirrors the sync
+engine in :mod:`.session`: same pool sizing, same instrumentation, and the same
+``expire_on_commit=False`` session semantics so route code can serialize rows
+after committing.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from ..config import settings
+from .pool import InstrumentedAsyncAdaptedQueuePool, install_pool_gauges
+from .session import pool_arguments
+
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionFactory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def configure_async_engine(database_url: str) -> None:
+    """Initialise the global async engine and session factory.
+
+    ``database_url`` must name an asyncio driver such as ``postgresql+asyncpg``
+    or ``sqlite+aiosqlite``; see :meth:`Settings.async_database_url`.
+    """
+
+    if not database_url:
+        raise RuntimeError("DATABASE_URL is empty; set POSTGRES_URL in the environment")
+
+    pool_args = pool_arguments(database_url, InstrumentedAsyncAdaptedQueuePool)
+    engine = create_async_engine(database_url, echo=False, **pool_args)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    global _async_engine, _AsyncSessionFactory
+    _async_engine = engine
+    _AsyncSessionFactory = session_factory
+
+
+def _current_sync_engine() -> Optional[Engine]:
+    return _async_engine.sync_engine if _async_engine is not None else None
+
+
+install_pool_gauges(_current_sync_engine)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the configured async engine."""
+
+    if _async_engine is None:
+        raise RuntimeError("Async database engine has not been configured")
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the configured async session factory."""
+
+    if _AsyncSessionFactory is None:
+        raise RuntimeError("Async session factory has not been configured")
+    return _AsyncSessionFactory
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that yields an async database session."""
+
+    session_factory = get_async_session_factory()
+    async with session_factory() as session:
+        yield session
+
+
+def configure_default_async_engine() -> None:
+    """Configure the async engine using the current settings if not already configured."""
+
+    if _async_engine is None and settings.postgres_url:
+        configure_async_engine(settings.async_database_url())
+
+
+async def dispose_async_engine() -> None:
+    """Close every pooled connection held by the async engine."""
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
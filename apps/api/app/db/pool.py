@@ -0,0 +1,91 @@
+"""Connection pool instrumentation for the SQLAlchemy engines."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from ..metrics import registry
+
+POOL_CHECKOUT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+pool_checkout_seconds = registry.histogram(
+    "intellioptics_db_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the pool.",
+    buckets=POOL_CHECKOUT_BUCKETS,
+)
+pool_checkout_timeouts = registry.counter(
+    "intellioptics_db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout seconds.",
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """:class:`QueuePool` that records how long each checkout waits."""
+
+    def _do_get(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_checkout_timeouts.inc()
+            raise
+        finally:
+            pool_checkout_seconds.observe(time.perf_counter() - started)
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Checkout-timed pool for engines created with ``create_async_engine``."""
+
+
+_engine_getters: List[Callable[[], Optional[Engine]]] = []
+
+
+def _pool_stat(method: str) -> Callable[[], Optional[float]]:
+    def _read() -> Optional[float]:
+        values = []
+        for engine_getter in _engine_getters:
+            engine = engine_getter()
+            reader = getattr(engine.pool, method, None) if engine is not None else None
+            if callable(reader):
+                values.append(float(reader()))
+        return sum(values) if values else None
+
+    return _read
+
+
+def install_pool_gauges(engine_getter: Callable[[], Optional[Engine]]) -> None:
+    """Add the pool of whichever engine ``engine_getter`` returns to the pool gauges.
+
+    The sync and async engines each register a getter; the gauges report the
+    total across every engine that is configured.
+    """
+
+    if engine_getter not in _engine_getters:
+        _engine_getters.append(engine_getter)
+
+
+registry.gauge("intellioptics_db_pool_size", "Configured persistent pool size.", function=_pool_stat("size"))
+registry.gauge(
+    "intellioptics_db_pool_checked_out", "Connections currently checked out.", function=_pool_stat("checkedout")
+)
+registry.gauge(
+    "intellioptics_db_pool_checked_in", "Idle connections held by the pool.", function=_pool_stat("checkedin")
+)
+registry.gauge(
+    "intellioptics_db_pool_overflow",
+    "Connections opened beyond pool_size (negative while the pool is still filling).",
+    function=_pool_stat("overflow"),
+)
+
+__all__ = [
+    "InstrumentedAsyncAdaptedQueuePool",
+    "InstrumentedQueuePool",
+    "install_pool_gauges",
+    "pool_checkout_seconds",
+    "pool_checkout_timeouts",
+]
@@ -3,18 +3,38 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional, Type
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import Pool
 
 from ..config import settings
+from .pool import InstrumentedQueuePool, install_pool_gauges
 
 _engine: Optional[Engine] = None
 _SessionFactory: Optional[sessionmaker[Session]] = None
 
 
+def pool_arguments(database_url: str, poolclass: Type[Pool]) -> Dict[str, Any]:
+    """Return the ``create_engine`` pool keyword arguments derived from settings."""
+
+    url = make_url(database_url)
+    # In-memory SQLite needs its default single-connection pool; everything else
+    # gets a sized, instrumented queue pool.
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
 def configure_engine(database_url: str) -> None:
     """Initialise the global SQLAlchemy engine and session factory."""
 
@@ -22,8 +42,8 @@ def configure_engine(database_url: str) -> None:
         raise RuntimeError("DATABASE_URL is empty; set POSTGRES_URL in the environment")
 
     connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
-
-    engine = create_engine(database_url, future=True, echo=False, connect_args=connect_args)
+    pool_args = pool_arguments(database_url, InstrumentedQueuePool)
+    engine = create_engine(database_url, future=True, echo=False, connect_args=connect_args, **pool_args)
     session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
     global _engine, _SessionFactory
@@ -31,6 +51,13 @@ def configure_engine(database_url: str) -> None:
     _SessionFactory = session_factory
 
 
+def _current_engine() -> Optional[Engine]:
+    return _engine
+
+
+install_pool_gauges(_current_engine)
+
+
 def get_engine() -> Engine:
     """Return the configured SQLAlchemy engine."""
 
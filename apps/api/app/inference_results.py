@@ -0,0 +1,210 @@
+"""Apply batches of inference results to image queries.
+
+Workers publish :class:`~intellioptics.messaging.InferenceResultBatch`
+envelopes to the ``inference-results`` topic. Instead of loading and updating
+one ORM entity per result, :func:`apply_result_batch` writes a whole batch with
+a single ``UPDATE ... FROM (VALUES ...)`` statement per chunk and tells the
+answer hub which rows it touched. The ``VALUES`` list is expressed as a common
+table expression so the same statement runs on PostgreSQL and SQLite.
+:func:`consume_result_batches` feeds the consumer from any
+:class:`~intellioptics.transport.Transport`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, Text, cast, column, update, values
+from sqlalchemy.orm import Session
+
+from intellioptics.messaging import InferenceResultBatch, InferenceResultMessage, MessageDecodeError
+from intellioptics.transport import RESULTS_TOPIC, MessageLockLostError, ReceivedMessage, Transport
+
+from .db import GUID, get_session_factory
+from .metrics import registry
+from .models import ImageQuery
+from .models.enums import ImageQueryAnswer
+from .notifications import AnswerEvent, mark_answered
+
+logger = logging.getLogger(__name__)
+
+# Four bound parameters per row keeps each statement well under SQLite's
+# default limit of 32766 variables.
+RESULT_UPDATE_CHUNK_SIZE = 1000
+
+results_applied = registry.counter(
+    "intellioptics_inference_results_applied_total", "Inference results written to image queries."
+)
+results_unknown = registry.counter(
+    "intellioptics_inference_results_unknown_total", "Inference results whose job matched no image query."
+)
+
+
+@dataclass(frozen=True)
+class ResultBatchOutcome:
+    """How many results of a batch were written and which job ids matched nothing."""
+
+    applied: int
+    unknown_job_ids: Tuple[str, ...] = ()
+
+
+def _image_query_id(job_id: str) -> Optional[uuid.UUID]:
+    prefix = f"{ImageQuery.public_id_prefix}-"
+    if not job_id.startswith(prefix):
+        return None
+    try:
+        return uuid.UUID(job_id[len(prefix) :])
+    except ValueError:
+        return None
+
+
+def _processed_at(result: InferenceResultMessage, now: datetime) -> datetime:
+    if result.processed_at is None:
+        return now
+    return result.processed_at.astimezone(timezone.utc)
+
+
+def _update_statement(rows: Sequence[Tuple[uuid.UUID, str, float, datetime]]):
+    results = (
+        values(
+            column("id", GUID()),
+            column("answer", Text()),
+            column("answer_score", Float()),
+            column("processed_at", ImageQuery.processed_at.type),
+            name="results",
+        )
+        .data(list(rows))
+        .cte("results")
+    )
+    return (
+        update(ImageQuery)
+        .where(ImageQuery.id == results.c.id)
+        .values(
+            answer=cast(results.c.answer, ImageQuery.answer.type),
+            answer_score=results.c.answer_score,
+            processed_at=results.c.processed_at,
+        )
+        .returning(ImageQuery.id, ImageQuery.detector_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def apply_result_batch(session: Session, batch: InferenceResultBatch) -> ResultBatchOutcome:
+    """Write every result in ``batch`` to its image query without committing.
+
+    Job ids are the public image query ids (``iq-<uuid>``). When a batch holds
+    several results for the same job the last one wins. Results whose job id is
+    malformed or matches no image query are reported in the outcome rather than
+    raising, so one stray message does not hold back the rest of the batch.
+    """
+
+    now = datetime.now(tz=timezone.utc)
+    pending: Dict[uuid.UUID, Tuple[str, InferenceResultMessage]] = {}
+    unknown: List[str] = []
+    for result in batch:
+        image_query_id = _image_query_id(result.job_id)
+        if image_query_id is None:
+            unknown.append(result.job_id)
+            continue
+        pending.pop(image_query_id, None)
+        pending[image_query_id] = (result.job_id, result)
+
+    items = list(pending.items())
+    answered: List[AnswerEvent] = []
+    for start in range(0, len(items), RESULT_UPDATE_CHUNK_SIZE):
+        chunk = items[start : start + RESULT_UPDATE_CHUNK_SIZE]
+        rows = [
+            (image_query_id, ImageQueryAnswer(result.answer.value).name, result.score, _processed_at(result, now))
+            for image_query_id, (_, result) in chunk
+        ]
+        detectors = dict(session.execute(_update_statement(rows)).all())
+        for image_query_id, answer_name, score, processed_at in rows:
+            detector_id = detectors.get(image_query_id)
+            if detector_id is None:
+                unknown.append(pending[image_query_id][0])
+                continue
+            answered.append(
+                AnswerEvent(
+                    image_query_id=image_query_id,
+                    detector_id=detector_id,
+                    answer=ImageQueryAnswer[answer_name],
+                    answer_score=score,
+                    processed_at=processed_at,
+                )
+            )
+
+    mark_answered(session, answered)
+    results_applied.inc(len(answered))
+    if unknown:
+        results_unknown.inc(len(unknown))
+    return ResultBatchOutcome(applied=len(answered), unknown_job_ids=tuple(unknown))
+
+
+class ResultBatchConsumer:
+    """Apply each received batch in its own transaction."""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None) -> None:
+        self._session_factory = session_factory
+
+    def handle(self, batch: InferenceResultBatch) -> ResultBatchOutcome:
+        session_factory = self._session_factory or get_session_factory()
+        with session_factory() as session, session.begin():
+            return apply_result_batch(session, batch)
+
+
+async def consume_result_batches(
+    transport: Transport,
+    consumer: Optional[ResultBatchConsumer] = None,
+    *,
+    stop: Optional[asyncio.Event] = None,
+    topic: str = RESULTS_TOPIC,
+    max_messages: int = 16,
+    receive_timeout: float = 1.0,
+) -> None:
+    """Apply result batches from ``topic`` until ``stop`` is set.
+
+    Each message is acknowledged once its transaction commits. Messages that do
+    not decode are dead-lettered straight away; a batch whose write fails is
+    abandoned so the transport redelivers it, and dead-letters it after too
+    many attempts. A delivery whose lock ran out before it was settled is
+    logged and skipped: the transport redelivers it and applying a batch twice
+    is harmless.
+    """
+
+    consumer = consumer or ResultBatchConsumer()
+    stop = stop or asyncio.Event()
+    while not stop.is_set():
+        for message in await transport.receive(topic, max_messages=max_messages, timeout=receive_timeout):
+            try:
+                batch = InferenceResultBatch.from_bytes(message.body)
+            except MessageDecodeError as exc:
+                await _settle(message, transport.dead_letter(message, str(exc)))
+                continue
+            try:
+                await asyncio.to_thread(consumer.handle, batch)
+            except Exception:
+                logger.exception("Failed to apply inference result batch %s", message.sequence_number)
+                await _settle(message, transport.abandon(message))
+            else:
+                await _settle(message, transport.ack(message))
+
+
+async def _settle(message: ReceivedMessage, settlement: Awaitable[None]) -> None:
+    try:
+        await settlement
+    except MessageLockLostError:
+        logger.warning("Lock lost for inference result batch %s; it will be redelivered", message.sequence_number)
+
+
+__all__ = [
+    "RESULT_UPDATE_CHUNK_SIZE",
+    "ResultBatchConsumer",
+    "ResultBatchOutcome",
+    "apply_result_batch",
+    "consume_result_batches",
+]
@@ -0,0 +1,164 @@
+"""Per-request HTTP metrics.
+
+:class:`RequestMetricsMiddleware` records request latency by route template and
+status, requests in flight, how many SQL statements each request executed and
+how long handlers spent turning ORM rows into response schemas. Per-request
+figures accumulate on a :class:`RequestStats` object held in a context variable,
+which the SQL cursor listener and :func:`timed_serialization` update; both are
+no-ops outside an instrumented request, so disabling the middleware leaves only
+a context variable lookup on those paths.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, MutableMapping, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import registry
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+DB_QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+http_request_duration_seconds = registry.histogram(
+    "intellioptics_http_request_duration_seconds",
+    "Time from receiving a request until its response completed.",
+    ["method", "route", "status"],
+)
+http_requests_in_flight = registry.gauge(
+    "intellioptics_http_requests_in_flight",
+    "Requests currently being served.",
+    ["method"],
+)
+http_request_db_queries = registry.histogram(
+    "intellioptics_http_request_db_queries",
+    "SQL statements executed while serving a request.",
+    ["method", "route"],
+    buckets=DB_QUERY_BUCKETS,
+)
+http_serialization_seconds = registry.histogram(
+    "intellioptics_http_serialization_seconds",
+    "Time spent converting ORM rows into response schemas per request.",
+    ["method", "route"],
+)
+
+
+@dataclass
+class RequestStats:
+    """Figures accumulated while a single request is served."""
+
+    db_queries: int = 0
+    serialization_seconds: float = 0.0
+
+
+_current_stats: ContextVar[Optional[RequestStats]] = ContextVar("intellioptics_request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Return the stats of the request being served, if it is instrumented."""
+
+    return _current_stats.get()
+
+
+def timed_serialization(function: F) -> F:
+    """Decorate a serializer so its run time counts towards the request's serialization time."""
+
+    @functools.wraps(function)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats = _current_stats.get()
+        if stats is None:
+            return function(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.serialization_seconds += time.perf_counter() - started
+
+    return _wrapper  # type: ignore[return-value]
+
+
+def _count_query(*_args: Any) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+
+
+def install_query_counter() -> None:
+    """Count SQL statements executed by any engine against the current request."""
+
+    if not event.contains(Engine, "before_cursor_execute", _count_query):
+        event.listen(Engine, "before_cursor_execute", _count_query)
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording latency, concurrency and per-request work for HTTP requests.
+
+    Routes are labelled by their template (``/v1/detectors/{detector_id}``) so
+    label cardinality stays bounded; requests that match no route share the
+    ``<unmatched>`` label. Streaming responses are timed until the stream ends.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+
+        async def _send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec(method=method)
+            _current_stats.reset(token)
+            route = _route_template(scope)
+            http_request_duration_seconds.observe(elapsed, method=method, route=route, status=str(status_code))
+            http_request_db_queries.observe(stats.db_queries, method=method, route=route)
+            http_serialization_seconds.observe(stats.serialization_seconds, method=method, route=route)
+
+
+__all__ = [
+    "RequestMetricsMiddleware",
+    "RequestStats",
+    "current_request_stats",
+    "http_request_db_queries",
+    "http_request_duration_seconds",
+    "http_requests_in_flight",
+    "http_serialization_seconds",
+    "install_query_counter",
+    "timed_serialization",
+]
@@ -1,29 +1,56 @@
 """FastAPI application factory for IntelliOptics."""
 
+from typing import Optional
+
 from fastapi import FastAPI
 
 from .config import settings
-from .db import configure_default_engine
-from .routes import alerts, detectors, health, image_queries, streams
-from .routes import alerts, detectors, health, image_queries
-from .routes import detectors, health, image_queries
-from .routes import detectors, health
-from .routes import health
+from .db import configure_default_async_engine, configure_default_engine, dispose_async_engine, get_engine
+from .instrumentation import RequestMetricsMiddleware, install_query_counter
+from .notifications import start_answer_notifications, stop_answer_notifications
+from . import routes
+from .routes import health, metrics
+
+
+def create_app(*, use_async_db: Optional[bool] = None) -> FastAPI:
+    """Build and configure a FastAPI instance.
 
+    ``use_async_db`` serves the resource routes from the async handlers in
+    ``app.routes.aio`` backed by the async engine; it defaults to the
+    ``ASYNC_DATABASE`` setting.
+    """
 
-def create_app() -> FastAPI:
-    """Build and configure a FastAPI instance."""
+    if use_async_db is None:
+        use_async_db = settings.async_database
+    resources = routes.aio if use_async_db else routes
 
     app = FastAPI(title=settings.app_name, version=settings.app_version)
+    if settings.request_metrics_enabled:
+        install_query_counter()
+        app.add_middleware(RequestMetricsMiddleware)
     app.include_router(health.router)
-    app.include_router(alerts.router)
-    app.include_router(detectors.router)
-    app.include_router(image_queries.router)
-    app.include_router(streams.router)
+    app.include_router(metrics.router)
+    app.include_router(resources.alerts.router)
+    app.include_router(resources.detectors.router)
+    app.include_router(resources.image_queries.router)
+    app.include_router(resources.streams.router)
 
     @app.on_event("startup")
     def _configure_database() -> None:
         configure_default_engine()
+        if use_async_db:
+            configure_default_async_engine()
+        try:
+            engine = get_engine()
+        except RuntimeError:
+            return
+        start_answer_notifications(engine)
+
+    @app.on_event("shutdown")
+    async def _stop_notifications() -> None:
+        stop_answer_notifications()
+        if use_async_db:
+            await dispose_async_engine()
 
     return app
 
@@ -6,22 +6,25 @@ import uuid
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Enum, ForeignKey, Text
+from sqlalchemy import Enum, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .enums import AlertChannel, AlertStatus
-from .mixins import BaseModel
+from .mixins import BaseModel, RowVersionMixin
 
 
-class Alert(BaseModel):
+class Alert(RowVersionMixin, BaseModel):
     """Represents an alert raised by a detector/image query."""
 
     __tablename__ = "alerts"
     public_id_prefix = "alrt"
+    __table_args__ = (Index("ix_alerts_created_at", "created_at"),)
 
-    detector_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("detectors.id", ondelete="CASCADE"), nullable=False)
+    detector_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("detectors.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     image_query_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("image_queries.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("image_queries.id", ondelete="CASCADE"), nullable=False, index=True
     )
     status: Mapped[AlertStatus] = mapped_column(Enum(AlertStatus, name="alert_status"), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
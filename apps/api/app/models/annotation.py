@@ -18,7 +18,7 @@ class Annotation(BaseModel):
     public_id_prefix = "ann"
 
     image_query_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("image_queries.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("image_queries.id", ondelete="CASCADE"), nullable=False, index=True
     )
     annotator_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("users.id"), nullable=True)
     label_json: Mapped[dict] = mapped_column(JSON, nullable=False)
@@ -5,18 +5,19 @@ from __future__ import annotations
 import uuid
 from typing import List
 
-from sqlalchemy import Boolean, Enum, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, Enum, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .enums import DetectorMode
-from .mixins import BaseModel
+from .mixins import BaseModel, RowVersionMixin
 
 
-class Detector(BaseModel):
+class Detector(RowVersionMixin, BaseModel):
     """A configured model that inspects image queries."""
 
     __tablename__ = "detectors"
     public_id_prefix = "det"
+    __table_args__ = (Index("ix_detectors_created_at_id", "created_at", "id"),)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     mode: Mapped[DetectorMode] = mapped_column(Enum(DetectorMode, name="detector_mode"), nullable=False)
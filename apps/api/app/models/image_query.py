@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum, Float, ForeignKey, Text
+from sqlalchemy import Enum, Float, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .enums import ImageQueryAnswer
@@ -19,8 +19,10 @@ class ImageQuery(BaseModel):
     __tablename__ = "image_queries"
     public_id_prefix = "iq"
 
-    detector_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("detectors.id", ondelete="CASCADE"), nullable=False)
-    rtsp_source_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("streams.id"), nullable=True)
+    detector_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("detectors.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    rtsp_source_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("streams.id"), nullable=True, index=True)
     snapshot_url: Mapped[str] = mapped_column(Text, nullable=False)
     answer: Mapped[Optional[ImageQueryAnswer]] = mapped_column(
         Enum(ImageQueryAnswer, name="image_query_answer"), nullable=True
@@ -33,6 +35,17 @@ class ImageQuery(BaseModel):
     alerts: Mapped[list["Alert"]] = relationship(back_populates="image_query")
     annotations: Mapped[list["Annotation"]] = relationship(back_populates="image_query")
 
+    __table_args__ = (
+        # Partial index covering the backlog of queries still waiting for an answer.
+        Index(
+            "ix_image_queries_unanswered",
+            "detector_id",
+            "created_at",
+            postgresql_where=answer.is_(None),
+            sqlite_where=answer.is_(None),
+        ),
+    )
+
     def __repr__(self) -> str:  # pragma: no cover
         return f"ImageQuery(id={self.public_id}, detector_id={self.detector_id})"
 
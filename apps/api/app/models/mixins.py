@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import ClassVar
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Integer, func, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..db import Base, GUID
@@ -35,6 +35,22 @@ class TimestampMixin:
     )
 
 
+class RowVersionMixin:
+    """Mixin adding a counter the database increments on every ``UPDATE``.
+
+    Unlike ``updated_at`` it changes on every write regardless of clock
+    resolution, which makes it suitable for strong HTTP entity tags.
+    """
+
+    row_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default=text("1"),
+        onupdate=literal_column("row_version + 1"),
+    )
+
+
 class BaseModel(Base):
     """Declarative base class including UUID primary key and timestamps."""
 
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import Boolean, JSON, String, Text
+from sqlalchemy import Boolean, Index, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .mixins import BaseModel
+from .mixins import BaseModel, RowVersionMixin
 
 
-class Stream(BaseModel):
+class Stream(RowVersionMixin, BaseModel):
     """Represents an RTSP video stream."""
 
     __tablename__ = "streams"
     public_id_prefix = "str"
+    __table_args__ = (Index("ix_streams_created_at_id", "created_at", "id"),)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     rtsp_url: Mapped[str] = mapped_column(Text, nullable=False)
@@ -0,0 +1,389 @@
+"""In-process notification hub used to wake image query waiters.
+
+Waiters register interest in an image query identifier and park on an
+``asyncio.Event`` instead of re-querying the database, while streaming clients
+subscribe to every answer produced for a detector. Answer writes are picked up
+from SQLAlchemy session events and fanned out to the hub once the transaction
+commits. When the API runs against PostgreSQL the same writes are also
+broadcast with ``NOTIFY`` so every worker process sharing the database is woken,
+not just the one that handled the write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .models import ImageQuery
+from .models.enums import ImageQueryAnswer
+
+logger = logging.getLogger(__name__)
+
+ANSWER_CHANNEL = "image_query_answers"
+_SESSION_INFO_KEY = "answered_image_queries"
+# Tags this process's NOTIFY payloads; its own listener drops them because the
+# after_commit hook has already woken the local hub.
+_PROCESS_ORIGIN = uuid.uuid4().hex
+
+
+@dataclass(frozen=True)
+class AnswerEvent:
+    """An answer written for an image query."""
+
+    image_query_id: uuid.UUID
+    detector_id: uuid.UUID
+    answer: Optional[ImageQueryAnswer] = None
+    answer_score: Optional[float] = None
+    processed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_image_query(cls, image_query: ImageQuery) -> "AnswerEvent":
+        return cls(
+            image_query_id=image_query.id,
+            detector_id=image_query.detector_id,
+            answer=image_query.answer,
+            answer_score=image_query.answer_score,
+            processed_at=image_query.processed_at,
+        )
+
+    def to_payload(self) -> str:
+        """Encode the event for a PostgreSQL ``NOTIFY`` payload."""
+
+        return json.dumps(
+            {
+                "iq": str(self.image_query_id),
+                "det": str(self.detector_id),
+                "answer": self.answer.value if self.answer is not None else None,
+                "score": self.answer_score,
+                "at": self.processed_at.isoformat() if self.processed_at is not None else None,
+                "src": _PROCESS_ORIGIN,
+            }
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "AnswerEvent":
+        data: Dict[str, Any] = json.loads(payload)
+        return cls(
+            image_query_id=uuid.UUID(data["iq"]),
+            detector_id=uuid.UUID(data["det"]),
+            answer=ImageQueryAnswer(data["answer"]) if data.get("answer") else None,
+            answer_score=data.get("score"),
+            processed_at=datetime.fromisoformat(data["at"]) if data.get("at") else None,
+        )
+
+
+def _remote_answer_event(payload: str) -> Optional[AnswerEvent]:
+    """Decode a ``NOTIFY`` payload, or return ``None`` when this process sent it."""
+
+    if json.loads(payload).get("src") == _PROCESS_ORIGIN:
+        return None
+    return AnswerEvent.from_payload(payload)
+
+
+@dataclass(eq=False)
+class AnswerWaiter:
+    """Handle returned by :meth:`AnswerNotificationHub.register`."""
+
+    image_query_id: uuid.UUID
+    loop: asyncio.AbstractEventLoop
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def wait(self, timeout: float) -> bool:
+        """Block until notified or ``timeout`` elapses; return whether notified."""
+
+        if timeout <= 0:
+            return self.event.is_set()
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def reset(self) -> None:
+        self.event.clear()
+
+
+class AnswerSubscription:
+    """Bounded queue of answer events for a single detector.
+
+    Slow consumers lose the oldest buffered events rather than growing the
+    queue without bound; :attr:`dropped` counts how many were discarded.
+    """
+
+    def __init__(self, detector_id: uuid.UUID, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.detector_id = detector_id
+        self.loop = loop
+        self.dropped = 0
+        self._queue: asyncio.Queue[AnswerEvent] = asyncio.Queue(maxsize=maxsize)
+
+    def _offer(self, answer_event: AnswerEvent) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(answer_event)
+
+    async def get(self, timeout: float) -> Optional[AnswerEvent]:
+        """Return the next event, or ``None`` if nothing arrives within ``timeout``."""
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class AnswerNotificationHub:
+    """Thread-safe registry of coroutines waiting for image query answers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: Dict[uuid.UUID, Set[AnswerWaiter]] = {}
+        self._subscriptions: Dict[uuid.UUID, Set[AnswerSubscription]] = {}
+        self.authoritative = False
+
+    def register(self, image_query_id: uuid.UUID) -> AnswerWaiter:
+        """Register a waiter for ``image_query_id`` on the running event loop."""
+
+        waiter = AnswerWaiter(image_query_id=image_query_id, loop=asyncio.get_running_loop())
+        with self._lock:
+            self._waiters.setdefault(image_query_id, set()).add(waiter)
+        return waiter
+
+    def register_many(self, image_query_ids: Iterable[uuid.UUID]) -> List[AnswerWaiter]:
+        """Register waiters for several image queries that share a single event.
+
+        An answer for any of ``image_query_ids`` wakes all of the returned
+        waiters, so callers only need to wait on one of them.
+        """
+
+        loop = asyncio.get_running_loop()
+        shared = asyncio.Event()
+        waiters = [
+            AnswerWaiter(image_query_id=image_query_id, loop=loop, event=shared)
+            for image_query_id in image_query_ids
+        ]
+        with self._lock:
+            for waiter in waiters:
+                self._waiters.setdefault(waiter.image_query_id, set()).add(waiter)
+        return waiters
+
+    def unregister(self, waiter: AnswerWaiter) -> None:
+        with self._lock:
+            waiters = self._waiters.get(waiter.image_query_id)
+            if waiters is None:
+                return
+            waiters.discard(waiter)
+            if not waiters:
+                del self._waiters[waiter.image_query_id]
+
+    def subscribe(self, detector_id: uuid.UUID, *, maxsize: int = 1000) -> AnswerSubscription:
+        """Subscribe to every answer written for ``detector_id``."""
+
+        subscription = AnswerSubscription(detector_id, asyncio.get_running_loop(), maxsize)
+        with self._lock:
+            self._subscriptions.setdefault(detector_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AnswerSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.detector_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.detector_id]
+
+    def notify(self, answer_events: Iterable[AnswerEvent]) -> int:
+        """Wake waiters and feed subscribers interested in ``answer_events``.
+
+        Safe to call from any thread. Returns the number of listeners reached.
+        """
+
+        reached = 0
+        with self._lock:
+            deliveries = [
+                (
+                    answer_event,
+                    list(self._waiters.get(answer_event.image_query_id, ())),
+                    list(self._subscriptions.get(answer_event.detector_id, ())),
+                )
+                for answer_event in answer_events
+            ]
+        for answer_event, waiters, subscriptions in deliveries:
+            for waiter in waiters:
+                try:
+                    waiter.loop.call_soon_threadsafe(waiter.event.set)
+                except RuntimeError:  # pragma: no cover - loop already closed
+                    continue
+                reached += 1
+            for subscription in subscriptions:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription._offer, answer_event)
+                except RuntimeError:  # pragma: no cover - loop already closed
+                    continue
+                reached += 1
+        return reached
+
+    def waiter_count(self) -> int:
+        with self._lock:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+_hub = AnswerNotificationHub()
+
+
+def get_answer_hub() -> AnswerNotificationHub:
+    """Return the process-wide answer notification hub."""
+
+    return _hub
+
+
+def mark_answered(session: Session, answer_events: Iterable[AnswerEvent]) -> None:
+    """Record answered image queries so listeners are notified when ``session`` commits.
+
+    ORM writes are tracked automatically; bulk ``UPDATE`` statements that bypass
+    the unit of work should call this helper with the rows they touched.
+    """
+
+    events = list(answer_events)
+    if not events:
+        return
+    session.info.setdefault(_SESSION_INFO_KEY, []).extend(events)
+    bind = session.get_bind()
+    if bind.dialect.name == "postgresql":
+        connection = session.connection()
+        for answer_event in events:
+            connection.execute(select(func.pg_notify(ANSWER_CHANNEL, answer_event.to_payload())))
+
+
+def _answer_changed(instance: ImageQuery) -> bool:
+    state = inspect(instance)
+    if state.pending:
+        return instance.answer is not None
+    return any(state.attrs[name].history.has_changes() for name in ("answer", "processed_at"))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_answered(session: Session, _flush_context) -> None:
+    answered = [
+        AnswerEvent.from_image_query(instance)
+        for instance in (*session.new, *session.dirty)
+        if isinstance(instance, ImageQuery) and instance.answer is not None and _answer_changed(instance)
+    ]
+    mark_answered(session, answered)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_answered(session: Session) -> None:
+    answered = session.info.pop(_SESSION_INFO_KEY, None)
+    if answered:
+        _hub.notify(answered)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_answered(session: Session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+class PostgresAnswerListener:
+    """Background thread relaying PostgreSQL ``NOTIFY`` payloads into the hub."""
+
+    def __init__(self, engine: Engine, hub: AnswerNotificationHub, *, poll_timeout: float = 1.0) -> None:
+        url = engine.url.set(drivername="postgresql")
+        self._conninfo = url.render_as_string(hide_password=False)
+        self._hub = hub
+        self._poll_timeout = poll_timeout
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="image-query-answer-listener", daemon=True)
+
+    def start(self, *, ready_timeout: float = 5.0) -> bool:
+        """Start listening and return whether the ``LISTEN`` was established."""
+
+        self._thread.start()
+        return self._ready.wait(ready_timeout)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self._poll_timeout * 2)
+
+    def _run(self) -> None:
+        import psycopg
+
+        try:
+            with psycopg.connect(self._conninfo, autocommit=True) as connection:
+                connection.execute(f"LISTEN {ANSWER_CHANNEL}")
+                self._ready.set()
+                while not self._stop.is_set():
+                    answer_events = []
+                    for notification in connection.notifies(timeout=self._poll_timeout):
+                        try:
+                            answer_event = _remote_answer_event(notification.payload)
+                        except (AttributeError, KeyError, ValueError):
+                            logger.warning("Ignoring malformed answer notification %r", notification.payload)
+                            continue
+                        if answer_event is not None:
+                            answer_events.append(answer_event)
+                    if answer_events:
+                        self._hub.notify(answer_events)
+        except Exception:
+            logger.exception("Image query answer listener stopped; waiters fall back to polling")
+        finally:
+            self._hub.authoritative = False
+
+
+_listener: Optional[PostgresAnswerListener] = None
+
+
+def start_answer_notifications(engine: Engine) -> None:
+    """Decide whether the hub sees every answer write for ``engine``.
+
+    SQLite deployments are single-process, so in-process session events cover
+    every write. PostgreSQL deployments additionally start a ``LISTEN`` thread;
+    if that cannot be established waiters fall back to interval polling.
+    """
+
+    global _listener
+    if engine.dialect.name != "postgresql":
+        _hub.authoritative = True
+        return
+    if _listener is not None:
+        return
+    listener = PostgresAnswerListener(engine, _hub)
+    _hub.authoritative = listener.start()
+    _listener = listener
+
+
+def stop_answer_notifications() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    _hub.authoritative = False
+
+
+__all__ = [
+    "ANSWER_CHANNEL",
+    "AnswerEvent",
+    "AnswerNotificationHub",
+    "AnswerSubscription",
+    "AnswerWaiter",
+    "PostgresAnswerListener",
+    "get_answer_hub",
+    "mark_answered",
+    "start_answer_notifications",
+    "stop_answer_notifications",
+]
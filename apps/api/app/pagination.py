@@ -0,0 +1,201 @@
+"""Keyset pagination helpers shared by the list endpoints.
+
+Pages are ordered by ``(created_at DESC, id DESC)``. The cursor handed to the
+client is the public identifier of the last row on the previous page; the next
+page compares against that row's stored ``created_at`` via a scalar subquery so
+the comparison always happens between database-native values.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Type, TypeVar
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Row, Select, and_, or_, select
+from sqlalchemy.orm import Session
+
+from .conditional import collection_etag
+from .models.mixins import BaseModel
+
+if TYPE_CHECKING:  # pragma: no cover - the async stack is optional
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def parse_cursor(model: Type[BaseModel], cursor: str) -> uuid.UUID:
+    """Return the row identifier encoded in ``cursor`` or raise a 400."""
+
+    prefix = f"{model.public_id_prefix}-"
+    try:
+        if not cursor.startswith(prefix):
+            raise ValueError(cursor)
+        return uuid.UUID(cursor[len(prefix) :])
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def keyset_statement(
+    stmt: Select, model: Type[BaseModel], *, limit: int, cursor: Optional[str]
+) -> Tuple[Select, Optional[uuid.UUID]]:
+    """Order and bound ``stmt`` for one page, returning it with the decoded cursor row id.
+
+    One extra row is requested so the caller can tell whether a next page exists.
+    """
+
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+    cursor_id: Optional[uuid.UUID] = None
+    if cursor is not None:
+        cursor_id = parse_cursor(model, cursor)
+        anchor = select(model.created_at).where(model.id == cursor_id).scalar_subquery()
+        stmt = stmt.where(
+            or_(model.created_at < anchor, and_(model.created_at == anchor, model.id < cursor_id))
+        )
+    return stmt.limit(limit + 1), cursor_id
+
+
+def finish_page(rows: Sequence[ModelT], *, limit: int, response: Response) -> Sequence[ModelT]:
+    """Trim the look-ahead row and advertise the next cursor on ``response``."""
+
+    page = rows[:limit]
+    if len(rows) > limit:
+        response.headers[NEXT_CURSOR_HEADER] = page[-1].public_id
+    return page
+
+
+def finish_rows(rows: Sequence[Row], *, limit: int, response: Response) -> Sequence[Row]:
+    """:func:`finish_page` for projected rows whose first column is the public identifier."""
+
+    page = rows[:limit]
+    if len(rows) > limit:
+        response.headers[NEXT_CURSOR_HEADER] = page[-1][0]
+    return page
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset_page(
+    session: Session,
+    stmt: Select,
+    model: Type[ModelT],
+    *,
+    limit: int,
+    cursor: Optional[str],
+    response: Response,
+) -> Sequence[ModelT]:
+    """Execute ``stmt`` for one page and advertise the next cursor on ``response``."""
+
+    stmt, cursor_id = keyset_statement(stmt, model, limit=limit, cursor=cursor)
+    rows = session.scalars(stmt).all()
+    if not rows and cursor_id is not None and session.get(model, cursor_id) is None:
+        raise _invalid_cursor()
+    return finish_page(rows, limit=limit, response=response)
+
+
+async def keyset_page_async(
+    session: "AsyncSession",
+    stmt: Select,
+    model: Type[ModelT],
+    *,
+    limit: int,
+    cursor: Optional[str],
+    response: Response,
+) -> Sequence[ModelT]:
+    """Async counterpart of :func:`keyset_page`."""
+
+    stmt, cursor_id = keyset_statement(stmt, model, limit=limit, cursor=cursor)
+    rows = (await session.scalars(stmt)).all()
+    if not rows and cursor_id is not None and await session.get(model, cursor_id) is None:
+        raise _invalid_cursor()
+    return finish_page(rows, limit=limit, response=response)
+
+
+def keyset_rows(
+    session: Session,
+    stmt: Select,
+    model: Type[BaseModel],
+    *,
+    limit: int,
+    cursor: Optional[str],
+    response: Response,
+) -> Sequence[Row]:
+    """:func:`keyset_page` for a column-projected ``stmt`` led by the public identifier."""
+
+    stmt, cursor_id = keyset_statement(stmt, model, limit=limit, cursor=cursor)
+    rows = session.execute(stmt).all()
+    if not rows and cursor_id is not None and session.get(model, cursor_id) is None:
+        raise _invalid_cursor()
+    return finish_rows(rows, limit=limit, response=response)
+
+
+async def keyset_rows_async(
+    session: "AsyncSession",
+    stmt: Select,
+    model: Type[BaseModel],
+    *,
+    limit: int,
+    cursor: Optional[str],
+    response: Response,
+) -> Sequence[Row]:
+    """Async counterpart of :func:`keyset_rows`."""
+
+    stmt, cursor_id = keyset_statement(stmt, model, limit=limit, cursor=cursor)
+    rows = (await session.execute(stmt)).all()
+    if not rows and cursor_id is not None and await session.get(model, cursor_id) is None:
+        raise _invalid_cursor()
+    return finish_rows(rows, limit=limit, response=response)
+
+
+def _probe_statement(stmt: Select, model: Type[BaseModel], *, limit: int, cursor: Optional[str]) -> Select:
+    narrow = stmt.with_only_columns(model.id, model.row_version)  # type: ignore[attr-defined]
+    return keyset_statement(narrow, model, limit=limit, cursor=cursor)[0]
+
+
+def _probe_result(
+    model: Type[BaseModel], rows: Sequence[Tuple[uuid.UUID, int]], limit: int
+) -> Tuple[str, Optional[str]]:
+    page = rows[:limit]
+    next_cursor = f"{model.public_id_prefix}-{page[-1][0]}" if len(rows) > limit else None
+    return collection_etag(page), next_cursor
+
+
+def keyset_probe(
+    session: Session, stmt: Select, model: Type[BaseModel], *, limit: int, cursor: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """Return the entity tag and next cursor of a page by reading only ``(id, row_version)``."""
+
+    rows = session.execute(_probe_statement(stmt, model, limit=limit, cursor=cursor)).all()
+    return _probe_result(model, rows, limit)
+
+
+async def keyset_probe_async(
+    session: "AsyncSession", stmt: Select, model: Type[BaseModel], *, limit: int, cursor: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """Async counterpart of :func:`keyset_probe`."""
+
+    result = await session.execute(_probe_statement(stmt, model, limit=limit, cursor=cursor))
+    return _probe_result(model, result.all(), limit)
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "NEXT_CURSOR_HEADER",
+    "finish_page",
+    "finish_rows",
+    "keyset_page",
+    "keyset_page_async",
+    "keyset_probe",
+    "keyset_probe_async",
+    "keyset_rows",
+    "keyset_rows_async",
+    "keyset_statement",
+    "parse_cursor",
+]
@@ -0,0 +1,219 @@
+"""Bounded LRU + TTL cache of detector and stream reference data.
+
+The image query submission path only needs to know that the referenced
+detector and stream exist, and those rows change rarely compared to how often
+they are referenced. Lookups go
+through :class:`ReferenceCache`, which answers from memory while an entry is
+fresh and loads every miss for a request with a single ``IN`` query.
+
+Only rows that exist are cached, so a detector created after a failed lookup
+is found straight away. Stream entries are dropped when the API updates the
+row (see ``update_stream``); writes made by other processes are picked up
+once the entry expires, so ``REFERENCE_CACHE_TTL_SECONDS`` bounds how
+stale a cached reference can be. A TTL of ``0`` disables caching.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Iterable, Optional, Set, Tuple, Type, TypeVar
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .metrics import registry
+from .models import Detector, Stream
+from .models.mixins import BaseModel
+
+if TYPE_CHECKING:  # pragma: no cover - the async stack is optional
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+K = TypeVar("K")
+V = TypeVar("V")
+R = TypeVar("R")
+
+cache_hits = registry.counter(
+    "intellioptics_reference_cache_hits_total", "Reference lookups answered from memory.", ["cache"]
+)
+cache_misses = registry.counter(
+    "intellioptics_reference_cache_misses_total", "Reference lookups that had to query the database.", ["cache"]
+)
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe mapping that evicts least recently used entries and expires them after ``ttl`` seconds."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the fresh value for ``key`` and count the hit or miss."""
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                value: Optional[V] = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                value = None
+        if value is None:
+            cache_misses.inc(cache=self.name)
+        else:
+            cache_hits.inc(cache=self.name)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+        expires = self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and entry[0] > self._clock()
+
+
+@dataclass(frozen=True)
+class DetectorReference:
+    """A detector that image queries may reference."""
+
+    id: uuid.UUID
+
+    @classmethod
+    def from_model(cls, detector: Detector) -> "DetectorReference":
+        return cls(id=detector.id)
+
+
+@dataclass(frozen=True)
+class StreamReference:
+    """Stream configuration needed when accepting image queries."""
+
+    id: uuid.UUID
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, stream: Stream) -> "StreamReference":
+        return cls(id=stream.id, is_active=stream.is_active)
+
+
+class ReferenceCache(TTLCache[uuid.UUID, R]):
+    """:class:`TTLCache` of ``model`` rows keyed by primary key, with batched database fallback."""
+
+    def __init__(
+        self,
+        name: str,
+        model: Type[BaseModel],
+        factory: Callable[[BaseModel], R],
+        *,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(name, maxsize=maxsize, ttl=ttl, clock=clock)
+        self.model = model
+        self.factory = factory
+
+    def _partition(self, ids: Iterable[uuid.UUID]) -> Tuple[Dict[uuid.UUID, R], Set[uuid.UUID]]:
+        found: Dict[uuid.UUID, R] = {}
+        missing: Set[uuid.UUID] = set()
+        for identifier in set(ids):
+            value = self.get(identifier)
+            if value is None:
+                missing.add(identifier)
+            else:
+                found[identifier] = value
+        return found, missing
+
+    def _statement(self, missing: Set[uuid.UUID]) -> Select:
+        return select(self.model).where(self.model.id.in_(missing))
+
+    def _store(self, found: Dict[uuid.UUID, R], rows: Iterable[BaseModel]) -> Dict[uuid.UUID, R]:
+        for row in rows:
+            reference = self.factory(row)
+            self.set(row.id, reference)
+            found[row.id] = reference
+        return found
+
+    def resolve(self, session: Session, ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, R]:
+        """Return references for every id in ``ids`` that exists; unknown ids are omitted."""
+
+        found, missing = self._partition(ids)
+        if not missing:
+            return found
+        return self._store(found, session.scalars(self._statement(missing)))
+
+    async def resolve_async(self, session: "AsyncSession", ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, R]:
+        """Async counterpart of :meth:`resolve`."""
+
+        found, missing = self._partition(ids)
+        if not missing:
+            return found
+        return self._store(found, await session.scalars(self._statement(missing)))
+
+
+detector_references: ReferenceCache[DetectorReference] = ReferenceCache(
+    "detectors",
+    Detector,
+    DetectorReference.from_model,  # type: ignore[arg-type]
+    maxsize=settings.reference_cache_max_entries,
+    ttl=settings.reference_cache_ttl_seconds,
+)
+stream_references: ReferenceCache[StreamReference] = ReferenceCache(
+    "streams",
+    Stream,
+    StreamReference.from_model,  # type: ignore[arg-type]
+    maxsize=settings.reference_cache_max_entries,
+    ttl=settings.reference_cache_ttl_seconds,
+)
+
+__all__ = [
+    "DetectorReference",
+    "ReferenceCache",
+    "StreamReference",
+    "TTLCache",
+    "cache_hits",
+    "cache_misses",
+    "detector_references",
+    "stream_references",
+]
@@ -1,17 +1,5 @@
 """API route registrations."""
 
-from . import alerts, detectors, health, image_queries, streams
+from . import aio, alerts, detectors, health, image_queries, metrics, streams
 
-__all__ = ["alerts", "detectors", "health", "image_queries", "streams"]
-from . import alerts, detectors, health, image_queries
-
-__all__ = ["alerts", "detectors", "health", "image_queries"]
-from . import detectors, health, image_queries
-
-__all__ = ["detectors", "health", "image_queries"]
-from . import detectors, health
-
-__all__ = ["detectors", "health"]
-from . import health
-
-__all__ = ["health"]
+__all__ = ["aio", "alerts", "detectors", "health", "image_queries", "metrics", "streams"]
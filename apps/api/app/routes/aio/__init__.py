@@ -0,0 +1,11 @@
+"""Async route handlers backed by :func:`~apps.api.app.db.get_async_session`.
+
+Each module serves the same paths and payloads as its counterpart in
+``app.routes`` and reuses its parsing and serialization helpers; only the data
+access is awaited instead of running on the threadpool. ``create_app`` mounts
+these routers instead of the sync ones when the async database is enabled.
+"""
+
+from . import alerts, detectors, image_queries, streams
+
+__all__ = ["alerts", "detectors", "image_queries", "streams"]
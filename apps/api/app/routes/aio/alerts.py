@@ -0,0 +1,56 @@
+"""Async read-only alert endpoints."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...conditional import probe_resource_async, set_resource_etag
+from ...config import settings
+from ...db import get_async_session
+from ...models import Alert
+from ...projections import projected_response
+from ...schemas import AlertRead
+from ..alerts import _ALERT_PROJECTION, _parse_alert_public_id, _recent_alerts_statement, _serialize_alert
+
+router = APIRouter(prefix="/v1/alerts", tags=["alerts"])
+
+
+@router.get("/events/recent", response_model=List[AlertRead])
+async def recent_alerts(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_async_session),
+) -> Union[List[AlertRead], Response]:
+    """Return the most recent alerts limited by the provided size."""
+
+    if settings.fast_list_serialization:
+        rows = (await session.execute(_ALERT_PROJECTION.statement(_recent_alerts_statement(limit)))).all()
+        return projected_response(_ALERT_PROJECTION, rows, response)
+    alerts = (await session.scalars(_recent_alerts_statement(limit))).all()
+    return [_serialize_alert(alert) for alert in alerts]
+
+
+@router.get("/{alert_id}", response_model=AlertRead)
+async def get_alert(
+    alert_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> Union[AlertRead, Response]:
+    """Return a single alert by its public identifier, honouring ``If-None-Match``."""
+
+    internal_id = _parse_alert_public_id(alert_id)
+    unchanged = await probe_resource_async(session, Alert, internal_id, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    alert = await session.get(Alert, internal_id)
+    if alert is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found")
+    set_resource_etag(response, alert)
+    return _serialize_alert(alert)
+
+
+__all__ = ["router"]
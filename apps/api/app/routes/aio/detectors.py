@@ -0,0 +1,171 @@
+"""Async REST endpoints for managing detectors."""
+
+from __future__ import annotations
+
+import uuid
+from typing import List, Optional, Union
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketException,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...conditional import (
+    ETAG_HEADER,
+    collection_etag,
+    etag_matches,
+    not_modified,
+    probe_resource_async,
+    set_resource_etag,
+)
+from ...config import settings
+from ...db import get_async_session
+from ...models import Detector, User
+from ...models.enums import DetectorMode
+from ...notifications import get_answer_hub
+from ...pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    keyset_page_async,
+    keyset_probe_async,
+    keyset_rows_async,
+)
+from ...projections import projected_response
+from ...schemas import DetectorCreate, DetectorRead
+from ..detectors import (
+    _DETECTOR_PROJECTION,
+    _list_detectors_statement,
+    _parse_detector_public_id,
+    _push_answer_events,
+    _serialize_detector,
+    _sse_answer_events,
+)
+
+router = APIRouter(prefix="/v1/detectors", tags=["detectors"])
+
+
+async def _ensure_detector_exists(internal_id: uuid.UUID, session: AsyncSession) -> None:
+    try:
+        found = await session.scalar(select(Detector.id).where(Detector.id == internal_id))
+    finally:
+        await session.close()
+    if found is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Detector not found")
+
+
+@router.get("", response_model=List[DetectorRead])
+async def list_detectors(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    is_active: Optional[bool] = None,
+    mode: Optional[DetectorMode] = None,
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=255),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> Union[List[DetectorRead], Response]:
+    """Return one page of detectors ordered by creation time descending."""
+
+    stmt = _list_detectors_statement(is_active, mode, name_prefix)
+    if if_none_match:
+        etag, next_cursor = await keyset_probe_async(session, stmt, Detector, limit=limit, cursor=cursor)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None)
+    if settings.fast_list_serialization:
+        rows = await keyset_rows_async(
+            session, _DETECTOR_PROJECTION.statement(stmt), Detector, limit=limit, cursor=cursor, response=response
+        )
+        response.headers[ETAG_HEADER] = collection_etag((row[-2], row[-1]) for row in rows)
+        return projected_response(_DETECTOR_PROJECTION, rows, response)
+    detectors = await keyset_page_async(session, stmt, Detector, limit=limit, cursor=cursor, response=response)
+    response.headers[ETAG_HEADER] = collection_etag((detector.id, detector.row_version) for detector in detectors)
+    return [_serialize_detector(detector) for detector in detectors]
+
+
+@router.get("/{detector_id}", response_model=DetectorRead)
+async def get_detector(
+    detector_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> Union[DetectorRead, Response]:
+    """Return a single detector by its public identifier, honouring ``If-None-Match``."""
+
+    internal_id = _parse_detector_public_id(detector_id)
+    unchanged = await probe_resource_async(session, Detector, internal_id, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    detector = await session.get(Detector, internal_id)
+    if detector is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Detector not found")
+    set_resource_etag(response, detector)
+    return _serialize_detector(detector)
+
+
+@router.post("", response_model=DetectorRead, status_code=status.HTTP_201_CREATED)
+async def create_detector(
+    payload: DetectorCreate, session: AsyncSession = Depends(get_async_session)
+) -> DetectorRead:
+    """Create a new detector owned by the provided user."""
+
+    try:
+        creator_uuid = payload.creator_uuid()
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+    creator = await session.get(User, creator_uuid)
+    if creator is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Creator not found")
+
+    detector = Detector(
+        name=payload.name,
+        mode=payload.mode,
+        query=payload.query,
+        confidence_threshold=payload.confidence_threshold,
+        is_active=payload.is_active,
+        creator=creator,
+    )
+    session.add(detector)
+    await session.commit()
+    await session.refresh(detector)
+    return _serialize_detector(detector)
+
+
+@router.get("/{detector_id}/answers/stream")
+async def stream_detector_answers(
+    detector_id: str, session: AsyncSession = Depends(get_async_session)
+) -> StreamingResponse:
+    """Stream every answer produced for a detector as server-sent events."""
+
+    internal_id = _parse_detector_public_id(detector_id)
+    await _ensure_detector_exists(internal_id, session)
+    return StreamingResponse(
+        _sse_answer_events(get_answer_hub(), internal_id, settings.answer_stream_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{detector_id}/answers/stream")
+async def stream_detector_answers_ws(
+    websocket: WebSocket, detector_id: str, session: AsyncSession = Depends(get_async_session)
+) -> None:
+    """Push every answer produced for a detector as JSON WebSocket messages."""
+
+    try:
+        internal_id = _parse_detector_public_id(detector_id)
+        await _ensure_detector_exists(internal_id, session)
+    except HTTPException as exc:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail)) from exc
+    await _push_answer_events(websocket, get_answer_hub(), internal_id, settings.answer_stream_heartbeat_seconds)
@@ -0,0 +1,162 @@
+"""Async REST endpoints for managing image queries."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...db import get_async_session
+from ...models import ImageQuery
+from ...reference_cache import detector_references, stream_references
+from ...schemas import (
+    ImageQueryBatchCreate,
+    ImageQueryBatchResponse,
+    ImageQueryCreate,
+    ImageQueryRead,
+    ImageQueryWaitManyRequest,
+    ImageQueryWaitManyResponse,
+    ImageQueryWaitResponse,
+)
+from ..image_queries import (
+    _answered_results,
+    _batch_response,
+    _batch_rows,
+    _image_queries_statement,
+    _parse_image_query_ids,
+    _parse_public_identifier,
+    _serialize_image_query,
+    _wait_many_on_hub,
+    _wait_on_hub,
+)
+
+router = APIRouter(prefix="/v1/image-queries", tags=["image-queries"])
+
+
+async def _get_image_query_or_404(image_query_id: str, session: AsyncSession) -> ImageQuery:
+    internal_id = _parse_public_identifier(image_query_id, "iq-", "Image query not found")
+    instance = await session.get(ImageQuery, internal_id, populate_existing=True)
+    if instance is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image query not found")
+    return instance
+
+
+@router.post("", response_model=ImageQueryRead, status_code=status.HTTP_201_CREATED)
+async def create_image_query(
+    payload: ImageQueryCreate, session: AsyncSession = Depends(get_async_session)
+) -> ImageQueryRead:
+    """Create a new image query associated with a detector and optional stream."""
+
+    try:
+        detector_uuid = payload.detector_uuid()
+        stream_uuid = payload.stream_uuid()
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+    if detector_uuid not in await detector_references.resolve_async(session, {detector_uuid}):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Detector not found")
+    if stream_uuid is not None and stream_uuid not in await stream_references.resolve_async(
+        session, {stream_uuid}
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Stream not found")
+
+    image_query = ImageQuery(
+        detector_id=detector_uuid,
+        rtsp_source_id=stream_uuid,
+        snapshot_url=str(payload.snapshot_url),
+    )
+    session.add(image_query)
+    await session.commit()
+    await session.refresh(image_query)
+    return _serialize_image_query(image_query)
+
+
+@router.post(":batch", response_model=ImageQueryBatchResponse, status_code=status.HTTP_201_CREATED)
+async def create_image_queries_batch(
+    payload: ImageQueryBatchCreate, session: AsyncSession = Depends(get_async_session)
+) -> ImageQueryBatchResponse:
+    """Create many image queries with one reference lookup per table and a single commit."""
+
+    rows = _batch_rows(payload)
+    detector_ids = {row["detector_id"] for row in rows}
+    if (await detector_references.resolve_async(session, detector_ids)).keys() != detector_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Detector not found")
+
+    stream_ids = {row["rtsp_source_id"] for row in rows if row["rtsp_source_id"] is not None}
+    if stream_ids and (await stream_references.resolve_async(session, stream_ids)).keys() != stream_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Stream not found")
+
+    await session.execute(insert(ImageQuery), rows)
+    await session.commit()
+    return _batch_response(rows)
+
+
+async def _load_answered(internal_ids: List[uuid.UUID], session: AsyncSession) -> Dict[uuid.UUID, ImageQueryRead]:
+    """Read ``internal_ids`` with one ``IN`` query, releasing the connection afterwards."""
+
+    try:
+        rows = (await session.scalars(_image_queries_statement(internal_ids))).all()
+        return _answered_results(internal_ids, rows)
+    finally:
+        await session.close()
+
+
+@router.post(":wait", response_model=ImageQueryWaitManyResponse)
+async def wait_for_image_queries(
+    payload: ImageQueryWaitManyRequest,
+    session: AsyncSession = Depends(get_async_session),
+    timeout: float | None = None,
+    poll: float | None = None,
+) -> ImageQueryWaitManyResponse:
+    """Wait until any or all of several image queries are answered."""
+
+    return await _wait_many_on_hub(
+        _parse_image_query_ids(payload.ids),
+        payload.mode,
+        lambda pending: _load_answered(pending, session),
+        timeout=timeout,
+        poll=poll,
+    )
+
+
+@router.get("/{image_query_id}", response_model=ImageQueryRead)
+async def read_image_query(
+    image_query_id: str, session: AsyncSession = Depends(get_async_session)
+) -> ImageQueryRead:
+    """Return a single image query record."""
+
+    image_query = await _get_image_query_or_404(image_query_id, session)
+    return _serialize_image_query(image_query)
+
+
+async def _load_completed_result(image_query_id: str, session: AsyncSession) -> Optional[ImageQueryRead]:
+    """Return the serialized image query if answered, releasing the connection either way."""
+
+    try:
+        image_query = await _get_image_query_or_404(image_query_id, session)
+        if image_query.answer is None or image_query.processed_at is None:
+            return None
+        return _serialize_image_query(image_query)
+    finally:
+        await session.close()
+
+
+@router.get("/{image_query_id}/wait", response_model=ImageQueryWaitResponse)
+async def wait_for_image_query(
+    image_query_id: str,
+    session: AsyncSession = Depends(get_async_session),
+    timeout: float | None = None,
+    poll: float | None = None,
+) -> ImageQueryWaitResponse:
+    """Wait for completion of an image query returning when an answer is available."""
+
+    internal_id = _parse_public_identifier(image_query_id, "iq-", "Image query not found")
+    return await _wait_on_hub(
+        internal_id,
+        lambda: _load_completed_result(image_query_id, session),
+        timeout=timeout,
+        poll=poll,
+    )
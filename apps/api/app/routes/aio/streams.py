@@ -0,0 +1,99 @@
+"""Async REST endpoints for managing video streams."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...conditional import probe_resource_async, set_resource_etag
+from ...config import settings
+from ...db import get_async_session
+from ...models import Stream
+from ...pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page_async, keyset_rows_async
+from ...projections import projected_response
+from ...reference_cache import stream_references
+from ...schemas import StreamCreate, StreamRead, StreamUpdate
+from ..streams import _STREAM_PROJECTION, _list_streams_statement, _parse_stream_public_id, _serialize_stream
+
+router = APIRouter(prefix="/v1/streams", tags=["streams"])
+
+
+@router.get("", response_model=List[StreamRead])
+async def list_streams(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    is_active: Optional[bool] = None,
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=255),
+    session: AsyncSession = Depends(get_async_session),
+) -> Union[List[StreamRead], Response]:
+    """Return one page of streams ordered by creation time descending."""
+
+    stmt = _list_streams_statement(is_active, name_prefix)
+    if settings.fast_list_serialization:
+        rows = await keyset_rows_async(
+            session, _STREAM_PROJECTION.statement(stmt), Stream, limit=limit, cursor=cursor, response=response
+        )
+        return projected_response(_STREAM_PROJECTION, rows, response)
+    streams = await keyset_page_async(session, stmt, Stream, limit=limit, cursor=cursor, response=response)
+    return [_serialize_stream(stream) for stream in streams]
+
+
+@router.get("/{stream_id}", response_model=StreamRead)
+async def get_stream(
+    stream_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> Union[StreamRead, Response]:
+    """Return a single stream by its public identifier, honouring ``If-None-Match``."""
+
+    internal_id = _parse_stream_public_id(stream_id)
+    unchanged = await probe_resource_async(session, Stream, internal_id, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    stream = await session.get(Stream, internal_id)
+    if stream is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stream not found")
+    set_resource_etag(response, stream)
+    return _serialize_stream(stream)
+
+
+@router.post("", response_model=StreamRead, status_code=status.HTTP_201_CREATED)
+async def create_stream(payload: StreamCreate, session: AsyncSession = Depends(get_async_session)) -> StreamRead:
+    """Create a new stream configuration."""
+
+    stream = Stream(
+        name=payload.name,
+        rtsp_url=payload.rtsp_url,
+        zone_masks=payload.zone_masks,
+        is_active=payload.is_active,
+    )
+    session.add(stream)
+    await session.commit()
+    await session.refresh(stream)
+    return _serialize_stream(stream)
+
+
+@router.patch("/{stream_id}", response_model=StreamRead)
+async def update_stream(
+    stream_id: str, payload: StreamUpdate, session: AsyncSession = Depends(get_async_session)
+) -> StreamRead:
+    """Partially update a stream with the provided fields."""
+
+    internal_id = _parse_stream_public_id(stream_id)
+    stream = await session.get(Stream, internal_id)
+    if stream is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stream not found")
+
+    updates = payload.model_dump(exclude_unset=True)
+    for field, value in updates.items():
+        setattr(stream, field, value)
+
+    session.add(stream)
+    await session.commit()
+    await session.refresh(stream)
+    stream_references.invalidate(stream.id)
+    return _serialize_stream(stream)
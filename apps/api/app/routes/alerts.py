@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import uuid
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
 
+from ..conditional import probe_resource, set_resource_etag
+from ..config import settings
 from ..db import get_session
-from ..models import Alert
+from ..instrumentation import timed_serialization
+from ..models import Alert, Detector, ImageQuery
+from ..projections import Projection, projected_response, public_id
 from ..schemas import AlertRead
 
 router = APIRouter(prefix="/v1/alerts", tags=["alerts"])
@@ -27,15 +31,15 @@ def _parse_alert_public_id(alert_id: str) -> uuid.UUID:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found") from exc
 
 
+@timed_serialization
 def _serialize_alert(alert: Alert) -> AlertRead:
-    detector = alert.detector
-    image_query = alert.image_query
-    if detector is None or image_query is None:
+    # Public ids are derived from the foreign keys so serialization never loads relationships.
+    if alert.detector_id is None or alert.image_query_id is None:
         raise RuntimeError("Alert is missing required relationships")
     return AlertRead(
         id=alert.public_id,
-        detector_id=detector.public_id,
-        image_query_id=image_query.public_id,
+        detector_id=f"{Detector.public_id_prefix}-{alert.detector_id}",
+        image_query_id=f"{ImageQuery.public_id_prefix}-{alert.image_query_id}",
         status=alert.status,
         message=alert.message,
         channel=alert.channel,
@@ -45,36 +49,59 @@ def _serialize_alert(alert: Alert) -> AlertRead:
     )
 
 
+_ALERT_PROJECTION = Projection(
+    {
+        "id": public_id(Alert.id, Alert.public_id_prefix),
+        "detector_id": public_id(Alert.detector_id, Detector.public_id_prefix),
+        "image_query_id": public_id(Alert.image_query_id, ImageQuery.public_id_prefix),
+        "status": Alert.status,
+        "message": Alert.message,
+        "channel": Alert.channel,
+        "created_at": Alert.created_at,
+        "updated_at": Alert.updated_at,
+        "resolved_at": Alert.resolved_at,
+    }
+)
+
+
+def _recent_alerts_statement(limit: int) -> Select:
+    return select(Alert).order_by(Alert.created_at.desc()).limit(limit)
+
+
 @router.get("/events/recent", response_model=List[AlertRead])
 def recent_alerts(
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     session: Session = Depends(get_session),
-) -> List[AlertRead]:
+) -> Union[List[AlertRead], Response]:
     """Return the most recent alerts limited by the provided size."""
 
-    stmt = (
-        select(Alert)
-        .options(selectinload(Alert.detector), selectinload(Alert.image_query))
-        .order_by(Alert.created_at.desc())
-        .limit(limit)
-    )
+    stmt = _recent_alerts_statement(limit)
+    if settings.fast_list_serialization:
+        rows = session.execute(_ALERT_PROJECTION.statement(stmt)).all()
+        return projected_response(_ALERT_PROJECTION, rows, response)
     alerts = session.scalars(stmt).all()
     return [_serialize_alert(alert) for alert in alerts]
 
 
 @router.get("/{alert_id}", response_model=AlertRead)
-def get_alert(alert_id: str, session: Session = Depends(get_session)) -> AlertRead:
-    """Return a single alert by its public identifier."""
+def get_alert(
+    alert_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: Session = Depends(get_session),
+) -> Union[AlertRead, Response]:
+    """Return a single alert by its public identifier, honouring ``If-None-Match``."""
 
     internal_id = _parse_alert_public_id(alert_id)
-    stmt = (
-        select(Alert)
-        .options(selectinload(Alert.detector), selectinload(Alert.image_query))
-        .where(Alert.id == internal_id)
-    )
+    unchanged = probe_resource(session, Alert, internal_id, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    stmt = select(Alert).where(Alert.id == internal_id)
     alert = session.scalars(stmt).first()
     if alert is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found")
+    set_resource_etag(response, alert)
     return _serialize_alert(alert)
 
 
@@ -2,16 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
-from typing import List
+from typing import AsyncIterator, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    WebSocketException,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
+from ..conditional import (
+    ETAG_HEADER,
+    collection_etag,
+    etag_matches,
+    not_modified,
+    probe_resource,
+    set_resource_etag,
+)
+from ..config import settings
 from ..db import get_session
-from ..models import Detector, User
-from ..schemas import DetectorCreate, DetectorRead
+from ..instrumentation import timed_serialization
+from ..models import Detector, ImageQuery, User
+from ..models.enums import DetectorMode
+from ..notifications import AnswerEvent, AnswerNotificationHub, get_answer_hub
+from ..pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    keyset_page,
+    keyset_probe,
+    keyset_rows,
+)
+from ..projections import Projection, projected_response, public_id
+from ..schemas import DetectorCreate, DetectorRead, ImageQueryAnswerEvent
 
 router = APIRouter(prefix="/v1/detectors", tags=["detectors"])
 
@@ -27,11 +62,12 @@ def _parse_detector_public_id(detector_id: str) -> uuid.UUID:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Detector not found") from exc
 
 
+@timed_serialization
 def _serialize_detector(detector: Detector) -> DetectorRead:
-    creator = detector.creator
-    created_by = creator.public_id if creator else None
-    if created_by is None:
+    # Derive the creator id from the foreign key so list pages do not lazy-load users.
+    if detector.created_by_id is None:
         raise RuntimeError("Detector is missing a creator relationship")
+    created_by = f"{User.public_id_prefix}-{detector.created_by_id}"
     return DetectorRead(
         id=detector.public_id,
         name=detector.name,
@@ -45,24 +81,88 @@ def _serialize_detector(detector: Detector) -> DetectorRead:
     )
 
 
+_DETECTOR_PROJECTION = Projection(
+    {
+        "id": public_id(Detector.id, Detector.public_id_prefix),
+        "name": Detector.name,
+        "mode": Detector.mode,
+        "query": Detector.query,
+        "confidence_threshold": Detector.confidence_threshold,
+        "is_active": Detector.is_active,
+        "created_by": public_id(Detector.created_by_id, User.public_id_prefix),
+        "created_at": Detector.created_at,
+        "updated_at": Detector.updated_at,
+    },
+    extra=(Detector.id, Detector.row_version),
+)
+
+
+def _list_detectors_statement(
+    is_active: Optional[bool], mode: Optional[DetectorMode], name_prefix: Optional[str]
+) -> Select:
+    stmt = select(Detector)
+    if is_active is not None:
+        stmt = stmt.where(Detector.is_active == is_active)
+    if mode is not None:
+        stmt = stmt.where(Detector.mode == mode)
+    if name_prefix is not None:
+        stmt = stmt.where(Detector.name.startswith(name_prefix, autoescape=True))
+    return stmt
+
+
 @router.get("", response_model=List[DetectorRead])
-def list_detectors(session: Session = Depends(get_session)) -> List[DetectorRead]:
-    """Return all detectors ordered by creation time descending."""
+def list_detectors(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    is_active: Optional[bool] = None,
+    mode: Optional[DetectorMode] = None,
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=255),
+    if_none_match: Optional[str] = Header(None),
+    session: Session = Depends(get_session),
+) -> Union[List[DetectorRead], Response]:
+    """Return one page of detectors ordered by creation time descending.
 
-    stmt = select(Detector).order_by(Detector.created_at.desc())
-    detectors = session.scalars(stmt).all()
+    When more rows are available the ``X-Next-Cursor`` response header carries
+    the cursor for the following page. The page's ``ETag`` covers the id and
+    row version of every detector on it; a matching ``If-None-Match`` is
+    answered with ``304`` after reading only those two columns.
+    """
+
+    stmt = _list_detectors_statement(is_active, mode, name_prefix)
+    if if_none_match:
+        etag, next_cursor = keyset_probe(session, stmt, Detector, limit=limit, cursor=cursor)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None)
+    if settings.fast_list_serialization:
+        rows = keyset_rows(
+            session, _DETECTOR_PROJECTION.statement(stmt), Detector, limit=limit, cursor=cursor, response=response
+        )
+        response.headers[ETAG_HEADER] = collection_etag((row[-2], row[-1]) for row in rows)
+        return projected_response(_DETECTOR_PROJECTION, rows, response)
+    detectors = keyset_page(session, stmt, Detector, limit=limit, cursor=cursor, response=response)
+    response.headers[ETAG_HEADER] = collection_etag((detector.id, detector.row_version) for detector in detectors)
     return [_serialize_detector(detector) for detector in detectors]
 
 
 @router.get("/{detector_id}", response_model=DetectorRead)
-def get_detector(detector_id: str, session: Session = Depends(get_session)) -> DetectorRead:
-    """Return a single detector by its public identifier."""
+def get_detector(
+    detector_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: Session = Depends(get_session),
+) -> Union[DetectorRead, Response]:
+    """Return a single detector by its public identifier, honouring ``If-None-Match``."""
 
     internal_id = _parse_detector_public_id(detector_id)
+    unchanged = probe_resource(session, Detector, internal_id, if_none_match)
+    if unchanged is not None:
+        return unchanged
     stmt = select(Detector).where(Detector.id == internal_id)
     detector = session.scalars(stmt).first()
     if detector is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Detector not found")
+    set_resource_etag(response, detector)
     return _serialize_detector(detector)
 
 
@@ -92,3 +192,110 @@ def create_detector(payload: DetectorCreate, session: Session = Depends(get_sess
     session.commit()
     session.refresh(detector)
     return _serialize_detector(detector)
+
+
+@timed_serialization
+def _serialize_answer_event(answer_event: AnswerEvent) -> ImageQueryAnswerEvent:
+    return ImageQueryAnswerEvent(
+        id=f"{ImageQuery.public_id_prefix}-{answer_event.image_query_id}",
+        detector_id=f"{Detector.public_id_prefix}-{answer_event.detector_id}",
+        answer=answer_event.answer,
+        answer_score=answer_event.answer_score,
+        processed_at=answer_event.processed_at,
+    )
+
+
+def _ensure_detector_exists(internal_id: uuid.UUID, session: Session) -> None:
+    try:
+        found = session.scalar(select(Detector.id).where(Detector.id == internal_id))
+    finally:
+        session.close()
+    if found is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Detector not found")
+
+
+async def _sse_answer_events(
+    hub: AnswerNotificationHub, detector_uuid: uuid.UUID, heartbeat: float
+) -> AsyncIterator[str]:
+    """Yield server-sent events for each answer, with comment heartbeats while idle."""
+
+    subscription = hub.subscribe(detector_uuid)
+    try:
+        yield ": connected\n\n"
+        while True:
+            answer_event = await subscription.get(heartbeat)
+            if answer_event is None:
+                yield ": keep-alive\n\n"
+                continue
+            payload = _serialize_answer_event(answer_event)
+            yield f"event: answer\nid: {payload.id}\ndata: {payload.model_dump_json()}\n\n"
+    finally:
+        hub.unsubscribe(subscription)
+
+
+async def _push_answer_events(
+    websocket: WebSocket, hub: AnswerNotificationHub, detector_uuid: uuid.UUID, heartbeat: float
+) -> None:
+    """Send each answer as a JSON message, with heartbeats while idle, until the client goes away.
+
+    The socket is read alongside the send loop so a disconnect ends the
+    subscription straight away instead of on the next heartbeat.
+    """
+
+    async def send_events() -> None:
+        while True:
+            answer_event = await subscription.get(heartbeat)
+            if answer_event is None:
+                await websocket.send_json({"event": "heartbeat"})
+                continue
+            payload = _serialize_answer_event(answer_event)
+            await websocket.send_json({"event": "answer", "data": payload.model_dump(mode="json")})
+
+    async def receive_until_disconnect() -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    subscription = hub.subscribe(detector_uuid)
+    await websocket.accept()
+    sender = asyncio.create_task(send_events())
+    receiver = asyncio.create_task(receive_until_disconnect())
+    try:
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        hub.unsubscribe(subscription)
+        for task in (sender, receiver):
+            task.cancel()
+        # asyncio.wait, unlike gather, keeps a cancellation of this handler
+        # recognisable to the server's cancel scope.
+        await asyncio.wait({sender, receiver})
+    for task in (sender, receiver):
+        error = None if task.cancelled() else task.exception()
+        if error is not None and not isinstance(error, WebSocketDisconnect):
+            raise error
+
+
+@router.get("/{detector_id}/answers/stream")
+async def stream_detector_answers(detector_id: str, session: Session = Depends(get_session)) -> StreamingResponse:
+    """Stream every answer produced for a detector as server-sent events."""
+
+    internal_id = _parse_detector_public_id(detector_id)
+    await run_in_threadpool(_ensure_detector_exists, internal_id, session)
+    return StreamingResponse(
+        _sse_answer_events(get_answer_hub(), internal_id, settings.answer_stream_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{detector_id}/answers/stream")
+async def stream_detector_answers_ws(
+    websocket: WebSocket, detector_id: str, session: Session = Depends(get_session)
+) -> None:
+    """Push every answer produced for a detector as JSON WebSocket messages."""
+
+    try:
+        internal_id = _parse_detector_public_id(detector_id)
+        await run_in_threadpool(_ensure_detector_exists, internal_id, session)
+    except HTTPException as exc:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail)) from exc
+    await _push_answer_events(websocket, get_answer_hub(), internal_id, settings.answer_stream_heartbeat_seconds)
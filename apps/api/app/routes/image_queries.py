@@ -4,16 +4,30 @@ from __future__ import annotations
 
 import time
 import uuid
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from ..config import settings
 from ..db import get_session
+from ..instrumentation import timed_serialization
 from ..models import Detector, ImageQuery, Stream
-from ..schemas import ImageQueryCreate, ImageQueryRead, ImageQueryWaitResponse
+from ..notifications import get_answer_hub
+from ..reference_cache import detector_references, stream_references
+from ..schemas import (
+    ImageQueryBatchCreate,
+    ImageQueryBatchResponse,
+    ImageQueryCreate,
+    ImageQueryRead,
+    ImageQueryWaitManyRequest,
+    ImageQueryWaitManyResponse,
+    ImageQueryWaitResponse,
+)
+
+_T = TypeVar("_T")
 
 router = APIRouter(prefix="/v1/image-queries", tags=["image-queries"])
 
@@ -28,14 +42,15 @@ def _parse_public_identifier(value: str, prefix: str, not_found: str) -> uuid.UU
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found) from exc
 
 
+@timed_serialization
 def _serialize_image_query(image_query: ImageQuery) -> ImageQueryRead:
-    detector = image_query.detector
-    detector_id = detector.public_id if detector else None
-    if detector_id is None:
+    # Public ids are derived from the foreign keys so serialization never lazy-loads.
+    if image_query.detector_id is None:
         raise RuntimeError("ImageQuery is missing detector relationship")
-
-    stream = image_query.stream
-    stream_id: Optional[str] = stream.public_id if stream else None
+    detector_id = f"{Detector.public_id_prefix}-{image_query.detector_id}"
+    stream_id: Optional[str] = (
+        f"{Stream.public_id_prefix}-{image_query.rtsp_source_id}" if image_query.rtsp_source_id else None
+    )
 
     return ImageQueryRead(
         id=image_query.public_id,
@@ -69,25 +84,21 @@ def create_image_query(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
 
-    detector_stmt = select(Detector).where(Detector.id == detector_uuid)
-    detector = session.scalars(detector_stmt).first()
-    if detector is None:
+    if detector_uuid not in detector_references.resolve(session, {detector_uuid}):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Detector not found")
 
-    stream_obj: Optional[Stream] = None
+    stream_uuid: Optional[uuid.UUID] = None
     if payload.rtsp_source_id is not None:
         try:
             stream_uuid = payload.stream_uuid()
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
-        stream_stmt = select(Stream).where(Stream.id == stream_uuid)
-        stream_obj = session.scalars(stream_stmt).first()
-        if stream_obj is None:
+        if stream_uuid not in stream_references.resolve(session, {stream_uuid}):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Stream not found")
 
     image_query = ImageQuery(
-        detector=detector,
-        stream=stream_obj,
+        detector_id=detector_uuid,
+        rtsp_source_id=stream_uuid,
         snapshot_url=str(payload.snapshot_url),
     )
     session.add(image_query)
@@ -96,6 +107,53 @@ def create_image_query(
     return _serialize_image_query(image_query)
 
 
+@router.post(":batch", response_model=ImageQueryBatchResponse, status_code=status.HTTP_201_CREATED)
+def create_image_queries_batch(
+    payload: ImageQueryBatchCreate, session: Session = Depends(get_session)
+) -> ImageQueryBatchResponse:
+    """Create many image queries with one reference lookup per table and a single commit."""
+
+    rows = _batch_rows(payload)
+    detector_ids = {row["detector_id"] for row in rows}
+    if detector_references.resolve(session, detector_ids).keys() != detector_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Detector not found")
+
+    stream_ids = {row["rtsp_source_id"] for row in rows if row["rtsp_source_id"] is not None}
+    if stream_ids and stream_references.resolve(session, stream_ids).keys() != stream_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Stream not found")
+
+    session.execute(insert(ImageQuery), rows)
+    session.commit()
+    return _batch_response(rows)
+
+
+def _batch_rows(payload: ImageQueryBatchCreate) -> List[Dict[str, Any]]:
+    """Return insert parameters for every query in ``payload``, assigning ids up front."""
+
+    rows = []
+    for index, item in enumerate(payload.queries):
+        try:
+            detector_uuid = item.detector_uuid()
+            stream_uuid = item.stream_uuid()
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"queries[{index}]: {exc}"
+            ) from exc
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "detector_id": detector_uuid,
+                "rtsp_source_id": stream_uuid,
+                "snapshot_url": str(item.snapshot_url),
+            }
+        )
+    return rows
+
+
+def _batch_response(rows: List[Dict[str, Any]]) -> ImageQueryBatchResponse:
+    return ImageQueryBatchResponse(ids=[f"{ImageQuery.public_id_prefix}-{row['id']}" for row in rows])
+
+
 @router.get("/{image_query_id}", response_model=ImageQueryRead)
 def read_image_query(image_query_id: str, session: Session = Depends(get_session)) -> ImageQueryRead:
     """Return a single image query record."""
@@ -104,28 +162,182 @@ def read_image_query(image_query_id: str, session: Session = Depends(get_session
     return _serialize_image_query(image_query)
 
 
+def _load_completed_result(image_query_id: str, session: Session) -> Optional[ImageQueryRead]:
+    """Return the serialized image query if answered, releasing the connection either way."""
+
+    try:
+        image_query = _get_image_query_or_404(image_query_id, session)
+        if image_query.answer is None or image_query.processed_at is None:
+            return None
+        return _serialize_image_query(image_query)
+    finally:
+        session.close()
+
+
 @router.get("/{image_query_id}/wait", response_model=ImageQueryWaitResponse)
-def wait_for_image_query(
+async def wait_for_image_query(
     image_query_id: str,
     session: Session = Depends(get_session),
     timeout: float | None = None,
     poll: float | None = None,
 ) -> ImageQueryWaitResponse:
-    """Poll for completion of an image query returning when an answer is available."""
+    """Wait for completion of an image query returning when an answer is available.
+
+    The database is read once up front and then only again when the answer
+    notification hub reports a write for this query. ``poll`` is honoured as a
+    re-check interval only when the hub cannot observe every answer write.
+    """
+
+    internal_id = _parse_public_identifier(image_query_id, "iq-", "Image query not found")
+    return await _wait_on_hub(
+        internal_id,
+        lambda: run_in_threadpool(_load_completed_result, image_query_id, session),
+        timeout=timeout,
+        poll=poll,
+    )
+
+
+async def _wait_on_hub(
+    internal_id: uuid.UUID,
+    load: Callable[[], Awaitable[Optional[ImageQueryRead]]],
+    *,
+    timeout: Optional[float],
+    poll: Optional[float],
+) -> ImageQueryWaitResponse:
+    """Re-run ``load`` whenever the hub reports an answer for ``internal_id`` until it returns a result."""
+
+    result, done = await _wait_for_answers(
+        [internal_id], load, lambda loaded: loaded is not None, timeout=timeout, poll=poll
+    )
+    if not done:
+        return ImageQueryWaitResponse(status="pending", result=None)
+    return ImageQueryWaitResponse(status="complete", result=result)
+
+
+def _parse_image_query_ids(ids: Sequence[str]) -> List[uuid.UUID]:
+    """Parse public image query ids, dropping duplicates but keeping request order."""
+
+    return list(dict.fromkeys(_parse_public_identifier(value, "iq-", "Image query not found") for value in ids))
+
+
+def _image_queries_statement(internal_ids: Sequence[uuid.UUID]):
+    return (
+        select(ImageQuery).where(ImageQuery.id.in_(internal_ids)).execution_options(populate_existing=True)
+    )
+
+
+def _answered_results(
+    internal_ids: Sequence[uuid.UUID], rows: Sequence[ImageQuery]
+) -> Dict[uuid.UUID, ImageQueryRead]:
+    """Serialize the answered rows, raising 404 when any requested id has no row."""
+
+    if len(rows) != len(internal_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image query not found")
+    return {
+        row.id: _serialize_image_query(row)
+        for row in rows
+        if row.answer is not None and row.processed_at is not None
+    }
+
+
+def _load_answered(internal_ids: List[uuid.UUID], session: Session) -> Dict[uuid.UUID, ImageQueryRead]:
+    """Read ``internal_ids`` with one ``IN`` query, releasing the connection afterwards."""
+
+    try:
+        rows = session.scalars(_image_queries_statement(internal_ids)).all()
+        return _answered_results(internal_ids, rows)
+    finally:
+        session.close()
+
+
+@router.post(":wait", response_model=ImageQueryWaitManyResponse)
+async def wait_for_image_queries(
+    payload: ImageQueryWaitManyRequest,
+    session: Session = Depends(get_session),
+    timeout: float | None = None,
+    poll: float | None = None,
+) -> ImageQueryWaitManyResponse:
+    """Wait until any or all of several image queries are answered.
+
+    Each database read covers every still-pending id with a single ``IN``
+    query and happens only when the notification hub reports an answer for
+    one of them (or on the ``poll`` interval when the hub is not authoritative).
+    """
+
+    return await _wait_many_on_hub(
+        _parse_image_query_ids(payload.ids),
+        payload.mode,
+        lambda pending: run_in_threadpool(_load_answered, pending, session),
+        timeout=timeout,
+        poll=poll,
+    )
+
+
+async def _wait_many_on_hub(
+    internal_ids: List[uuid.UUID],
+    mode: str,
+    load_pending: Callable[[List[uuid.UUID]], Awaitable[Dict[uuid.UUID, ImageQueryRead]]],
+    *,
+    timeout: Optional[float],
+    poll: Optional[float],
+) -> ImageQueryWaitManyResponse:
+    """Accumulate answers for ``internal_ids`` until ``mode`` (``any``/``all``) is satisfied."""
+
+    answered: Dict[uuid.UUID, ImageQueryRead] = {}
+
+    async def load() -> Dict[uuid.UUID, ImageQueryRead]:
+        pending = [internal_id for internal_id in internal_ids if internal_id not in answered]
+        answered.update(await load_pending(pending))
+        return answered
+
+    def ready(loaded: Dict[uuid.UUID, ImageQueryRead]) -> bool:
+        return len(loaded) == len(internal_ids) if mode == "all" else bool(loaded)
+
+    _, done = await _wait_for_answers(internal_ids, load, ready, timeout=timeout, poll=poll)
+    prefix = ImageQuery.public_id_prefix
+    return ImageQueryWaitManyResponse(
+        status="complete" if done else "pending",
+        results=[answered[internal_id] for internal_id in internal_ids if internal_id in answered],
+        pending=[f"{prefix}-{internal_id}" for internal_id in internal_ids if internal_id not in answered],
+    )
+
+
+async def _wait_for_answers(
+    internal_ids: Sequence[uuid.UUID],
+    load: Callable[[], Awaitable[_T]],
+    ready: Callable[[_T], bool],
+    *,
+    timeout: Optional[float],
+    poll: Optional[float],
+) -> Tuple[_T, bool]:
+    """Re-run ``load`` whenever the hub reports an answer for one of ``internal_ids``.
+
+    Returns the last loaded value and whether ``ready`` accepted it before the
+    timeout elapsed.
+    """
 
     wait_timeout = settings.image_query_wait_timeout_seconds if timeout is None else max(timeout, 0.0)
     poll_interval = settings.image_query_wait_poll_seconds if poll is None else max(poll, 0.0)
     deadline = time.monotonic() + wait_timeout
 
-    while True:
-        image_query = _get_image_query_or_404(image_query_id, session)
-        if image_query.answer is not None and image_query.processed_at is not None:
-            return ImageQueryWaitResponse(status="complete", result=_serialize_image_query(image_query))
-        now = time.monotonic()
-        if now >= deadline:
-            return ImageQueryWaitResponse(status="pending", result=None)
-        session.expire(image_query)
-        remaining = min(poll_interval, deadline - now)
-        if remaining <= 0:
-            return ImageQueryWaitResponse(status="pending", result=None)
-        time.sleep(remaining)
+    hub = get_answer_hub()
+    waiters = hub.register_many(internal_ids)
+    waiter = waiters[0]
+    try:
+        while True:
+            loaded = await load()
+            if ready(loaded):
+                return loaded, True
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return loaded, False
+                if not hub.authoritative and poll_interval > 0:
+                    remaining = min(poll_interval, remaining)
+                notified = await waiter.wait(remaining)
+                if notified or not hub.authoritative:
+                    waiter.reset()
+                    break
+    finally:
+        for registered in waiters:
+            hub.unregister(registered)
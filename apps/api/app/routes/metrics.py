@@ -0,0 +1,15 @@
+"""Prometheus scrape endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..metrics import CONTENT_TYPE_LATEST, registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Prometheus metrics")
+def metrics() -> PlainTextResponse:
+    """Render every registered metric in the Prometheus text exposition format."""
+
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE_LATEST)
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import uuid
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
+from ..conditional import probe_resource, set_resource_etag
+from ..config import settings
 from ..db import get_session
+from ..instrumentation import timed_serialization
 from ..models import Stream
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, keyset_rows
+from ..projections import Projection, projected_response, public_id
+from ..reference_cache import stream_references
 from ..schemas import StreamCreate, StreamRead, StreamUpdate
 
 router = APIRouter(prefix="/v1/streams", tags=["streams"])
@@ -27,6 +33,7 @@ def _parse_stream_public_id(stream_id: str) -> uuid.UUID:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stream not found") from exc
 
 
+@timed_serialization
 def _serialize_stream(stream: Stream) -> StreamRead:
     return StreamRead(
         id=stream.public_id,
@@ -39,24 +46,71 @@ def _serialize_stream(stream: Stream) -> StreamRead:
     )
 
 
-@router.get("", response_model=List[StreamRead])
-def list_streams(session: Session = Depends(get_session)) -> List[StreamRead]:
-    """Return all configured streams ordered by creation time descending."""
+_STREAM_PROJECTION = Projection(
+    {
+        "id": public_id(Stream.id, Stream.public_id_prefix),
+        "name": Stream.name,
+        "rtsp_url": Stream.rtsp_url,
+        "zone_masks": Stream.zone_masks,
+        "is_active": Stream.is_active,
+        "created_at": Stream.created_at,
+        "updated_at": Stream.updated_at,
+    }
+)
+
+
+def _list_streams_statement(is_active: Optional[bool], name_prefix: Optional[str]) -> Select:
+    stmt = select(Stream)
+    if is_active is not None:
+        stmt = stmt.where(Stream.is_active == is_active)
+    if name_prefix is not None:
+        stmt = stmt.where(Stream.name.startswith(name_prefix, autoescape=True))
+    return stmt
 
-    stmt = select(Stream).order_by(Stream.created_at.desc(), Stream.id.desc())
-    streams = session.scalars(stmt).all()
+
+@router.get("", response_model=List[StreamRead])
+def list_streams(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    is_active: Optional[bool] = None,
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=255),
+    session: Session = Depends(get_session),
+) -> Union[List[StreamRead], Response]:
+    """Return one page of streams ordered by creation time descending.
+
+    When more rows are available the ``X-Next-Cursor`` response header carries
+    the cursor for the following page.
+    """
+
+    stmt = _list_streams_statement(is_active, name_prefix)
+    if settings.fast_list_serialization:
+        rows = keyset_rows(
+            session, _STREAM_PROJECTION.statement(stmt), Stream, limit=limit, cursor=cursor, response=response
+        )
+        return projected_response(_STREAM_PROJECTION, rows, response)
+    streams = keyset_page(session, stmt, Stream, limit=limit, cursor=cursor, response=response)
     return [_serialize_stream(stream) for stream in streams]
 
 
 @router.get("/{stream_id}", response_model=StreamRead)
-def get_stream(stream_id: str, session: Session = Depends(get_session)) -> StreamRead:
-    """Return a single stream by its public identifier."""
+def get_stream(
+    stream_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: Session = Depends(get_session),
+) -> Union[StreamRead, Response]:
+    """Return a single stream by its public identifier, honouring ``If-None-Match``."""
 
     internal_id = _parse_stream_public_id(stream_id)
+    unchanged = probe_resource(session, Stream, internal_id, if_none_match)
+    if unchanged is not None:
+        return unchanged
     stmt = select(Stream).where(Stream.id == internal_id)
     stream = session.scalars(stmt).first()
     if stream is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stream not found")
+    set_resource_etag(response, stream)
     return _serialize_stream(stream)
 
 
@@ -93,4 +147,5 @@ def update_stream(stream_id: str, payload: StreamUpdate, session: Session = Depe
     session.add(stream)
     session.commit()
     session.refresh(stream)
+    stream_references.invalidate(stream.id)
     return _serialize_stream(stream)
@@ -2,15 +2,31 @@
 
 from .alert import AlertRead
 from .detector import DetectorCreate, DetectorRead
-from .image_query import ImageQueryCreate, ImageQueryRead, ImageQueryWaitResponse
+from .image_query import (
+    MAX_IMAGE_QUERY_BATCH_SIZE,
+    ImageQueryAnswerEvent,
+    ImageQueryBatchCreate,
+    ImageQueryBatchResponse,
+    ImageQueryCreate,
+    ImageQueryRead,
+    ImageQueryWaitManyRequest,
+    ImageQueryWaitManyResponse,
+    ImageQueryWaitResponse,
+)
 from .stream import StreamCreate, StreamRead, StreamUpdate
 
 __all__ = [
+    "MAX_IMAGE_QUERY_BATCH_SIZE",
     "AlertRead",
     "DetectorCreate",
     "DetectorRead",
+    "ImageQueryAnswerEvent",
+    "ImageQueryBatchCreate",
+    "ImageQueryBatchResponse",
     "ImageQueryCreate",
     "ImageQueryRead",
+    "ImageQueryWaitManyRequest",
+    "ImageQueryWaitManyResponse",
     "ImageQueryWaitResponse",
     "StreamCreate",
     "StreamRead",
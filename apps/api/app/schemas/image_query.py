@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
 
@@ -43,6 +43,21 @@ class ImageQueryCreate(BaseModel):
             raise ValueError("rtsp_source_id must include a valid UUID") from exc
 
 
+MAX_IMAGE_QUERY_BATCH_SIZE = 500
+
+
+class ImageQueryBatchCreate(BaseModel):
+    """Payload for submitting many image queries in a single request."""
+
+    queries: List[ImageQueryCreate] = Field(min_length=1, max_length=MAX_IMAGE_QUERY_BATCH_SIZE)
+
+
+class ImageQueryBatchResponse(BaseModel):
+    """Identifiers of the image queries created by a batch submission, in request order."""
+
+    ids: List[str]
+
+
 class ImageQueryRead(BaseModel):
     """Response payload describing an image query."""
 
@@ -65,8 +80,44 @@ class ImageQueryWaitResponse(BaseModel):
     result: Optional[ImageQueryRead] = None
 
 
+class ImageQueryWaitManyRequest(BaseModel):
+    """Image queries to wait on and whether to return after the first or every answer."""
+
+    ids: List[str] = Field(min_length=1, max_length=MAX_IMAGE_QUERY_BATCH_SIZE)
+    mode: Literal["any", "all"] = "any"
+
+
+class ImageQueryWaitManyResponse(BaseModel):
+    """Envelope returned by the multi-query wait endpoint.
+
+    ``results`` holds every answered query in request order and ``pending``
+    the identifiers still awaiting an answer. ``status`` is ``complete`` once
+    the requested ``mode`` is satisfied.
+    """
+
+    status: Literal["pending", "complete"]
+    results: List[ImageQueryRead] = Field(default_factory=list)
+    pending: List[str] = Field(default_factory=list)
+
+
+class ImageQueryAnswerEvent(BaseModel):
+    """Answer notification pushed to detector answer stream subscribers."""
+
+    id: str
+    detector_id: str
+    answer: Optional[ImageQueryAnswer]
+    answer_score: Optional[float]
+    processed_at: Optional[datetime]
+
+
 __all__ = [
+    "MAX_IMAGE_QUERY_BATCH_SIZE",
+    "ImageQueryAnswerEvent",
+    "ImageQueryBatchCreate",
+    "ImageQueryBatchResponse",
     "ImageQueryCreate",
     "ImageQueryRead",
+    "ImageQueryWaitManyRequest",
+    "ImageQueryWaitManyResponse",
     "ImageQueryWaitResponse",
 ]
@@ -0,0 +1,165 @@
+"""Compare list endpoint throughput with and without the projected serialization path.
+
+Run from the repository root::
+
+    python -m apps.api.benchmarks.bench_list_serialization --rows 20000
+
+The benchmark fills a throwaway SQLite database, then walks every page of
+``/v1/detectors`` and ``/v1/streams`` (500 rows per page) and repeatedly reads
+``/v1/alerts/events/recent`` through the ASGI app, first with the default
+schema path and then with ``FAST_LIST_SERIALIZATION`` enabled, and reports
+rows per second for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from apps.api.app.config import settings
+from apps.api.app.db import Base, configure_engine, get_engine
+from apps.api.app.main import create_app
+from apps.api.app.models import Alert, Detector, ImageQuery, Stream, User
+from apps.api.app.models.enums import AlertChannel, AlertStatus, DetectorMode, UserRole
+from apps.api.app.pagination import MAX_PAGE_SIZE
+
+RECENT_ALERTS_LIMIT = 100
+
+
+def _populate(rows: int) -> None:
+    now = datetime.now(tz=timezone.utc)
+    user_id = uuid.uuid4()
+    detector_ids = [uuid.uuid4() for _ in range(rows)]
+    image_query_ids = [uuid.uuid4() for _ in range(RECENT_ALERTS_LIMIT)]
+
+    with get_engine().begin() as connection:
+        connection.execute(insert(User), [{"id": user_id, "email": "bench@example.com", "role": UserRole.ADMIN}])
+        connection.execute(
+            insert(Detector),
+            [
+                {
+                    "id": detector_id,
+                    "name": f"Detector {index}",
+                    "mode": DetectorMode.BINARY,
+                    "query": "Is anyone at the gate?",
+                    "confidence_threshold": 0.5,
+                    "is_active": True,
+                    "created_by_id": user_id,
+                    "created_at": now - timedelta(seconds=index),
+                }
+                for index, detector_id in enumerate(detector_ids)
+            ],
+        )
+        connection.execute(
+            insert(Stream),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "name": f"Camera {index}",
+                    "rtsp_url": f"rtsp://camera-{index}.local/stream",
+                    "zone_masks": {"gate": [[0, 0], [640, 0], [640, 360]]},
+                    "created_at": now - timedelta(seconds=index),
+                }
+                for index in range(rows)
+            ],
+        )
+        connection.execute(
+            insert(ImageQuery),
+            [
+                {"id": image_query_id, "detector_id": detector_ids[0], "snapshot_url": "https://example.com/a.jpg"}
+                for image_query_id in image_query_ids
+            ],
+        )
+        connection.execute(
+            insert(Alert),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "detector_id": detector_ids[0],
+                    "image_query_id": image_query_id,
+                    "status": AlertStatus.OPEN,
+                    "message": "Person detected at the gate",
+                    "channel": AlertChannel.EMAIL,
+                    "created_at": now - timedelta(seconds=index),
+                }
+                for index, image_query_id in enumerate(image_query_ids)
+            ],
+        )
+
+
+def _walk_pages(client: TestClient, path: str) -> int:
+    rows = 0
+    params: Dict[str, object] = {"limit": MAX_PAGE_SIZE}
+    while True:
+        response = client.get(path, params=params)
+        response.raise_for_status()
+        rows += len(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return rows
+        params = {"limit": MAX_PAGE_SIZE, "cursor": cursor}
+
+
+def _recent_alerts(repeat: int) -> Callable[[TestClient], int]:
+    def run(client: TestClient) -> int:
+        for _ in range(repeat):
+            client.get("/v1/alerts/events/recent", params={"limit": RECENT_ALERTS_LIMIT}).raise_for_status()
+        return repeat * RECENT_ALERTS_LIMIT
+
+    return run
+
+
+def _measure(client: TestClient, workloads: Dict[str, Callable[[TestClient], int]]) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for name, workload in workloads.items():
+        workload(client)  # warm up statement caches and the connection pool
+        started = time.perf_counter()
+        rows = workload(client)
+        results[name] = rows / (time.perf_counter() - started)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000, help="detectors and streams to insert")
+    parser.add_argument("--repeat", type=int, default=200, help="recent alert reads per measurement")
+    args = parser.parse_args()
+
+    workloads: Dict[str, Callable[[TestClient], int]] = {
+        "detectors": lambda client: _walk_pages(client, "/v1/detectors"),
+        "streams": lambda client: _walk_pages(client, "/v1/streams"),
+        "recent_alerts": _recent_alerts(args.repeat),
+    }
+    measurements: List[Tuple[str, Dict[str, float]]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        configure_engine(f"sqlite+pysqlite:///{Path(directory) / 'bench.db'}")
+        Base.metadata.create_all(get_engine())
+        _populate(args.rows)
+        original = settings.fast_list_serialization
+        try:
+            with TestClient(create_app(use_async_db=False)) as client:
+                for label, fast in (("schema", False), ("projected", True)):
+                    settings.fast_list_serialization = fast
+                    measurements.append((label, _measure(client, workloads)))
+        finally:
+            settings.fast_list_serialization = original
+            get_engine().dispose()
+
+    (_, schema), (_, projected) = measurements
+    for name in workloads:
+        print(
+            f"{name}: {schema[name]:,.0f} rows/s -> {projected[name]:,.0f} rows/s "
+            f"({projected[name] / schema[name]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
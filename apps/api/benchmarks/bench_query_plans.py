@@ -0,0 +1,148 @@
+"""Compare query plans and timings for hot queries with and without secondary indexes.
+
+Run from the repository root::
+
+    python -m apps.api.benchmarks.bench_query_plans --alerts 200000
+
+The benchmark builds a throwaway SQLite database from the model metadata,
+drops the secondary indexes, records ``EXPLAIN QUERY PLAN`` output and timings
+for each hot query, then recreates the indexes and repeats the measurements.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Engine, create_engine, insert, text
+
+from apps.api.app.db import Base
+from apps.api.app.models import Alert, Detector, ImageQuery, Stream, User
+from apps.api.app.models.enums import AlertChannel, AlertStatus, DetectorMode, ImageQueryAnswer, UserRole
+
+SECONDARY_INDEXES = [
+    index for table in Base.metadata.sorted_tables for index in table.indexes if index.name != "ix_users_email"
+]
+
+HOT_QUERIES: Dict[str, str] = {
+    "recent_alerts": "SELECT id FROM alerts ORDER BY created_at DESC LIMIT 20",
+    "alerts_for_image_query": "SELECT id FROM alerts WHERE image_query_id = :image_query_id",
+    "alerts_for_detector": "SELECT count(*) FROM alerts WHERE detector_id = :detector_id",
+    "image_queries_for_detector": "SELECT count(*) FROM image_queries WHERE detector_id = :detector_id",
+    "unanswered_for_detector": (
+        "SELECT id FROM image_queries WHERE detector_id = :detector_id AND answer IS NULL "
+        "ORDER BY created_at LIMIT 50"
+    ),
+    "detectors_page": "SELECT id FROM detectors ORDER BY created_at DESC, id DESC LIMIT 100",
+}
+
+
+def _populate(engine: Engine, alerts: int, detectors: int) -> Dict[str, str]:
+    rng = random.Random(7)
+    now = datetime.now(tz=timezone.utc)
+    user_id = uuid.uuid4()
+    detector_ids = [uuid.uuid4() for _ in range(detectors)]
+    stream_id = uuid.uuid4()
+    image_query_ids = [uuid.uuid4() for _ in range(alerts)]
+
+    with engine.begin() as connection:
+        connection.execute(insert(User), [{"id": user_id, "email": "bench@example.com", "role": UserRole.ADMIN}])
+        connection.execute(
+            insert(Detector),
+            [
+                {
+                    "id": detector_id,
+                    "name": f"Detector {index}",
+                    "mode": DetectorMode.BINARY,
+                    "query": "bench",
+                    "confidence_threshold": 0.5,
+                    "is_active": True,
+                    "created_by_id": user_id,
+                    "created_at": now - timedelta(seconds=index),
+                }
+                for index, detector_id in enumerate(detector_ids)
+            ],
+        )
+        connection.execute(insert(Stream), [{"id": stream_id, "name": "bench", "rtsp_url": "rtsp://bench"}])
+        connection.execute(
+            insert(ImageQuery),
+            [
+                {
+                    "id": image_query_id,
+                    "detector_id": rng.choice(detector_ids),
+                    "rtsp_source_id": stream_id,
+                    "snapshot_url": "https://example.com/bench.jpg",
+                    "answer": None if rng.random() < 0.05 else ImageQueryAnswer.YES,
+                    "created_at": now - timedelta(seconds=rng.randint(0, 86_400 * 30)),
+                }
+                for image_query_id in image_query_ids
+            ],
+        )
+        connection.execute(
+            insert(Alert),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "detector_id": rng.choice(detector_ids),
+                    "image_query_id": image_query_id,
+                    "status": AlertStatus.OPEN,
+                    "message": "bench",
+                    "channel": AlertChannel.EMAIL,
+                    "created_at": now - timedelta(seconds=rng.randint(0, 86_400 * 30)),
+                }
+                for image_query_id in image_query_ids
+            ],
+        )
+    return {"detector_id": str(detector_ids[0]), "image_query_id": str(image_query_ids[len(image_query_ids) // 2])}
+
+
+def _measure(engine: Engine, params: Dict[str, str], repeat: int) -> Dict[str, Tuple[List[str], float]]:
+    results: Dict[str, Tuple[List[str], float]] = {}
+    with engine.connect() as connection:
+        for name, sql in HOT_QUERIES.items():
+            plan = [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)]
+            started = time.perf_counter()
+            for _ in range(repeat):
+                connection.execute(text(sql), params).all()
+            elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+            results[name] = (plan, elapsed_ms)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=100_000, help="number of image queries/alerts to insert")
+    parser.add_argument("--detectors", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite+pysqlite:///{Path(directory) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        for index in SECONDARY_INDEXES:
+            index.drop(engine)
+        params = _populate(engine, args.alerts, args.detectors)
+
+        before = _measure(engine, params, args.repeat)
+        for index in SECONDARY_INDEXES:
+            index.create(engine)
+        with engine.begin() as connection:
+            connection.execute(text("ANALYZE"))
+        after = _measure(engine, params, args.repeat)
+        engine.dispose()
+
+    for name in HOT_QUERIES:
+        (plan_before, ms_before), (plan_after, ms_after) = before[name], after[name]
+        print(f"{name}: {ms_before:.3f} ms -> {ms_after:.3f} ms")
+        print(f"  without indexes: {' | '.join(plan_before)}")
+        print(f"  with indexes:    {' | '.join(plan_after)}")
+
+
+if __name__ == "__main__":
+    main()
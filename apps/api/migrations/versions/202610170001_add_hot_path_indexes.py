@@ -0,0 +1,52 @@
+"""add secondary indexes for hot query paths"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610170001"
+down_revision = "202405280001"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns) for plain B-tree indexes on foreign keys and sort keys.
+INDEXES = [
+    ("ix_alerts_created_at", "alerts", ["created_at"]),
+    ("ix_alerts_detector_id", "alerts", ["detector_id"]),
+    ("ix_alerts_image_query_id", "alerts", ["image_query_id"]),
+    ("ix_image_queries_detector_id", "image_queries", ["detector_id"]),
+    ("ix_image_queries_rtsp_source_id", "image_queries", ["rtsp_source_id"]),
+    ("ix_escalations_alert_id", "escalations", ["alert_id"]),
+    ("ix_annotations_image_query_id", "annotations", ["image_query_id"]),
+    ("ix_detectors_created_at_id", "detectors", ["created_at", "id"]),
+    ("ix_streams_created_at_id", "streams", ["created_at", "id"]),
+]
+
+UNANSWERED_WHERE = sa.text("answer IS NULL")
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps large tables writable on PostgreSQL; it cannot run
+    # inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        op.create_index(
+            "ix_image_queries_unanswered",
+            "image_queries",
+            ["detector_id", "created_at"],
+            unique=False,
+            postgresql_where=UNANSWERED_WHERE,
+            sqlite_where=UNANSWERED_WHERE,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_image_queries_unanswered", table_name="image_queries", postgresql_concurrently=True)
+        for name, table, _columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
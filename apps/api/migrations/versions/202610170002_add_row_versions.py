@@ -0,0 +1,24 @@
+"""add row_version counters used for entity tags"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610170002"
+down_revision = "202610170001"
+branch_labels = None
+depends_on = None
+
+TABLES = ("detectors", "streams", "alerts")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("row_version", sa.Integer(), nullable=False, server_default=sa.text("1")))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, "row_version")
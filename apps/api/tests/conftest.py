@@ -7,12 +7,15 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from apps.api.app.db import Base, configure_engine, get_engine, get_session_factory
-
-import pytest
-from fastapi.testclient import TestClient
-
+from apps.api.app.db import (
+    Base,
+    configure_async_engine,
+    configure_engine,
+    get_engine,
+    get_session_factory,
+)
 from apps.api.app.main import create_app
+from apps.api.app.reference_cache import detector_references, stream_references
 
 
 @pytest.fixture()
@@ -21,9 +24,12 @@ def database(tmp_path: Path) -> Iterator[None]:
 
     db_path = tmp_path / "test.db"
     configure_engine(f"sqlite+pysqlite:///{db_path}")
+    configure_async_engine(f"sqlite+aiosqlite:///{db_path}")
     engine = get_engine()
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
+    detector_references.clear()
+    stream_references.clear()
     try:
         yield
     finally:
@@ -33,13 +39,20 @@ def database(tmp_path: Path) -> Iterator[None]:
 
 @pytest.fixture()
 def client(database: None) -> Iterator[TestClient]:
-def client() -> Iterator[TestClient]:
     """Provide a FastAPI test client for request/response assertions."""
 
     with TestClient(create_app()) as client:
         yield client
 
 
+@pytest.fixture()
+def async_client(database: None) -> Iterator[TestClient]:
+    """Provide a test client whose resource routes use the async database layer."""
+
+    with TestClient(create_app(use_async_db=True)) as client:
+        yield client
+
+
 @pytest.fixture()
 def db_session(database: None) -> Iterator[Session]:
     """Return a SQLAlchemy session bound to the test database."""
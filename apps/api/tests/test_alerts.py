@@ -43,3 +43,14 @@ def test_recent_alerts_ordering(client: TestClient, db_session: Session) -> None
     assert len(payload) == 2
     assert [item["message"] for item in payload] == ["Newer alert", "Older alert"]
     assert payload[0]["status"] == AlertStatus.ACK
+
+
+def test_get_alert_conditional_request(client: TestClient, db_session: Session) -> None:
+    alert = create_alert(db_session)
+    etag = client.get(f"/v1/alerts/{alert.public_id}").headers["ETag"]
+
+    response = client.get(f"/v1/alerts/{alert.public_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    missing = client.get("/v1/alerts/alrt-00000000-0000-0000-0000-000000000000", headers={"If-None-Match": etag})
+    assert missing.status_code == 404
@@ -0,0 +1,164 @@
+"""Tests for the async route handlers served when the async database is enabled."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from apps.api.app.models import ImageQuery
+from apps.api.app.models.enums import DetectorMode, ImageQueryAnswer
+from apps.api.app.notifications import get_answer_hub
+from .factories import create_alert, create_detector, create_stream, create_user
+
+
+def test_async_detector_create_list_and_get(async_client: TestClient, db_session: Session) -> None:
+    creator = create_user(db_session)
+    payload = {
+        "name": "Gate Watch",
+        "mode": DetectorMode.BINARY.value,
+        "query": "Is the gate open?",
+        "confidence_threshold": 0.7,
+        "created_by": creator.public_id,
+    }
+
+    created = async_client.post("/v1/detectors", json=payload)
+    assert created.status_code == 201
+    detector_id = created.json()["id"]
+    assert created.json()["created_by"] == creator.public_id
+
+    listed = async_client.get("/v1/detectors", params={"limit": 1})
+    assert listed.status_code == 200
+    assert [item["id"] for item in listed.json()] == [detector_id]
+
+    fetched = async_client.get(f"/v1/detectors/{detector_id}")
+    assert fetched.status_code == 200
+    assert fetched.json()["name"] == "Gate Watch"
+
+    assert async_client.get("/v1/detectors/det-00000000-0000-0000-0000-000000000000").status_code == 404
+
+
+def test_async_stream_pagination_and_update(async_client: TestClient, db_session: Session) -> None:
+    first = create_stream(db_session, name="Dock 1")
+    first.created_at = first.created_at - timedelta(minutes=5)
+    db_session.commit()
+    second = create_stream(db_session, name="Dock 2")
+
+    page = async_client.get("/v1/streams", params={"limit": 1})
+    assert page.status_code == 200
+    assert [item["id"] for item in page.json()] == [second.public_id]
+    cursor = page.headers["X-Next-Cursor"]
+
+    following = async_client.get("/v1/streams", params={"limit": 1, "cursor": cursor})
+    assert [item["id"] for item in following.json()] == [first.public_id]
+    assert "X-Next-Cursor" not in following.headers
+
+    updated = async_client.patch(f"/v1/streams/{first.public_id}", json={"is_active": False})
+    assert updated.status_code == 200
+    assert updated.json()["is_active"] is False
+
+
+def test_async_image_query_create_batch_and_read(async_client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    stream = create_stream(db_session)
+
+    created = async_client.post(
+        "/v1/image-queries",
+        json={
+            "detector_id": detector.public_id,
+            "rtsp_source_id": stream.public_id,
+            "snapshot_url": "https://example.com/one.jpg",
+        },
+    )
+    assert created.status_code == 201
+    assert created.json()["rtsp_source_id"] == stream.public_id
+
+    batch = async_client.post(
+        "/v1/image-queries:batch",
+        json={"queries": [{"detector_id": detector.public_id, "snapshot_url": "https://example.com/two.jpg"}]},
+    )
+    assert batch.status_code == 201
+    (batch_id,) = batch.json()["ids"]
+
+    fetched = async_client.get(f"/v1/image-queries/{batch_id}")
+    assert fetched.status_code == 200
+    assert fetched.json()["snapshot_url"] == "https://example.com/two.jpg"
+    assert db_session.query(ImageQuery).count() == 2
+
+
+def test_async_wait_wakes_on_answer_commit(async_client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    image_query = ImageQuery(detector=detector, snapshot_url="https://example.com/image.jpg")
+    db_session.add(image_query)
+    db_session.commit()
+
+    hub = get_answer_hub()
+
+    def _answer_later() -> None:
+        deadline = time.monotonic() + 5
+        while hub.waiter_count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        image_query.answer = ImageQueryAnswer.YES
+        image_query.answer_score = 0.95
+        image_query.processed_at = datetime.now(tz=timezone.utc)
+        db_session.commit()
+
+    writer = threading.Thread(target=_answer_later)
+    writer.start()
+    response = async_client.get(f"/v1/image-queries/{image_query.public_id}/wait", params={"timeout": 5})
+    writer.join()
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "complete"
+    assert response.json()["result"]["answer"] == ImageQueryAnswer.YES.value
+
+
+def test_async_wait_for_image_queries(async_client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    answered = ImageQuery(
+        detector=detector,
+        snapshot_url="https://example.com/answered.jpg",
+        answer=ImageQueryAnswer.NO,
+        processed_at=datetime.now(tz=timezone.utc),
+    )
+    pending = ImageQuery(detector=detector, snapshot_url="https://example.com/pending.jpg")
+    db_session.add_all([answered, pending])
+    db_session.commit()
+
+    response = async_client.post(
+        "/v1/image-queries:wait",
+        params={"timeout": 0},
+        json={"ids": [pending.public_id, answered.public_id], "mode": "any"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "complete"
+    assert [result["id"] for result in data["results"]] == [answered.public_id]
+    assert data["pending"] == [pending.public_id]
+
+
+def test_async_alerts(async_client: TestClient, db_session: Session) -> None:
+    alert = create_alert(db_session)
+
+    recent = async_client.get("/v1/alerts/events/recent")
+    assert recent.status_code == 200
+    assert [item["id"] for item in recent.json()] == [alert.public_id]
+
+    fetched = async_client.get(f"/v1/alerts/{alert.public_id}")
+    assert fetched.status_code == 200
+    assert fetched.json()["image_query_id"] == alert.image_query.public_id
+
+
+def test_async_conditional_get(async_client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+
+    first = async_client.get(f"/v1/detectors/{detector.public_id}")
+    listing = async_client.get("/v1/detectors")
+
+    etag = first.headers["ETag"]
+    assert async_client.get(f"/v1/detectors/{detector.public_id}", headers={"If-None-Match": etag}).status_code == 304
+    assert async_client.get("/v1/detectors", headers={"If-None-Match": listing.headers["ETag"]}).status_code == 304
@@ -2,32 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 import uuid
+from datetime import datetime, timedelta, timezone
 
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from apps.api.app.models import Detector
-from apps.api.app.models.enums import DetectorMode
-from .factories import create_detector, create_user
+from apps.api.app.models.enums import DetectorMode, ImageQueryAnswer
+from apps.api.app.notifications import AnswerEvent, AnswerNotificationHub, get_answer_hub
+from apps.api.app.routes.detectors import _push_answer_events, _sse_answer_events
+from .factories import create_detector, create_image_query, create_user
 
 
 def test_create_detector(client: TestClient, db_session: Session) -> None:
     user = create_user(db_session)
-from apps.api.app.models import Detector, User
-from apps.api.app.models.enums import DetectorMode, UserRole
-
-
-def _create_user(session: Session, email: str = "owner@example.com") -> User:
-    user = User(email=email, role=UserRole.ADMIN, password_hash="x")
-    session.add(user)
-    session.commit()
-    session.refresh(user)
-    return user
-
-
-def test_create_detector(client: TestClient, db_session: Session) -> None:
-    user = _create_user(db_session)
 
     payload = {
         "name": "Perimeter Watch",
@@ -54,17 +46,6 @@ def test_create_detector(client: TestClient, db_session: Session) -> None:
 
 def test_list_detectors_returns_created_items(client: TestClient, db_session: Session) -> None:
     detector = create_detector(db_session)
-    user = _create_user(db_session)
-    detector = Detector(
-        name="Gate Monitor",
-        mode=DetectorMode.BINARY,
-        query="Notify when gate is open",
-        confidence_threshold=0.6,
-        is_active=True,
-        creator=user,
-    )
-    db_session.add(detector)
-    db_session.commit()
 
     response = client.get("/v1/detectors")
     assert response.status_code == 200
@@ -75,7 +56,6 @@ def test_list_detectors_returns_created_items(client: TestClient, db_session: Se
     item = payload[0]
     assert item["id"] == detector.public_id
     assert item["created_by"] == detector.creator.public_id
-    assert item["created_by"] == user.public_id
 
 
 def test_get_detector_returns_404_for_unknown(client: TestClient) -> None:
@@ -96,3 +76,176 @@ def test_create_detector_requires_existing_user(client: TestClient, db_session:
     response = client.post("/v1/detectors", json=payload)
     assert response.status_code == 400
     assert response.json()["detail"] == "Creator not found"
+
+
+def test_answer_stream_websocket_pushes_answers(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    image_query = create_image_query(db_session, detector=detector)
+    other = create_image_query(db_session, detector=create_detector(db_session, name="Other"))
+
+    with client.websocket_connect(f"/v1/detectors/{detector.public_id}/answers/stream") as websocket:
+        for instance, answer in ((other, ImageQueryAnswer.NO), (image_query, ImageQueryAnswer.YES)):
+            instance.answer = answer
+            instance.answer_score = 0.8
+            instance.processed_at = datetime.now(tz=timezone.utc)
+            db_session.add(instance)
+            db_session.commit()
+
+        message = websocket.receive_json()
+
+    assert message["event"] == "answer"
+    assert message["data"]["id"] == image_query.public_id
+    assert message["data"]["detector_id"] == detector.public_id
+    assert message["data"]["answer"] == ImageQueryAnswer.YES.value
+    assert get_answer_hub().subscriber_count() == 0
+
+
+def test_answer_stream_websocket_returns_as_soon_as_the_client_leaves() -> None:
+    hub = AnswerNotificationHub()
+    detector_uuid = uuid.uuid4()
+
+    class _ClosingWebSocket:
+        def __init__(self) -> None:
+            self.sent: list[dict] = []
+
+        async def accept(self) -> None:
+            pass
+
+        async def send_json(self, data: dict) -> None:
+            self.sent.append(data)
+
+        async def receive(self) -> dict:
+            await asyncio.sleep(0.05)
+            return {"type": "websocket.disconnect", "code": 1000}
+
+    async def runner() -> float:
+        started = time.monotonic()
+        await asyncio.wait_for(_push_answer_events(_ClosingWebSocket(), hub, detector_uuid, heartbeat=30.0), 5)
+        return time.monotonic() - started
+
+    assert asyncio.run(runner()) < 1
+    assert hub.subscriber_count() == 0
+
+
+def test_answer_stream_sse_formats_events() -> None:
+    hub = AnswerNotificationHub()
+    detector_uuid = uuid.uuid4()
+    image_query_uuid = uuid.uuid4()
+
+    async def runner() -> list[str]:
+        stream = _sse_answer_events(hub, detector_uuid, heartbeat=0.01)
+        chunks = [await stream.__anext__()]
+        hub.notify([
+            AnswerEvent(
+                image_query_id=image_query_uuid,
+                detector_id=detector_uuid,
+                answer=ImageQueryAnswer.NO,
+                answer_score=0.3,
+            )
+        ])
+        chunks.append(await stream.__anext__())
+        chunks.append(await stream.__anext__())
+        await stream.aclose()
+        return chunks
+
+    connected, answer, heartbeat = asyncio.run(runner())
+    assert connected.startswith(":")
+    assert answer.startswith(f"event: answer\nid: iq-{image_query_uuid}\ndata: ")
+    assert json.loads(answer.split("data: ", 1)[1])["answer"] == ImageQueryAnswer.NO.value
+    assert heartbeat == ": keep-alive\n\n"
+    assert hub.subscriber_count() == 0
+
+
+def test_answer_stream_returns_404_for_unknown_detector(client: TestClient) -> None:
+    response = client.get("/v1/detectors/det-00000000-0000-0000-0000-000000000000/answers/stream")
+    assert response.status_code == 404
+
+
+def test_list_detectors_paginates_with_cursor(client: TestClient, db_session: Session) -> None:
+    owner = create_user(db_session)
+    created = [create_detector(db_session, creator=owner, name=f"Detector {index}") for index in range(5)]
+    ordered = sorted(created, key=lambda item: (item.created_at, str(item.id)), reverse=True)
+    expected = [detector.public_id for detector in ordered]
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get("/v1/detectors", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(item["id"] for item in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+def test_list_detectors_applies_filters(client: TestClient, db_session: Session) -> None:
+    owner = create_user(db_session)
+    gate = create_detector(db_session, creator=owner, name="Gate 100%")
+    create_detector(db_session, creator=owner, name="Gate 2", is_active=False)
+    create_detector(db_session, creator=owner, name="Dock", mode=DetectorMode.MULTICLASS)
+
+    response = client.get("/v1/detectors", params={"name_prefix": "Gate", "is_active": "true"})
+    assert [item["id"] for item in response.json()] == [gate.public_id]
+
+    response = client.get("/v1/detectors", params={"name_prefix": "Gate 1_"})
+    assert response.json() == []
+
+    response = client.get("/v1/detectors", params={"mode": DetectorMode.MULTICLASS.value})
+    assert [item["name"] for item in response.json()] == ["Dock"]
+
+
+def test_list_detectors_rejects_invalid_cursor(client: TestClient, db_session: Session) -> None:
+    create_detector(db_session)
+
+    response = client.get("/v1/detectors", params={"cursor": "str-00000000-0000-0000-0000-000000000000"})
+    assert response.status_code == 400
+
+    response = client.get("/v1/detectors", params={"cursor": "det-00000000-0000-0000-0000-000000000000"})
+    assert response.status_code == 400
+
+
+def test_get_detector_conditional_request(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+
+    first = client.get(f"/v1/detectors/{detector.public_id}")
+    etag = first.headers["ETag"]
+
+    cached = client.get(f"/v1/detectors/{detector.public_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    detector.confidence_threshold = 0.9
+    db_session.commit()
+
+    refreshed = client.get(f"/v1/detectors/{detector.public_id}", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+    assert refreshed.json()["confidence_threshold"] == 0.9
+
+
+def test_list_detectors_conditional_request(client: TestClient, db_session: Session) -> None:
+    owner = create_user(db_session)
+    for name in ("First", "Second"):
+        detector = create_detector(db_session, creator=owner, name=name)
+        detector.created_at = detector.created_at - timedelta(minutes=5)
+    db_session.commit()
+
+    first = client.get("/v1/detectors", params={"limit": 1})
+    etag = first.headers["ETag"]
+
+    cached = client.get("/v1/detectors", params={"limit": 1}, headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert cached.status_code == 304
+    assert cached.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    create_detector(db_session, creator=owner, name="Third")
+    changed = client.get("/v1/detectors", params={"limit": 1}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
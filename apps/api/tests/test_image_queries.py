@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from datetime import datetime, timezone
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from apps.api.app.db import get_engine
 from apps.api.app.models import ImageQuery
 from apps.api.app.models.enums import ImageQueryAnswer
+from apps.api.app.notifications import get_answer_hub
 from .factories import create_detector, create_stream
 
 
@@ -93,3 +98,229 @@ def test_wait_for_image_query_returns_complete(client: TestClient, db_session: S
     assert data["status"] == "complete"
     assert data["result"]["id"] == image_query.public_id
     assert data["result"]["answer"] == ImageQueryAnswer.YES.value
+
+
+def test_wait_for_image_query_wakes_on_answer_commit(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    image_query = ImageQuery(detector=detector, snapshot_url="https://example.com/image.jpg")
+    db_session.add(image_query)
+    db_session.commit()
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    hub = get_answer_hub()
+
+    def _answer_later() -> None:
+        deadline = time.monotonic() + 5
+        while hub.waiter_count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.2)
+        image_query.answer = ImageQueryAnswer.NO
+        image_query.answer_score = 0.2
+        image_query.processed_at = datetime.now(tz=timezone.utc)
+        db_session.add(image_query)
+        db_session.commit()
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _record)
+    writer = threading.Thread(target=_answer_later)
+    writer.start()
+    try:
+        started = time.monotonic()
+        response = client.get(f"/v1/image-queries/{image_query.public_id}/wait?timeout=5&poll=0.01")
+        elapsed = time.monotonic() - started
+    finally:
+        writer.join()
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "complete"
+    assert data["result"]["answer"] == ImageQueryAnswer.NO.value
+    assert elapsed < 4
+    # One lookup before waiting and one after the wake-up, not one per poll tick.
+    lookups = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT") and "image_queries" in sql]
+    assert len(lookups) <= 3
+    assert hub.waiter_count() == 0
+
+
+def test_wait_for_image_query_returns_404_for_unknown(client: TestClient) -> None:
+    response = client.get("/v1/image-queries/iq-00000000-0000-0000-0000-000000000000/wait?timeout=0")
+    assert response.status_code == 404
+    assert get_answer_hub().waiter_count() == 0
+
+
+def _pending_queries(db_session: Session, count: int) -> list[ImageQuery]:
+    detector = create_detector(db_session)
+    image_queries = [
+        ImageQuery(detector=detector, snapshot_url=f"https://example.com/{index}.jpg") for index in range(count)
+    ]
+    db_session.add_all(image_queries)
+    db_session.commit()
+    return image_queries
+
+
+def _answer(db_session: Session, image_query: ImageQuery, answer: ImageQueryAnswer = ImageQueryAnswer.YES) -> None:
+    image_query.answer = answer
+    image_query.answer_score = 0.9
+    image_query.processed_at = datetime.now(tz=timezone.utc)
+    db_session.commit()
+
+
+def test_wait_for_image_queries_any_returns_first_answer(client: TestClient, db_session: Session) -> None:
+    first, second, third = _pending_queries(db_session, 3)
+    _answer(db_session, second)
+
+    response = client.post(
+        "/v1/image-queries:wait",
+        params={"timeout": 0},
+        json={"ids": [first.public_id, second.public_id, third.public_id]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["status"] == "complete"
+    assert [result["id"] for result in data["results"]] == [second.public_id]
+    assert data["pending"] == [first.public_id, third.public_id]
+
+
+def test_wait_for_image_queries_all_reports_pending_on_timeout(client: TestClient, db_session: Session) -> None:
+    first, second = _pending_queries(db_session, 2)
+    _answer(db_session, first)
+
+    response = client.post(
+        "/v1/image-queries:wait",
+        params={"timeout": 0},
+        json={"ids": [first.public_id, second.public_id], "mode": "all"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["status"] == "pending"
+    assert [result["id"] for result in data["results"]] == [first.public_id]
+    assert data["pending"] == [second.public_id]
+
+
+def test_wait_for_image_queries_all_uses_one_query_per_wake_up(client: TestClient, db_session: Session) -> None:
+    image_queries = _pending_queries(db_session, 5)
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    hub = get_answer_hub()
+
+    def _answer_later() -> None:
+        deadline = time.monotonic() + 5
+        while hub.waiter_count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for image_query in image_queries:
+            image_query.answer = ImageQueryAnswer.NO
+            image_query.processed_at = datetime.now(tz=timezone.utc)
+        db_session.commit()
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _record)
+    writer = threading.Thread(target=_answer_later)
+    writer.start()
+    try:
+        response = client.post(
+            "/v1/image-queries:wait",
+            params={"timeout": 5},
+            json={"ids": [image_query.public_id for image_query in image_queries], "mode": "all"},
+        )
+    finally:
+        writer.join()
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "complete"
+    assert [result["id"] for result in data["results"]] == [image_query.public_id for image_query in image_queries]
+    assert data["pending"] == []
+    lookups = [
+        sql
+        for sql in statements
+        if sql.lstrip().upper().startswith("SELECT") and "FROM image_queries" in sql and " IN " in sql
+    ]
+    # At most one read before waiting and one after the single commit, each covering every id.
+    assert 1 <= len(lookups) <= 2
+    assert hub.waiter_count() == 0
+
+
+def test_wait_for_image_queries_returns_404_for_unknown(client: TestClient, db_session: Session) -> None:
+    (image_query,) = _pending_queries(db_session, 1)
+
+    response = client.post(
+        "/v1/image-queries:wait",
+        params={"timeout": 0},
+        json={"ids": [image_query.public_id, "iq-00000000-0000-0000-0000-000000000000"]},
+    )
+    assert response.status_code == 404
+    assert get_answer_hub().waiter_count() == 0
+
+
+def test_create_image_queries_batch(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    other_detector = create_detector(db_session, name="Dock Monitor")
+    stream = create_stream(db_session)
+
+    payload = {
+        "queries": [
+            {
+                "detector_id": detector.public_id,
+                "rtsp_source_id": stream.public_id,
+                "snapshot_url": f"https://example.blob.core.windows.net/images/{index}.jpg",
+            }
+            for index in range(3)
+        ]
+        + [
+            {
+                "detector_id": other_detector.public_id,
+                "snapshot_url": "https://example.blob.core.windows.net/images/other.jpg",
+            }
+        ]
+    }
+
+    response = client.post("/v1/image-queries:batch", json=payload)
+    assert response.status_code == 201
+    ids = response.json()["ids"]
+    assert len(ids) == 4
+    assert all(identifier.startswith("iq-") for identifier in ids)
+
+    stored = {image_query.public_id: image_query for image_query in db_session.query(ImageQuery).all()}
+    assert set(stored) == set(ids)
+    assert stored[ids[0]].rtsp_source_id == stream.id
+    assert stored[ids[3]].detector_id == other_detector.id
+    assert stored[ids[3]].rtsp_source_id is None
+
+    read_back = client.get(f"/v1/image-queries/{ids[1]}")
+    assert read_back.status_code == 200
+    assert read_back.json()["snapshot_url"].endswith("/1.jpg")
+
+
+def test_create_image_queries_batch_rejects_unknown_references(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    payload = {
+        "queries": [
+            {"detector_id": detector.public_id, "snapshot_url": "https://example.com/a.jpg"},
+            {
+                "detector_id": "det-00000000-0000-0000-0000-000000000000",
+                "snapshot_url": "https://example.com/b.jpg",
+            },
+        ]
+    }
+
+    response = client.post("/v1/image-queries:batch", json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Detector not found"
+    assert db_session.query(ImageQuery).count() == 0
+
+    payload["queries"][1]["detector_id"] = detector.public_id
+    payload["queries"][1]["rtsp_source_id"] = "str-00000000-0000-0000-0000-000000000000"
+    response = client.post("/v1/image-queries:batch", json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Stream not found"
@@ -0,0 +1,142 @@
+"""Tests for applying inference result batches to image queries."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from apps.api.app import inference_results
+from apps.api.app.db import get_engine
+from apps.api.app.inference_results import ResultBatchConsumer, apply_result_batch, consume_result_batches
+from apps.api.app.models import ImageQuery
+from apps.api.app.models.enums import ImageQueryAnswer
+from apps.api.app.notifications import AnswerEvent, get_answer_hub
+from intellioptics.messaging import InferenceAnswer, InferenceResultBatch, InferenceResultMessage
+from intellioptics.transport import RESULTS_TOPIC, DeadLetter, InMemoryBroker
+from .factories import create_detector, create_image_query
+
+
+def _result(image_query: ImageQuery, answer: InferenceAnswer = InferenceAnswer.YES, score: float = 0.9, **kwargs):
+    return InferenceResultMessage(job_id=image_query.public_id, answer=answer, score=score, **kwargs)
+
+
+def test_consumer_applies_batch_with_one_update(db_session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    detector = create_detector(db_session)
+    first = create_image_query(db_session, detector=detector)
+    second = create_image_query(db_session, detector=detector)
+    processed_at = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    batch = InferenceResultBatch(
+        [
+            _result(first, InferenceAnswer.NO, 0.2),
+            _result(second, InferenceAnswer.YES, 0.7, processed_at=processed_at),
+            _result(first, InferenceAnswer.YES, 0.95),
+            InferenceResultMessage(job_id=f"iq-{uuid.uuid4()}", answer=InferenceAnswer.NO, score=0.1),
+            InferenceResultMessage(job_id="not-an-id", answer=InferenceAnswer.NO, score=0.1),
+        ]
+    )
+    notified: List[AnswerEvent] = []
+    monkeypatch.setattr(get_answer_hub(), "notify", lambda events: notified.extend(events) or len(notified))
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(get_engine(), "before_cursor_execute", _record)
+    try:
+        outcome = ResultBatchConsumer().handle(batch)
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", _record)
+
+    assert outcome.applied == 2
+    assert set(outcome.unknown_job_ids) == {batch.results[3].job_id, "not-an-id"}
+    assert len([statement for statement in statements if "UPDATE image_queries" in statement]) == 1
+
+    db_session.expire_all()
+    assert (first.answer, first.answer_score) == (ImageQueryAnswer.YES, 0.95)
+    assert first.processed_at is not None
+    assert (second.answer, second.answer_score) == (ImageQueryAnswer.YES, 0.7)
+    assert second.processed_at.replace(tzinfo=timezone.utc) == processed_at
+    assert {answer_event.image_query_id for answer_event in notified} == {first.id, second.id}
+    assert all(answer_event.detector_id == detector.id for answer_event in notified)
+
+
+def test_apply_result_batch_chunks_large_batches(db_session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inference_results, "RESULT_UPDATE_CHUNK_SIZE", 2)
+    detector = create_detector(db_session)
+    image_queries = [create_image_query(db_session, detector=detector) for _ in range(5)]
+
+    outcome = apply_result_batch(db_session, InferenceResultBatch([_result(iq) for iq in image_queries]))
+    db_session.commit()
+
+    assert outcome.applied == 5
+    assert outcome.unknown_job_ids == ()
+    db_session.expire_all()
+    assert all(iq.answer is ImageQueryAnswer.YES for iq in image_queries)
+
+
+def test_apply_result_batch_ignores_empty_batch(db_session: Session) -> None:
+    outcome = apply_result_batch(db_session, InferenceResultBatch())
+
+    assert outcome.applied == 0
+    assert outcome.unknown_job_ids == ()
+
+
+def test_consume_result_batches_acks_applied_batches_and_dead_letters_garbage(db_session: Session) -> None:
+    image_query = create_image_query(db_session)
+    db_session.commit()
+
+    async def runner() -> List[DeadLetter]:
+        broker = InMemoryBroker()
+        await broker.publish_many(
+            RESULTS_TOPIC, [InferenceResultBatch([_result(image_query)]).to_bytes(), b"not a batch"]
+        )
+        stop = asyncio.Event()
+        consumer = asyncio.create_task(consume_result_batches(broker, stop=stop, receive_timeout=0.01))
+        while broker.pending_count(RESULTS_TOPIC):
+            await asyncio.sleep(0.01)
+        stop.set()
+        await consumer
+        return await broker.dead_letters(RESULTS_TOPIC)
+
+    (dead,) = asyncio.run(runner())
+    assert dead.body == b"not a batch"
+    db_session.expire_all()
+    assert image_query.answer is ImageQueryAnswer.YES
+
+
+def test_consume_result_batches_survives_a_lock_lost_during_a_slow_batch(db_session: Session) -> None:
+    image_query = create_image_query(db_session)
+    db_session.commit()
+    clock = [0.0]
+    handled: List[InferenceResultBatch] = []
+
+    class SlowConsumer(ResultBatchConsumer):
+        def handle(self, batch: InferenceResultBatch):
+            if not handled:
+                clock[0] += 60.0
+            handled.append(batch)
+            return super().handle(batch)
+
+    async def runner() -> None:
+        broker = InMemoryBroker(lock_duration=30.0, clock=lambda: clock[0])
+        await broker.publish(RESULTS_TOPIC, InferenceResultBatch([_result(image_query)]).to_bytes())
+        stop = asyncio.Event()
+        consumer = asyncio.create_task(
+            consume_result_batches(broker, SlowConsumer(), stop=stop, receive_timeout=0.01)
+        )
+        while broker.pending_count(RESULTS_TOPIC):
+            assert not consumer.done()
+            await asyncio.sleep(0.01)
+        stop.set()
+        await consumer
+
+    asyncio.run(runner())
+    assert len(handled) == 2
+    db_session.expire_all()
+    assert image_query.answer is ImageQueryAnswer.YES
@@ -0,0 +1,98 @@
+"""Tests for the metrics primitives and the /metrics endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from fastapi.testclient import TestClient
+
+from apps.api.app.db import get_async_engine, get_engine
+from apps.api.app.db.pool import InstrumentedQueuePool, pool_checkout_seconds
+from apps.api.app.instrumentation import (
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_serialization_seconds,
+)
+from apps.api.app.metrics import MetricsRegistry
+from apps.api.app.metrics import registry as app_registry
+from .factories import create_detector
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests served.", ["method"])
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.gauge("answer", "Computed at scrape time.", function=lambda: 42)
+
+    requests.inc(method="GET")
+    requests.inc(2, method="GET")
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{method="GET"} 3' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines
+    assert "answer 42" in lines
+
+
+def test_metrics_endpoint_reports_pool_state(client: TestClient) -> None:
+    engine = get_engine()
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    before = pool_checkout_seconds.count()
+
+    with engine.connect():
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert "intellioptics_db_pool_checked_out 1" in lines
+    assert "intellioptics_db_pool_size 10" in lines
+    assert any(line.startswith("intellioptics_db_pool_overflow ") for line in lines)
+    assert pool_checkout_seconds.count() > before
+
+
+def test_pool_gauges_include_the_async_engine(database: None) -> None:
+    async def checked_out_while_connected() -> List[str]:
+        async with get_async_engine().connect():
+            return app_registry.render().splitlines()
+
+    lines = asyncio.run(checked_out_while_connected())
+    assert "intellioptics_db_pool_checked_out 1" in lines
+
+
+def test_request_metrics_by_route_template(client: TestClient, db_session) -> None:
+    detector = create_detector(db_session)
+    labels = {"method": "GET", "route": "/v1/detectors/{detector_id}"}
+    before = http_request_duration_seconds.count(status="200", **labels)
+    queries_before = http_request_db_queries.sum(**labels)
+    serialization_before = http_serialization_seconds.sum(**labels)
+
+    response = client.get(f"/v1/detectors/{detector.public_id}")
+    assert response.status_code == 200
+    client.get("/v1/detectors/det-00000000-0000-0000-0000-000000000000")
+
+    assert http_request_duration_seconds.count(status="200", **labels) == before + 1
+    assert http_request_duration_seconds.count(status="404", **labels) >= 1
+    assert http_request_db_queries.sum(**labels) - queries_before >= 1
+    assert http_serialization_seconds.sum(**labels) > serialization_before
+    assert http_requests_in_flight.value(method="GET") == 0
+
+    sample = 'intellioptics_http_request_duration_seconds_count{method="GET",route="/v1/detectors/{detector_id}",status="200"}'
+    lines = client.get("/metrics").text.splitlines()
+    assert any(line.startswith(sample) for line in lines)
+
+
+def test_unmatched_requests_share_one_route_label(client: TestClient) -> None:
+    before = http_request_duration_seconds.count(method="GET", route="<unmatched>", status="404")
+
+    client.get("/definitely/not/a/route")
+
+    assert http_request_duration_seconds.count(method="GET", route="<unmatched>", status="404") == before + 1
@@ -81,3 +81,26 @@ def test_enum_values_match_spec() -> None:
     assert {answer.value for answer in ImageQueryAnswer} == {"YES", "NO", "UNKNOWN"}
     assert {status.value for status in AlertStatus} == {"open", "ack", "resolved"}
     assert {channel.value for channel in AlertChannel} == {"email", "sms", "webhook"}
+
+
+def test_metadata_declares_hot_path_indexes() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    inspector = inspect(engine)
+
+    indexes = {
+        index["name"]: (table, index["column_names"])
+        for table in ("alerts", "image_queries", "escalations", "annotations", "detectors", "streams")
+        for index in inspector.get_indexes(table)
+    }
+
+    assert indexes["ix_alerts_created_at"] == ("alerts", ["created_at"])
+    assert indexes["ix_alerts_detector_id"] == ("alerts", ["detector_id"])
+    assert indexes["ix_alerts_image_query_id"] == ("alerts", ["image_query_id"])
+    assert indexes["ix_image_queries_detector_id"] == ("image_queries", ["detector_id"])
+    assert indexes["ix_image_queries_rtsp_source_id"] == ("image_queries", ["rtsp_source_id"])
+    assert indexes["ix_image_queries_unanswered"] == ("image_queries", ["detector_id", "created_at"])
+    assert indexes["ix_escalations_alert_id"] == ("escalations", ["alert_id"])
+    assert indexes["ix_annotations_image_query_id"] == ("annotations", ["image_query_id"])
+    assert indexes["ix_detectors_created_at_id"] == ("detectors", ["created_at", "id"])
+    assert indexes["ix_streams_created_at_id"] == ("streams", ["created_at", "id"])
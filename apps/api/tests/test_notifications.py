@@ -0,0 +1,50 @@
+"""Tests for the image query answer notification hub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+
+from apps.api.app.notifications import AnswerEvent, AnswerNotificationHub, _remote_answer_event
+
+
+def test_hub_wakes_waiter_from_another_thread() -> None:
+    hub = AnswerNotificationHub()
+    image_query_id = uuid.uuid4()
+
+    async def runner() -> bool:
+        waiter = hub.register(image_query_id)
+        try:
+            answer_event = AnswerEvent(image_query_id=image_query_id, detector_id=uuid.uuid4())
+            threading.Timer(0.05, hub.notify, args=([answer_event],)).start()
+            return await waiter.wait(2.0)
+        finally:
+            hub.unregister(waiter)
+
+    assert asyncio.run(runner()) is True
+    assert hub.waiter_count() == 0
+
+
+def test_hub_ignores_unrelated_notifications() -> None:
+    hub = AnswerNotificationHub()
+
+    async def runner() -> bool:
+        waiter = hub.register(uuid.uuid4())
+        try:
+            assert hub.notify([AnswerEvent(image_query_id=uuid.uuid4(), detector_id=uuid.uuid4())]) == 0
+            return await waiter.wait(0.05)
+        finally:
+            hub.unregister(waiter)
+
+    assert asyncio.run(runner()) is False
+
+
+def test_listener_skips_notifications_sent_by_this_process() -> None:
+    answer_event = AnswerEvent(image_query_id=uuid.uuid4(), detector_id=uuid.uuid4(), answer_score=0.5)
+    payload = answer_event.to_payload()
+
+    assert _remote_answer_event(payload) is None
+    foreign = json.dumps({**json.loads(payload), "src": "another-worker"})
+    assert _remote_answer_event(foreign) == answer_event
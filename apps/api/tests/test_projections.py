@@ -0,0 +1,96 @@
+"""Tests for the column-projected list serialization fast path."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from apps.api.app import projections
+from apps.api.app.config import settings
+from apps.api.app.models.enums import AlertStatus
+from apps.api.app.projections import dumps
+from .factories import create_alert, create_detector, create_stream, create_user
+
+
+def _seed(db_session: Session) -> None:
+    owner = create_user(db_session)
+    for index in range(3):
+        create_detector(db_session, creator=owner, name=f"Detector {index}", confidence_threshold=0.35 + index / 10)
+    create_stream(db_session, name="Dock", zone_masks={"gate": [[0, 0], [10, 5]], "label": "dock é"})
+    create_stream(db_session, name="Door")
+    alert = create_alert(db_session, status=AlertStatus.RESOLVED)
+    alert.resolved_at = datetime.now(tz=timezone.utc) - timedelta(minutes=1)
+    db_session.commit()
+    create_alert(db_session)
+
+
+def _fetch(client: TestClient, path: str, params: dict, *, fast: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "fast_list_serialization", fast)
+    return client.get(path, params=params)
+
+
+@pytest.mark.parametrize("client_fixture", ["client", "async_client"])
+@pytest.mark.parametrize(
+    ("path", "params"),
+    [
+        ("/v1/detectors", {"limit": 2}),
+        ("/v1/detectors", {"is_active": True}),
+        ("/v1/streams", {"limit": 1}),
+        ("/v1/streams", {}),
+        ("/v1/alerts/events/recent", {}),
+    ],
+)
+def test_fast_list_serialization_matches_schema_path(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    db_session: Session,
+    client_fixture: str,
+    path: str,
+    params: dict,
+) -> None:
+    client: TestClient = request.getfixturevalue(client_fixture)
+    _seed(db_session)
+
+    baseline = _fetch(client, path, params, fast=False, monkeypatch=monkeypatch)
+    fast = _fetch(client, path, params, fast=True, monkeypatch=monkeypatch)
+
+    assert baseline.status_code == fast.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == baseline.json()
+    assert fast.content == baseline.content
+    for header in ("X-Next-Cursor", "ETag"):
+        assert fast.headers.get(header) == baseline.headers.get(header)
+
+    cursor = fast.headers.get("X-Next-Cursor")
+    if cursor is not None:
+        following = _fetch(client, path, {**params, "cursor": cursor}, fast=True, monkeypatch=monkeypatch)
+        expected = _fetch(client, path, {**params, "cursor": cursor}, fast=False, monkeypatch=monkeypatch)
+        assert following.content == expected.content
+
+
+def test_fast_list_serialization_rejects_invalid_cursor(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    create_detector(db_session)
+    monkeypatch.setattr(settings, "fast_list_serialization", True)
+
+    response = client.get("/v1/detectors", params={"cursor": "det-00000000-0000-0000-0000-000000000000"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_renders_utc_like_pydantic(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(projections, "orjson", None)
+    elif projections.orjson is None:
+        pytest.skip("orjson is not installed")
+    moment = datetime(2024, 5, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+
+    assert dumps([{"at": moment, "naive": moment.replace(tzinfo=None), "label": "é"}]) == (
+        '[{"at":"2024-05-01T12:30:15.250000Z","naive":"2024-05-01T12:30:15.250000","label":"é"}]'.encode()
+    )
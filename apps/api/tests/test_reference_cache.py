@@ -0,0 +1,101 @@
+"""Tests for the detector/stream reference cache."""
+
+from __future__ import annotations
+
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from apps.api.app.db import get_engine
+from apps.api.app.reference_cache import DetectorReference, TTLCache, cache_hits, detector_references, stream_references
+from .factories import create_detector, create_stream
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used() -> None:
+    clock = _Clock()
+    cache: TTLCache[str, int] = TTLCache("test", maxsize=2, ttl=10, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    clock.now = 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_ttl_cache_disabled_with_zero_ttl() -> None:
+    cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=0)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_submission_reuses_cached_references(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    stream = create_stream(db_session)
+    payload = {
+        "detector_id": detector.public_id,
+        "rtsp_source_id": stream.public_id,
+        "snapshot_url": "https://example.com/image.jpg",
+    }
+    assert client.post("/v1/image-queries", json=payload).status_code == 201
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    hits_before = cache_hits.value(cache="detectors")
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        assert client.post("/v1/image-queries", json=payload).status_code == 201
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert cache_hits.value(cache="detectors") == hits_before + 1
+    assert not any("FROM detectors" in statement or "FROM streams" in statement for statement in statements)
+
+
+def test_stream_update_invalidates_cached_reference(client: TestClient, db_session: Session) -> None:
+    detector = create_detector(db_session)
+    stream = create_stream(db_session)
+    client.post(
+        "/v1/image-queries",
+        json={
+            "detector_id": detector.public_id,
+            "rtsp_source_id": stream.public_id,
+            "snapshot_url": "https://example.com/image.jpg",
+        },
+    )
+    assert detector.id in detector_references
+    assert stream_references.get(stream.id).is_active is True
+
+    client.patch(f"/v1/streams/{stream.public_id}", json={"is_active": False})
+
+    assert stream.id not in stream_references
+
+
+def test_unknown_references_are_not_cached(db_session: Session) -> None:
+    detector = create_detector(db_session)
+    unknown = uuid.uuid4()
+
+    references = detector_references.resolve(db_session, {detector.id, unknown})
+
+    assert references == {detector.id: DetectorReference(id=detector.id)}
+    assert unknown not in detector_references
@@ -71,3 +71,35 @@ def test_update_stream_returns_404_for_unknown_id(client: TestClient) -> None:
         json={"name": "Updated"},
     )
     assert response.status_code == 404
+
+
+def test_list_streams_paginates_and_filters(client: TestClient, db_session) -> None:
+    first = create_stream(db_session, name="Dock East")
+    first.created_at = first.created_at - timedelta(minutes=5)
+    db_session.add(first)
+    db_session.commit()
+    second = create_stream(db_session, name="Dock West")
+    create_stream(db_session, name="Lobby", is_active=False)
+
+    response = client.get("/v1/streams", params={"name_prefix": "Dock", "limit": 1})
+    assert [item["id"] for item in response.json()] == [second.public_id]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get("/v1/streams", params={"name_prefix": "Dock", "limit": 1, "cursor": cursor})
+    assert [item["id"] for item in response.json()] == [first.public_id]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/v1/streams", params={"is_active": "false"})
+    assert [item["name"] for item in response.json()] == ["Lobby"]
+
+
+def test_get_stream_etag_changes_after_update(client: TestClient, db_session) -> None:
+    stream = create_stream(db_session)
+    etag = client.get(f"/v1/streams/{stream.public_id}").headers["ETag"]
+
+    assert client.get(f"/v1/streams/{stream.public_id}", headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(f"/v1/streams/{stream.public_id}", json={"name": "Renamed"})
+    response = client.get(f"/v1/streams/{stream.public_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
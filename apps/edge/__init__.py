@@ -0,0 +1,5 @@
+"""Edge worker package for IntelliOptics."""
+
+from . import app as application_package
+
+__all__ = ["application_package"]
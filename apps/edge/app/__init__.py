@@ -0,0 +1 @@
+"""IntelliOptics edge worker: RTSP ingest and image query submission."""
@@ -0,0 +1,53 @@
+"""Application configuration for the IntelliOptics edge worker."""
+
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+def parse_rtsp_urls(value: str) -> List[str]:
+    """Split ``RTSP_URLS`` (``;``-separated) into stream URLs, skipping blanks and duplicates."""
+
+    return list(dict.fromkeys(url.strip() for url in value.split(";") if url.strip()))
+
+
+class Settings(BaseModel):
+    """Runtime configuration loaded from environment variables."""
+
+    rtsp_urls: List[str] = Field(default_factory=list)
+    fallback_api_base: str = Field(default="")
+    api_token: Optional[str] = Field(default=None)
+    detector_id: str = Field(default="")
+
+    target_fps: float = Field(default=1.0, gt=0.0)
+    frame_buffer_size: int = Field(default=1, ge=1)
+    max_frame_age_seconds: float = Field(default=2.0, gt=0.0)
+    reconnect_delay_seconds: float = Field(default=1.0, gt=0.0)
+    max_reconnect_delay_seconds: float = Field(default=30.0, gt=0.0)
+    jpeg_quality: int = Field(default=85, ge=1, le=100)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Create a settings object using environment variables."""
+
+        return cls(
+            rtsp_urls=parse_rtsp_urls(os.getenv("RTSP_URLS", "")),
+            fallback_api_base=os.getenv("FALLBACK_API_BASE", ""),
+            api_token=os.getenv("INTELLIOPTICS_API_TOKEN"),
+            detector_id=os.getenv("DETECTOR_ID", ""),
+            target_fps=float(os.getenv("TARGET_FPS", 1.0)),
+            frame_buffer_size=int(os.getenv("FRAME_BUFFER_SIZE", 1)),
+            max_frame_age_seconds=float(os.getenv("MAX_FRAME_AGE_SECONDS", 2.0)),
+            reconnect_delay_seconds=float(os.getenv("RECONNECT_DELAY_SECONDS", 1.0)),
+            max_reconnect_delay_seconds=float(os.getenv("MAX_RECONNECT_DELAY_SECONDS", 30.0)),
+            jpeg_quality=int(os.getenv("JPEG_QUALITY", 85)),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return a cached settings object."""
+
+    return Settings.from_env()
@@ -0,0 +1,334 @@
+"""Per-camera RTSP ingest: decode, sample, buffer and submit frames.
+
+Every stream URL gets a :class:`CameraIngest` with two asyncio tasks. The
+decoder task drives a dedicated thread that grabs frames from the
+:class:`~apps.edge.app.sources.FrameSource` as they arrive and only retrieves
+(colour-converts and JPEG-encodes) one whenever a sample is due at
+``target_fps``. Sampled frames go into a :class:`LatestFrameBuffer`: when the
+submitter falls behind, the oldest buffered frame is overwritten instead of a
+backlog building up, and frames older than ``max_frame_age`` are discarded
+rather than submitted. The submitter task hands each frame to an async
+``submit`` callable, normally an :class:`ImageQuerySubmitter` around the SDK
+client. Streams that fail are reopened with capped exponential backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Mapping, Optional, Sequence, Tuple
+
+from intellioptics import IntelliOpticsAsyncClient
+from intellioptics.models import ImageQuery
+
+from .config import Settings
+from .sources import FrameSource, FrameSourceError, open_source
+
+logger = logging.getLogger(__name__)
+
+Submit = Callable[["Frame"], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A sampled, JPEG-encoded frame from one camera."""
+
+    camera: str
+    sequence: int
+    captured_at: float
+    image: bytes
+
+
+@dataclass(frozen=True)
+class CameraStats:
+    """Frame counters for one camera.
+
+    ``grabbed`` counts frames read from the stream, ``sampled`` those encoded
+    for submission; ``dropped`` were overwritten in the buffer and ``stale``
+    expired there before the submitter reached them.
+    """
+
+    grabbed: int = 0
+    sampled: int = 0
+    dropped: int = 0
+    stale: int = 0
+    submitted: int = 0
+    failed: int = 0
+    reconnects: int = 0
+
+
+class LatestFrameBuffer:
+    """Bounded buffer holding the newest frames of one camera.
+
+    Putting a frame into a full buffer evicts the oldest one. Must be used from
+    the event loop thread.
+    """
+
+    def __init__(self, capacity: int = 1, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._frames: Deque[Frame] = deque(maxlen=capacity)
+        self._clock = clock
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+        self.stale = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def put(self, frame: Frame) -> None:
+        if self._closed:
+            return
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append(frame)
+        self._ready.set()
+
+    async def get(self, max_age: Optional[float] = None) -> Optional[Frame]:
+        """Return the oldest frame younger than ``max_age`` seconds, or ``None`` once closed and empty."""
+
+        while True:
+            while self._frames:
+                frame = self._frames.popleft()
+                if max_age is not None and self._clock() - frame.captured_at > max_age:
+                    self.stale += 1
+                    continue
+                return frame
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+    def close(self, *, discard: bool = False) -> None:
+        """Stop accepting frames; ``discard`` also drops the ones still buffered."""
+
+        self._closed = True
+        if discard:
+            self._frames.clear()
+        self._ready.set()
+
+
+class CameraIngest:
+    """Decode, sample and submit the frames of one stream."""
+
+    def __init__(
+        self,
+        camera: str,
+        source: FrameSource,
+        submit: Submit,
+        *,
+        target_fps: float = 1.0,
+        buffer_size: int = 1,
+        max_frame_age: Optional[float] = 2.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if target_fps <= 0:
+            raise ValueError("target_fps must be positive")
+        self.camera = camera
+        self.source = source
+        self.submit = submit
+        self.sample_interval = 1.0 / target_fps
+        self.max_frame_age = max_frame_age
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._clock = clock
+        self.buffer = LatestFrameBuffer(buffer_size, clock=clock)
+        self._halt = threading.Event()
+        self._next_sample: Optional[float] = None
+        self._sequence = 0
+        self._grabbed = 0
+        self._sampled = 0
+        self._submitted = 0
+        self._failed = 0
+        self._reconnects = 0
+
+    @property
+    def stats(self) -> CameraStats:
+        return CameraStats(
+            grabbed=self._grabbed,
+            sampled=self._sampled,
+            dropped=self.buffer.dropped,
+            stale=self.buffer.stale,
+            submitted=self._submitted,
+            failed=self._failed,
+            reconnects=self._reconnects,
+        )
+
+    def _read_sample(self) -> Tuple[int, Optional[Frame]]:
+        """Grab frames until one is due for sampling; runs on the decoder thread.
+
+        Returns how many frames were grabbed and the sampled frame, which is
+        ``None`` at the end of the stream or when halted.
+        """
+
+        grabbed = 0
+        while not self._halt.is_set():
+            if not self.source.grab():
+                break
+            grabbed += 1
+            self._sequence += 1
+            now = self._clock()
+            if self._next_sample is not None and now < self._next_sample:
+                continue
+            if self._next_sample is None or now - self._next_sample > self.sample_interval:
+                self._next_sample = now
+            self._next_sample += self.sample_interval
+            return grabbed, Frame(self.camera, self._sequence, now, self.source.retrieve())
+        return grabbed, None
+
+    async def _decode(self, stop: asyncio.Event, executor: ThreadPoolExecutor) -> None:
+        loop = asyncio.get_running_loop()
+        delay = self.reconnect_delay
+        is_open = False
+        try:
+            while not stop.is_set():
+                try:
+                    if not is_open:
+                        await loop.run_in_executor(executor, self.source.open)
+                        is_open = True
+                    grabbed, frame = await loop.run_in_executor(executor, self._read_sample)
+                except FrameSourceError as exc:
+                    logger.warning("Camera %s failed, reconnecting in %.1fs: %s", self.camera, delay, exc)
+                    if is_open:
+                        await loop.run_in_executor(executor, self.source.close)
+                        is_open = False
+                    self._reconnects += 1
+                    try:
+                        await asyncio.wait_for(stop.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    delay = min(delay * 2, self.max_reconnect_delay)
+                    continue
+                self._grabbed += grabbed
+                if frame is None:
+                    break
+                delay = self.reconnect_delay
+                self._sampled += 1
+                self.buffer.put(frame)
+        finally:
+            if is_open:
+                await loop.run_in_executor(executor, self.source.close)
+            self.buffer.close(discard=stop.is_set())
+
+    async def _drain(self) -> None:
+        while True:
+            frame = await self.buffer.get(self.max_frame_age)
+            if frame is None:
+                return
+            try:
+                await self.submit(frame)
+            except Exception:  # noqa: BLE001 - one failed upload must not stop the camera
+                self._failed += 1
+                logger.exception("Failed to submit frame %s from %s", frame.sequence, self.camera)
+            else:
+                self._submitted += 1
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Ingest until ``stop`` is set or a finite source ends."""
+
+        self._halt.clear()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"decoder-{self.camera}")
+        decoder = asyncio.create_task(self._decode(stop, executor))
+        submitter = asyncio.create_task(self._drain())
+        stopped = asyncio.create_task(stop.wait())
+        try:
+            await asyncio.wait({decoder, stopped}, return_when=asyncio.FIRST_COMPLETED)
+            self._halt.set()
+            await decoder
+            await submitter
+        finally:
+            self._halt.set()
+            stopped.cancel()
+            for task in (decoder, submitter):
+                task.cancel()
+            await asyncio.gather(decoder, submitter, stopped, return_exceptions=True)
+            executor.shutdown(wait=False)
+
+
+class ImageQuerySubmitter:
+    """Submit frames as image queries through the async SDK client.
+
+    ``stream_ids`` maps camera URLs to the API's stream identifiers so image
+    queries are linked to the stream they came from.
+    """
+
+    def __init__(
+        self,
+        client: IntelliOpticsAsyncClient,
+        detector_id: str,
+        *,
+        stream_ids: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.client = client
+        self.detector_id = detector_id
+        self.stream_ids = dict(stream_ids or {})
+
+    async def __call__(self, frame: Frame) -> ImageQuery:
+        return await self.client.submit_image_query(
+            self.detector_id, image_bytes=frame.image, rtsp_source_id=self.stream_ids.get(frame.camera)
+        )
+
+
+class IngestEngine:
+    """Run one :class:`CameraIngest` per stream URL."""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        submit: Submit,
+        *,
+        source_factory: Callable[[str], FrameSource] = open_source,
+        **camera_options: Any,
+    ) -> None:
+        if not urls:
+            raise ValueError("At least one stream URL is required")
+        self.cameras: Dict[str, CameraIngest] = {
+            url: CameraIngest(url, source_factory(url), submit, **camera_options) for url in dict.fromkeys(urls)
+        }
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        submit: Submit,
+        *,
+        source_factory: Optional[Callable[[str], FrameSource]] = None,
+    ) -> "IngestEngine":
+        return cls(
+            settings.rtsp_urls,
+            submit,
+            source_factory=source_factory or (lambda url: open_source(url, jpeg_quality=settings.jpeg_quality)),
+            target_fps=settings.target_fps,
+            buffer_size=settings.frame_buffer_size,
+            max_frame_age=settings.max_frame_age_seconds,
+            reconnect_delay=settings.reconnect_delay_seconds,
+            max_reconnect_delay=settings.max_reconnect_delay_seconds,
+        )
+
+    @property
+    def stats(self) -> Dict[str, CameraStats]:
+        return {url: camera.stats for url, camera in self.cameras.items()}
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Ingest every camera until ``stop`` is set or all finite sources end."""
+
+        stop = stop or asyncio.Event()
+        await asyncio.gather(*(camera.run(stop) for camera in self.cameras.values()))
+
+
+__all__ = [
+    "CameraIngest",
+    "CameraStats",
+    "Frame",
+    "ImageQuerySubmitter",
+    "IngestEngine",
+    "LatestFrameBuffer",
+]
@@ -0,0 +1,58 @@
+"""Entry point for the IntelliOptics edge worker.
+
+Run with ``python -m apps.edge.app.main`` once ``RTSP_URLS``,
+``FALLBACK_API_BASE`` and ``DETECTOR_ID`` are set. ``SIGINT``/``SIGTERM``
+stop ingest after the frames being submitted finish uploading.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from typing import Optional
+
+from intellioptics import IntelliOpticsAsyncClient
+
+from .config import Settings, get_settings
+from .ingest import ImageQuerySubmitter, IngestEngine
+
+logger = logging.getLogger(__name__)
+
+
+async def run(settings: Optional[Settings] = None, *, stop: Optional[asyncio.Event] = None) -> None:
+    """Ingest every configured camera and submit sampled frames until ``stop`` is set."""
+
+    settings = settings or get_settings()
+    if not settings.rtsp_urls:
+        raise RuntimeError("RTSP_URLS is empty; list the camera streams separated by ';'")
+    if not settings.fallback_api_base:
+        raise RuntimeError("FALLBACK_API_BASE is empty; set it to the IntelliOptics API URL")
+    if not settings.detector_id:
+        raise RuntimeError("DETECTOR_ID is empty; set the detector frames are submitted to")
+
+    async with IntelliOpticsAsyncClient(settings.fallback_api_base, settings.api_token) as client:
+        engine = IngestEngine.from_settings(settings, ImageQuerySubmitter(client, settings.detector_id))
+        logger.info("Ingesting %d camera(s) at %.2f fps", len(engine.cameras), settings.target_fps)
+        try:
+            await engine.run(stop)
+        finally:
+            for url, stats in engine.stats.items():
+                logger.info("%s: %s", url, stats)
+
+
+async def _serve() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    await run(stop=stop)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Blocking frame sources read by the per-camera decoder threads.
+
+A source separates advancing the stream (:meth:`FrameSource.grab`) from
+producing a JPEG of the current frame (:meth:`FrameSource.retrieve`), so the
+ingest loop only pays for colour conversion and encoding on the frames it
+actually samples. :class:`VideoCaptureSource` reads RTSP streams (and video
+files) through OpenCV; :class:`ImageFileSource` replays JPEG files from disk at
+a fixed rate and stands in for a camera in tests and benchmarks.
+"""
+
+from __future__ import annotations
+
+import abc
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+DEFAULT_JPEG_QUALITY = 85
+
+
+class FrameSourceError(RuntimeError):
+    """Raised when a source cannot be opened or stops delivering frames."""
+
+
+class FrameSource(abc.ABC):
+    """A camera stream read from a single decoder thread."""
+
+    def open(self) -> None:
+        """Connect to the stream; called again after a failure to reconnect."""
+
+    @abc.abstractmethod
+    def grab(self) -> bool:
+        """Advance to the next frame, blocking until it arrives.
+
+        Returns ``False`` at the end of a finite stream. Raises
+        :class:`FrameSourceError` when the stream fails.
+        """
+
+    @abc.abstractmethod
+    def retrieve(self) -> bytes:
+        """Return the most recently grabbed frame as JPEG bytes."""
+
+    def close(self) -> None:
+        """Release the stream."""
+
+
+class VideoCaptureSource(FrameSource):
+    """RTSP (or video file) source decoded with OpenCV.
+
+    ``grab`` demuxes and decodes the next packet but skips the colour
+    conversion, which ``retrieve`` performs together with JPEG encoding only
+    for sampled frames. Requires ``opencv-python-headless`` (the ``rtsp``
+    extra).
+    """
+
+    def __init__(self, url: str, *, jpeg_quality: int = DEFAULT_JPEG_QUALITY) -> None:
+        self.url = url
+        self.jpeg_quality = jpeg_quality
+        self._capture: Any = None
+
+    def open(self) -> None:
+        try:
+            import cv2
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise FrameSourceError("opencv-python-headless is required to read RTSP streams") from exc
+
+        self.close()
+        capture = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
+        if not capture.isOpened():
+            raise FrameSourceError(f"Could not open {self.url}")
+        # Keep only the newest decoded frame inside the backend as well.
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._capture = capture
+
+    def grab(self) -> bool:
+        if self._capture is None:
+            raise FrameSourceError(f"{self.url} is not open")
+        if not self._capture.grab():
+            if self.url.startswith(("rtsp://", "rtsps://", "http://", "https://")):
+                raise FrameSourceError(f"Lost stream {self.url}")
+            return False
+        return True
+
+    def retrieve(self) -> bytes:
+        import cv2
+
+        ok, frame = self._capture.retrieve()
+        if not ok:
+            raise FrameSourceError(f"Could not decode a frame from {self.url}")
+        ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+        if not ok:
+            raise FrameSourceError(f"Could not encode a frame from {self.url}")
+        return encoded.tobytes()
+
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+
+class ImageFileSource(FrameSource):
+    """Replay JPEG files as a camera running at ``fps`` frames per second.
+
+    ``path`` is a JPEG file or a directory of them, played in name order.
+    ``grab`` blocks until the next frame is due, like a live stream; with
+    ``fps=None`` frames are produced as fast as they are read. The sequence
+    restarts from the beginning when ``loop`` is set and ends otherwise.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, Sequence[Union[str, Path]]],
+        *,
+        fps: Optional[float] = 25.0,
+        loop: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if fps is not None and fps <= 0:
+            raise ValueError("fps must be positive")
+        self.paths = _image_paths(path)
+        if not self.paths:
+            raise ValueError(f"No JPEG files found in {path}")
+        self.fps = fps
+        self.loop = loop
+        self._clock = clock
+        self._sleep = sleep
+        self._frames: List[bytes] = []
+        self._position = -1
+        self._next_due: Optional[float] = None
+
+    def open(self) -> None:
+        if not self._frames:
+            self._frames = [Path(path).read_bytes() for path in self.paths]
+        self._next_due = None
+
+    def grab(self) -> bool:
+        if not self._frames:
+            raise FrameSourceError("Source is not open")
+        position = self._position + 1
+        if position == len(self._frames):
+            if not self.loop:
+                return False
+            position = 0
+        if self.fps is not None:
+            now = self._clock()
+            if self._next_due is None:
+                self._next_due = now
+            elif self._next_due > now:
+                self._sleep(self._next_due - now)
+            self._next_due += 1.0 / self.fps
+        self._position = position
+        return True
+
+    def retrieve(self) -> bytes:
+        return self._frames[self._position]
+
+
+def _image_paths(path: Union[str, Path, Sequence[Union[str, Path]]]) -> List[Path]:
+    if isinstance(path, (str, Path)):
+        root = Path(path)
+        if root.is_dir():
+            return sorted(child for child in root.iterdir() if child.suffix.lower() in (".jpg", ".jpeg"))
+        return [root]
+    return [Path(item) for item in path]
+
+
+def open_source(url: str, *, jpeg_quality: int = DEFAULT_JPEG_QUALITY) -> FrameSource:
+    """Return the source for a ``RTSP_URLS`` entry.
+
+    ``file://`` URLs and plain paths to JPEG files or directories replay those
+    images at 25 fps; everything else is opened with OpenCV.
+    """
+
+    if url.startswith("file://"):
+        return ImageFileSource(url[len("file://") :])
+    candidate = Path(url)
+    if "://" not in url and (candidate.is_dir() or candidate.suffix.lower() in (".jpg", ".jpeg")):
+        return ImageFileSource(candidate)
+    return VideoCaptureSource(url, jpeg_quality=jpeg_quality)
+
+
+__all__ = [
+    "FrameSource",
+    "FrameSourceError",
+    "ImageFileSource",
+    "VideoCaptureSource",
+    "open_source",
+]
@@ -0,0 +1,106 @@
+"""Measure ingest throughput in frames per second per CPU core.
+
+Run from the repository root::
+
+    python -m apps.edge.benchmarks.bench_ingest --cameras 4 --seconds 5
+    python -m apps.edge.benchmarks.bench_ingest --video clip.mp4 --target-fps 2
+
+Each camera replays a source as fast as it can be read, samples it at
+``--target-fps`` and hands sampled frames to a submitter that does nothing, so
+the figures show what decoding and the ingest loop cost on their own. With
+``--video`` every camera decodes that file through OpenCV, exactly as an RTSP
+stream would be; without it they replay synthetic 720p JPEG files and decode
+every grabbed frame with Pillow in its place. Frames per core is grabbed frames
+divided by the process CPU time used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict
+
+from apps.edge.app.ingest import CameraStats, Frame, IngestEngine
+from apps.edge.app.sources import FrameSource, ImageFileSource, VideoCaptureSource
+
+
+class _LoopingVideo(VideoCaptureSource):
+    """Reopen the file at its end so the benchmark runs for as long as requested."""
+
+    def grab(self) -> bool:
+        if super().grab():
+            return True
+        self.open()
+        return super().grab()
+
+
+class _DecodingImageSource(ImageFileSource):
+    """Decode every grabbed JPEG with Pillow, standing in for a video decoder."""
+
+    def grab(self) -> bool:
+        from PIL import Image
+
+        if not super().grab():
+            return False
+        with Image.open(BytesIO(self.retrieve())) as image:
+            image.load()
+        return True
+
+
+def _write_frames(directory: Path, count: int) -> None:
+    from PIL import Image
+
+    for index in range(count):
+        image = Image.effect_noise((1280, 720), 64 + index).convert("RGB")
+        image.save(directory / f"{index:03d}.jpg", quality=85)
+
+
+async def _discard(frame: Frame) -> None:
+    return None
+
+
+async def _run(engine: IngestEngine, seconds: float) -> None:
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(seconds, stop.set)
+    await engine.run(stop)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--target-fps", type=float, default=2.0)
+    parser.add_argument("--video", type=Path, help="video file decoded through OpenCV for every camera")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        factory: Callable[[str], FrameSource]
+        if args.video is not None:
+            factory = lambda url: _LoopingVideo(str(args.video))  # noqa: E731
+        else:
+            _write_frames(Path(directory), 30)
+            factory = lambda url: _DecodingImageSource(directory, fps=None)  # noqa: E731
+        urls = [f"bench://camera-{index}" for index in range(args.cameras)]
+        engine = IngestEngine(
+            urls, _discard, source_factory=factory, target_fps=args.target_fps, max_frame_age=None
+        )
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        asyncio.run(_run(engine, args.seconds))
+        cpu = time.process_time() - cpu_started
+        wall = time.perf_counter() - wall_started
+
+    stats: Dict[str, CameraStats] = engine.stats
+    grabbed = sum(camera.grabbed for camera in stats.values())
+    sampled = sum(camera.sampled for camera in stats.values())
+    print(f"{args.cameras} camera(s), {wall:.1f}s wall, {cpu:.1f}s CPU on {os.cpu_count()} core(s)")
+    print(f"  grabbed {grabbed / wall:>10,.0f} frames/s  ({grabbed / cpu:,.0f} frames per core-second)")
+    print(f"  sampled {sampled / wall:>10,.1f} frames/s  (target {args.target_fps * args.cameras:,.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Test package marker for IntelliOptics edge worker unit tests."""
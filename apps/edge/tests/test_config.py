@@ -0,0 +1,17 @@
+"""Settings helper tests."""
+
+from __future__ import annotations
+
+from apps.edge.app.config import Settings
+
+
+def test_settings_read_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv("RTSP_URLS", "rtsp://cam1;rtsp://cam2; ")
+    monkeypatch.setenv("TARGET_FPS", "2.5")
+    monkeypatch.setenv("FRAME_BUFFER_SIZE", "3")
+
+    settings = Settings.from_env()
+
+    assert settings.rtsp_urls == ["rtsp://cam1", "rtsp://cam2"]
+    assert settings.target_fps == 2.5
+    assert settings.frame_buffer_size == 3
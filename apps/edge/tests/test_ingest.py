@@ -0,0 +1,193 @@
+"""Tests for the edge RTSP ingest engine."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+
+from apps.edge.app.config import Settings, parse_rtsp_urls
+from apps.edge.app.ingest import CameraIngest, CameraStats, Frame, ImageQuerySubmitter, IngestEngine, LatestFrameBuffer
+from apps.edge.app.sources import FrameSource, FrameSourceError, ImageFileSource, open_source
+from intellioptics import IntelliOpticsAsyncClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeCamera(FrameSource):
+    """A 30 fps camera that advances a fake clock on every grab."""
+
+    def __init__(self, clock: _Clock, frames: int, *, failures: int = 0) -> None:
+        self.clock = clock
+        self.frames = frames
+        self.failures = failures
+        self.position = 0
+        self.retrieved: List[int] = []
+
+    def open(self) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise FrameSourceError("camera offline")
+
+    def grab(self) -> bool:
+        if self.position == self.frames:
+            return False
+        self.position += 1
+        self.clock.now += 1 / 30
+        return True
+
+    def retrieve(self) -> bytes:
+        self.retrieved.append(self.position)
+        return b"frame-%d" % self.position
+
+
+def _frame(sequence: int, captured_at: float = 0.0) -> Frame:
+    return Frame("cam", sequence, captured_at, b"jpeg")
+
+
+@pytest.fixture()
+def image_dir(tmp_path: Path) -> Path:
+    for index in range(3):
+        (tmp_path / f"{index:03d}.jpg").write_bytes(b"\xff\xd8frame-%d" % index)
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_latest_frame_buffer_keeps_newest_and_skips_stale_frames() -> None:
+    clock = _Clock()
+
+    async def runner() -> List[int]:
+        buffer = LatestFrameBuffer(2, clock=clock)
+        for sequence in range(1, 5):
+            buffer.put(_frame(sequence, captured_at=sequence))
+        assert len(buffer) == 2 and buffer.dropped == 2
+        clock.now = 5.5
+        received = [(await buffer.get(max_age=2.0)).sequence]
+        buffer.put(_frame(5, captured_at=5.0))
+        buffer.close()
+        buffer.put(_frame(6, captured_at=5.0))
+        while (frame := await buffer.get(max_age=2.0)) is not None:
+            received.append(frame.sequence)
+        assert buffer.stale == 1
+        return received
+
+    assert asyncio.run(runner()) == [4, 5]
+
+
+def test_image_file_source_replays_directory_at_camera_rate(image_dir: Path) -> None:
+    clock = _Clock()
+    sleeps: List[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    source = ImageFileSource(image_dir, fps=10, loop=False, clock=clock, sleep=sleep)
+    source.open()
+    frames = []
+    while source.grab():
+        frames.append(source.retrieve())
+
+    assert frames == [b"\xff\xd8frame-%d" % index for index in range(3)]
+    assert sleeps == pytest.approx([0.1, 0.1])
+    assert isinstance(open_source(f"file://{image_dir}"), ImageFileSource)
+    assert isinstance(open_source(str(image_dir / "000.jpg")), ImageFileSource)
+
+
+def test_camera_samples_at_target_fps_and_only_retrieves_sampled_frames() -> None:
+    clock = _Clock()
+    camera = _FakeCamera(clock, frames=90)
+    submitted: List[Frame] = []
+
+    async def submit(frame: Frame) -> None:
+        submitted.append(frame)
+
+    ingest = CameraIngest("cam", camera, submit, target_fps=5, buffer_size=100, max_frame_age=None, clock=clock)
+    asyncio.run(ingest.run(asyncio.Event()))
+
+    assert len(submitted) == 15
+    assert camera.retrieved == [frame.sequence for frame in submitted]
+    assert ingest.stats == CameraStats(grabbed=90, sampled=15, submitted=15)
+
+
+def test_camera_drops_frames_instead_of_queueing_behind_slow_submitter(image_dir: Path) -> None:
+    submitted: List[Frame] = []
+
+    async def slow_submit(frame: Frame) -> None:
+        submitted.append(frame)
+        await asyncio.sleep(0.02)
+
+    async def runner() -> CameraStats:
+        source = ImageFileSource(image_dir, fps=500)
+        ingest = CameraIngest("cam", source, slow_submit, target_fps=500, max_frame_age=None)
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.2, stop.set)
+        await ingest.run(stop)
+        return ingest.stats
+
+    stats = asyncio.run(runner())
+
+    assert stats.dropped > stats.submitted > 0
+    assert stats.submitted == len(submitted)
+    assert stats.sampled - stats.dropped - stats.submitted <= 1
+
+
+def test_camera_reconnects_after_source_failure() -> None:
+    clock = _Clock()
+    camera = _FakeCamera(clock, frames=3, failures=2)
+    submitted: List[Frame] = []
+
+    async def submit(frame: Frame) -> None:
+        submitted.append(frame)
+
+    ingest = CameraIngest(
+        "cam", camera, submit, target_fps=30, buffer_size=10, max_frame_age=None, reconnect_delay=0.001, clock=clock
+    )
+    asyncio.run(ingest.run(asyncio.Event()))
+
+    assert [frame.image for frame in submitted] == [b"frame-1", b"frame-2", b"frame-3"]
+    assert ingest.stats.reconnects == 2
+
+
+def test_engine_runs_one_decoder_per_url_and_submits_through_sdk(image_dir: Path) -> None:
+    uploads: List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        uploads.append(request.read())
+        return httpx.Response(
+            201, json={"id": f"iq-{len(uploads)}", "detector_id": "det-1", "status": "PENDING"}
+        )
+
+    settings = Settings(
+        rtsp_urls=parse_rtsp_urls("rtsp://cam1; rtsp://cam2;;rtsp://cam1"),
+        detector_id="det-1",
+        target_fps=20,
+    )
+
+    async def runner() -> IngestEngine:
+        client = IntelliOpticsAsyncClient("https://api.test", transport=httpx.MockTransport(handler))
+        submitter = ImageQuerySubmitter(client, "det-1", stream_ids={"rtsp://cam1": "str-1"})
+        engine = IngestEngine.from_settings(
+            settings, submitter, source_factory=lambda url: ImageFileSource(image_dir, fps=100)
+        )
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.3, stop.set)
+        await engine.run(stop)
+        await client.close()
+        return engine
+
+    engine = asyncio.run(runner())
+
+    assert list(engine.stats) == ["rtsp://cam1", "rtsp://cam2"]
+    assert all(stats.submitted > 0 and stats.sampled < stats.grabbed for stats in engine.stats.values())
+    assert sum(stats.submitted for stats in engine.stats.values()) == len(uploads)
+    assert any(b"str-1" in body for body in uploads) and all(b"det-1" in body for body in uploads)
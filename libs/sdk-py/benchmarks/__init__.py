@@ -0,0 +1 @@
+"""Benchmarks for the IntelliOptics Python SDK."""
@@ -0,0 +1,116 @@
+"""Measure end-to-end job loop throughput over the local transports.
+
+Run from ``libs/sdk-py``::
+
+    python -m benchmarks.bench_job_loop --jobs 20000 --workers 4
+
+A producer publishes :class:`InferenceJobMessage` payloads to
+``inference-jobs``; worker tasks receive them in batches, answer each job
+immediately and publish one :class:`InferenceResultBatch` per received batch to
+``inference-results``; a results consumer acknowledges those batches. The run
+is repeated on :class:`InMemoryBroker` and on a :class:`SQLiteBroker` in a
+temporary file, and reports jobs per second and the p50/p99 time from publish
+to result for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from intellioptics.messaging import (
+    InferenceAnswer,
+    InferenceJobMessage,
+    InferenceResultBatch,
+    InferenceResultMessage,
+)
+from intellioptics.transport import JOBS_TOPIC, RESULTS_TOPIC, InMemoryBroker, SQLiteBroker, Transport
+
+
+def _job(index: int, deadline: datetime) -> bytes:
+    return InferenceJobMessage(
+        job_id=f"job-{index:08d}",
+        model_id="model-gate",
+        detector_id="det-8d0c7a5e-34f4-4d55-9f34-61d5c4bfa9f1",
+        requested_by="edge-dock-1",
+        image_blob_url=f"https://account.blob.core.windows.net/images/{index:08d}.jpg",
+        deadline=deadline,
+    ).to_bytes()
+
+
+async def _produce(transport: Transport, jobs: int, chunk: int, published: Dict[str, float]) -> None:
+    deadline = datetime.now(tz=timezone.utc) + timedelta(minutes=5)
+    for start in range(0, jobs, chunk):
+        indexes = range(start, min(start + chunk, jobs))
+        bodies = [_job(index, deadline) for index in indexes]
+        now = time.perf_counter()
+        published.update((f"job-{index:08d}", now) for index in indexes)
+        await transport.publish_many(JOBS_TOPIC, bodies)
+        await asyncio.sleep(0)
+
+
+async def _work(transport: Transport, stop: asyncio.Event, batch_size: int) -> None:
+    while not stop.is_set():
+        received = await transport.receive(JOBS_TOPIC, max_messages=batch_size, timeout=0.05)
+        if not received:
+            continue
+        jobs = [InferenceJobMessage.from_bytes(message.body) for message in received]
+        batch = InferenceResultBatch([InferenceResultMessage(job.job_id, InferenceAnswer.YES, 0.9) for job in jobs])
+        await transport.publish(RESULTS_TOPIC, batch.to_bytes())
+        await transport.ack_many(received)
+
+
+async def _collect(transport: Transport, jobs: int, published: Dict[str, float]) -> List[float]:
+    latencies: List[float] = []
+    while len(latencies) < jobs:
+        for message in await transport.receive(RESULTS_TOPIC, max_messages=64, timeout=1.0):
+            now = time.perf_counter()
+            latencies.extend(now - published[result.job_id] for result in InferenceResultBatch.from_bytes(message.body))
+            await transport.ack(message)
+    return latencies
+
+
+async def _run(transport: Transport, jobs: int, workers: int, batch_size: int) -> Tuple[float, List[float]]:
+    published: Dict[str, float] = {}
+    stop = asyncio.Event()
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(_work(transport, stop, batch_size)) for _ in range(workers)]
+    collector = asyncio.create_task(_collect(transport, jobs, published))
+    await _produce(transport, jobs, batch_size, published)
+    latencies = await collector
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await asyncio.gather(*tasks)
+    await transport.close()
+    return elapsed, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        transports: Dict[str, Callable[[], Transport]] = {
+            "memory": InMemoryBroker,
+            "sqlite": lambda: SQLiteBroker(Path(directory) / "broker.db"),
+        }
+        for name, factory in transports.items():
+            elapsed, latencies = asyncio.run(_run(factory(), args.jobs, args.workers, args.batch_size))
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{name:>6}: {args.jobs / elapsed:>10,.0f} jobs/s"
+                f"  p50 {percentiles[49] * 1000:7.1f} ms  p99 {percentiles[98] * 1000:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compare the binary message codec with the dict/JSON path.
+
+Run from ``libs/sdk-py``::
+
+    python -m benchmarks.bench_message_codec --messages 50000
+
+Encodes and decodes a batch of :class:`InferenceResultMessage` and
+:class:`InferenceJobMessage` objects once through ``to_dict`` + ``json`` (one
+JSON document per message, as each would be sent on its own) and once through
+:func:`encode_many`/:func:`decode_many`, and reports messages per second and
+bytes per message for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from intellioptics.messaging import (
+    InferenceAnswer,
+    InferenceJobMessage,
+    InferenceResultMessage,
+    Message,
+    decode_many,
+    encode_many,
+)
+
+
+def _results(count: int) -> List[InferenceResultMessage]:
+    now = datetime.now(tz=timezone.utc)
+    answers = list(InferenceAnswer)
+    return [
+        InferenceResultMessage(
+            job_id=f"job-{index:08d}",
+            answer=answers[index % len(answers)],
+            score=(index % 1000) / 1000,
+            model_revision="2024.05.1",
+            processed_at=now + timedelta(microseconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _jobs(count: int) -> List[InferenceJobMessage]:
+    deadline = datetime.now(tz=timezone.utc) + timedelta(seconds=5)
+    return [
+        InferenceJobMessage(
+            job_id=f"job-{index:08d}",
+            model_id="model-gate",
+            detector_id="det-8d0c7a5e-34f4-4d55-9f34-61d5c4bfa9f1",
+            requested_by="edge-dock-1",
+            image_blob_url=f"https://account.blob.core.windows.net/images/{index:08d}.jpg",
+            deadline=deadline,
+            trace={"corr": f"{index:08x}"},
+        )
+        for index in range(count)
+    ]
+
+
+def _json_path(messages: Sequence[Message]) -> Tuple[float, float, int]:
+    kind = type(messages[0])
+    started = time.perf_counter()
+    payloads = [json.dumps(message.to_dict()).encode() for message in messages]
+    encoded = time.perf_counter()
+    decoded = [kind.from_dict(json.loads(payload)) for payload in payloads]
+    finished = time.perf_counter()
+    assert decoded == list(messages)
+    return encoded - started, finished - encoded, sum(len(payload) for payload in payloads)
+
+
+def _binary_path(messages: Sequence[Message]) -> Tuple[float, float, int]:
+    started = time.perf_counter()
+    payload = encode_many(messages)
+    encoded = time.perf_counter()
+    decoded = decode_many(payload)
+    finished = time.perf_counter()
+    assert decoded == list(messages)
+    return encoded - started, finished - encoded, len(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    args = parser.parse_args()
+
+    workloads: Dict[str, List[Message]] = {"results": _results(args.messages), "jobs": _jobs(args.messages)}
+    paths: Dict[str, Callable[[Sequence[Message]], Tuple[float, float, int]]] = {
+        "dict/json": _json_path,
+        "binary": _binary_path,
+    }
+    for name, messages in workloads.items():
+        print(f"{name} ({len(messages)} messages)")
+        for label, run in paths.items():
+            run(messages[:1000])  # warm up
+            encode_seconds, decode_seconds, size = run(messages)
+            print(
+                f"  {label:>9}: encode {len(messages) / encode_seconds:>12,.0f} msg/s"
+                f"  decode {len(messages) / decode_seconds:>12,.0f} msg/s"
+                f"  {size / len(messages):6.1f} bytes/msg"
+            )
+
+
+if __name__ == "__main__":
+    main()
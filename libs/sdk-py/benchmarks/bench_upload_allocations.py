@@ -0,0 +1,84 @@
+"""Measure Python heap allocations per image query upload for each supported source type.
+
+Run from ``libs/sdk-py``::
+
+    python -m benchmarks.bench_upload_allocations --size-mb 24
+
+Each upload goes through :meth:`IntelliOpticsClient.submit_image_query` with a
+transport that drains the multipart body chunk by chunk, the way a socket
+would, so the numbers only reflect what the SDK and ``httpx`` allocate while
+building and streaming the request. A frame that is copied once shows up as
+roughly one frame of peak allocation; a streamed one stays near the 64 KiB
+chunk size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import httpx
+
+from intellioptics.client import IntelliOpticsClient
+
+
+class _DrainTransport(httpx.BaseTransport):
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in request.stream:  # type: ignore[union-attr]
+            pass
+        payload = {"id": "iq-bench", "detector_id": "det-bench", "snapshot_url": None}
+        return httpx.Response(201, json=payload, request=request)
+
+
+def _measure(client: IntelliOpticsClient, source: Any, repeat: int) -> Tuple[float, float]:
+    client.submit_image_query("det-bench", image_bytes=source)  # warm up
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(repeat):
+            client.submit_image_query("det-bench", image_bytes=source)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size for stat in snapshot.statistics("filename"))
+    return (peak - before) / 1024, allocated / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=24.0, help="frame size in MiB (a raw 4K RGB frame is ~24)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    frame = b"\xff\xd8" + b"\x00" * int(args.size_mb * 1024 * 1024) + b"\xff\xd9"
+    client = IntelliOpticsClient("https://bench.local", transport=_DrainTransport())
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "frame.jpg"
+        path.write_bytes(frame)
+        with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            sources: Dict[str, Callable[[], Any]] = {
+                "bytes": lambda: frame,
+                "bytearray": lambda: bytearray(frame),
+                "memoryview": lambda: memoryview(frame),
+                "mmap": lambda: mapped,
+                "file": lambda: handle,
+            }
+            print(f"frame: {len(frame) / 1024:.0f} KiB, {args.repeat} uploads per source")
+            for name, make in sources.items():
+                source = make()
+                peak_kib, retained_kib = _measure(client, source, args.repeat)
+                print(f"{name:>10}: peak {peak_kib:10.1f} KiB  retained {retained_kib:8.1f} KiB")
+                if isinstance(source, memoryview):
+                    source.release()
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,57 @@
 """Python SDK for interacting with the IntelliOptics platform."""
 
-from .client import IntelliOpticsAsyncClient, IntelliOpticsClient
-from .messaging import InferenceAnswer, InferenceJobMessage, InferenceResultMessage
+from .client import BatchSubmitError, IntelliOpticsAsyncClient, IntelliOpticsClient
+from .dedup import DedupStats, FrameDeduplicator
+from .messaging import InferenceAnswer, InferenceJobMessage, InferenceResultBatch, InferenceResultMessage
 from .models import (
     AlertEvent,
     Detector,
     DetectorCreate,
+    FrameOutcome,
+    FrameSubmission,
     ImageQuery,
     ImageQueryResult,
+    ImageQuerySubmission,
     parse_alerts,
     parse_detectors,
 )
+from .pooling import PoolOptions, PoolStats
+from .resilience import CircuitBreaker, CircuitOpenError, ResilienceStats, RetryPolicy
+from .scheduling import DeadlineJobSource, DeadlineScheduler, SchedulerStats
+from .transport import InMemoryBroker, SQLiteBroker, Transport
 
 __all__ = [
     "IntelliOpticsAsyncClient",
     "IntelliOpticsClient",
+    "BatchSubmitError",
+    "DedupStats",
+    "FrameDeduplicator",
     "Detector",
     "DetectorCreate",
+    "FrameOutcome",
+    "FrameSubmission",
     "ImageQuery",
     "ImageQueryResult",
+    "ImageQuerySubmission",
     "AlertEvent",
     "parse_detectors",
     "parse_alerts",
     "InferenceAnswer",
     "InferenceJobMessage",
+    "InferenceResultBatch",
     "InferenceResultMessage",
+    "PoolOptions",
+    "PoolStats",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ResilienceStats",
+    "Transport",
+    "InMemoryBroker",
+    "SQLiteBroker",
+    "DeadlineJobSource",
+    "DeadlineScheduler",
+    "SchedulerStats",
 ]
 
 __version__ = "0.1.0"
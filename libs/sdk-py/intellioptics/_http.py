@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping, MutableMapping
+import time
+from typing import Any, Iterable, Mapping, MutableMapping, Optional
+from urllib.parse import urlsplit
 
 import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 from .errors import IntelliOpticsClientError
+from .pooling import PoolOptions, PoolStats, PoolWaitRecorder, pooled_client_options
+from .resilience import (
+    AsyncResilientTransport,
+    CircuitBreaker,
+    Resilience,
+    ResilienceStats,
+    RetryPolicy,
+)
 
 
 _DEFAULT_TIMEOUT = 30.0
+_DEFAULT_POOL_CONNECTIONS = 10
+_DEFAULT_POOL_MAXSIZE = 10
 
 
 def _build_url(base: str, path: str) -> str:
@@ -21,6 +35,15 @@ def _build_url(base: str, path: str) -> str:
     return f"{base.rstrip('/')}{path}"
 
 
+def _unsent(exc: requests.RequestException) -> bool:
+    """Return whether ``exc`` was raised before the request reached the server."""
+
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
 class HttpClient:
     """Synchronous HTTP wrapper around :mod:`requests`."""
 
@@ -31,6 +54,11 @@ class HttpClient:
         *,
         verify: bool = True,
         timeout: float = _DEFAULT_TIMEOUT,
+        pool_connections: int = _DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         if not base_url:
             raise IntelliOpticsClientError("Missing INTELLIOPTICS_ENDPOINT")
@@ -39,9 +67,20 @@ class HttpClient:
         self.verify = verify
         self.timeout = timeout
         self._session = requests.Session()
+        # ``pool_connections`` is the number of hosts kept pooled, ``pool_maxsize``
+        # the connections kept per host; ``pool_block`` waits for a free one
+        # instead of opening a throwaway connection past the limit.
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._resilience = Resilience(retry, circuit_breaker)
         self._session.headers.update({"Authorization": f"Bearer {api_token}"})
         self.headers = self._session.headers
 
+    @property
+    def resilience_stats(self) -> ResilienceStats:
+        return self._resilience.stats
+
     # ------------------------------------------------------------------
     # Low level helpers
     # ------------------------------------------------------------------
@@ -60,14 +99,43 @@ class HttpClient:
         **kwargs: Any,
     ) -> requests.Response:
         url = _build_url(self.base, path)
-        response = self._session.request(
-            method.upper(),
-            url,
-            timeout=self.timeout,
-            verify=self.verify,
-            headers=self._merge_headers(headers),
-            **kwargs,
-        )
+        merged_headers = self._merge_headers(headers)
+        host = urlsplit(url).hostname or ""
+        attempt = 0
+        while True:
+            probe = self._resilience.check(host)
+            try:
+                response = self._session.request(
+                    method.upper(),
+                    url,
+                    timeout=self.timeout,
+                    verify=self.verify,
+                    headers=merged_headers,
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                self._resilience.record(host, failed=True)
+                delay = self._resilience.retry_delay(attempt, method, merged_headers, sent=not _unsent(exc))
+                if delay is None:
+                    raise
+            except BaseException:
+                if probe:
+                    self._resilience.release_probe(host)
+                raise
+            else:
+                self._resilience.record(host, failed=response.status_code >= 500)
+                delay = self._resilience.retry_delay(
+                    attempt,
+                    method,
+                    merged_headers,
+                    status=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    break
+                response.close()
+            time.sleep(delay)
+            attempt += 1
 
         if not response.ok:
             content = response.text.strip()
@@ -120,17 +188,39 @@ class AsyncHttpClient:
         *,
         verify: bool = True,
         timeout: float = _DEFAULT_TIMEOUT,
+        pool: PoolOptions | None = None,
+        share_pool: bool = False,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         if not base_url:
             raise IntelliOpticsClientError("Missing INTELLIOPTICS_ENDPOINT")
 
+        self._pool_waits = PoolWaitRecorder()
+        self._resilience = Resilience(retry, circuit_breaker)
+        pooling = pooled_client_options(
+            pool,
+            share=share_pool,
+            recorder=self._pool_waits,
+            asynchronous=True,
+            verify=verify,
+            wrap=lambda inner: AsyncResilientTransport(inner, self._resilience),
+        )
         self._client = httpx.AsyncClient(
             base_url=base_url.rstrip("/"),
             timeout=timeout,
-            verify=verify,
             headers={"Authorization": f"Bearer {api_token}"},
+            **pooling,
         )
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        return self._pool_waits.stats
+
+    @property
+    def resilience_stats(self) -> ResilienceStats:
+        return self._resilience.stats
+
     async def _merge_headers(self, headers: Mapping[str, str] | None) -> MutableMapping[str, str]:
         combined: MutableMapping[str, str] = dict(self._client.headers)
         if headers:
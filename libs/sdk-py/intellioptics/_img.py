@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from importlib import import_module
 from importlib.util import find_spec
 from io import BufferedIOBase, BytesIO
 from pathlib import Path
-from typing import IO, Any, Union, TYPE_CHECKING
+from typing import IO, Any, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from PIL.Image import Image as PILImage
     from numpy import ndarray
+
+    from ._upload import UploadSource
 else:  # pragma: no cover - runtime fallback types
     PILImage = Any  # type: ignore[assignment]
     ndarray = Any  # type: ignore[assignment]
@@ -18,22 +24,93 @@ else:  # pragma: no cover - runtime fallback types
 _pil_image_module = import_module("PIL.Image") if find_spec("PIL.Image") else None
 _numpy_module = import_module("numpy") if find_spec("numpy") else None
 
-ImageLike = Union[str, bytes, bytearray, IO[bytes], BufferedIOBase, PILImage, ndarray]
+ImageLike = Union[
+    str, bytes, bytearray, memoryview, mmap.mmap, IO[bytes], BufferedIOBase, PILImage, ndarray
+]
+
+DEFAULT_JPEG_QUALITY = 95
+JPEG_HEADER_PROBE_SIZE = 64 * 1024
+
+# Start-of-frame markers carry the image dimensions; DHT (C4), JPG (C8) and
+# DAC (CC) share the range but do not.
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without a length field.
+_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+_local = threading.local()
+_batch_executor: Optional[ThreadPoolExecutor] = None
+_batch_executor_lock = threading.Lock()
 
 
-def _looks_like_jpeg(data: bytes) -> bool:
+def _looks_like_jpeg(data: Union[bytes, memoryview]) -> bool:
     return len(data) >= 2 and data[0:2] == b"\xff\xd8"
 
 
-def _ensure_jpeg_bytes(data: bytes) -> bytes:
+def jpeg_dimensions(data: Union[bytes, memoryview]) -> Optional[Tuple[int, int]]:
+    """Return ``(width, height)`` read from a JPEG header, without decoding the image.
+
+    ``None`` is returned when ``data`` is not a JPEG or the start-of-frame
+    segment is not within ``data``, e.g. a truncated header probe.
+    """
+
+    if not _looks_like_jpeg(data):
+        return None
+    position, end = 2, len(data)
+    while position + 4 <= end:
+        if data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        if marker == 0xFF:  # fill byte
+            position += 1
+            continue
+        if marker in _STANDALONE_MARKERS:
+            position += 2
+            continue
+        if marker in _SOF_MARKERS:
+            if position + 9 > end:
+                return None
+            height = (data[position + 5] << 8) | data[position + 6]
+            width = (data[position + 7] << 8) | data[position + 8]
+            return width, height
+        if marker == 0xDA:  # start of scan without a frame header
+            return None
+        position += 2 + ((data[position + 2] << 8) | data[position + 3])
+    return None
+
+
+def _fit_within(size: Tuple[int, int], max_dimension: Optional[int]) -> Optional[Tuple[int, int]]:
+    """Return the size scaled down so its long side is ``max_dimension``, or ``None`` if it fits."""
+
+    width, height = size
+    if max_dimension is None or max(width, height) <= max_dimension:
+        return None
+    scale = max_dimension / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _ensure_jpeg_bytes(
+    data: Union[bytes, memoryview],
+    *,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    subsampling: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> bytes:
     if _looks_like_jpeg(data):
-        return data
+        dimensions = jpeg_dimensions(data) if max_dimension is not None else None
+        if max_dimension is None or (dimensions is not None and _fit_within(dimensions, max_dimension) is None):
+            return bytes(data)
 
     if _pil_image_module is None:
         raise RuntimeError("Pillow is required to convert non-JPEG inputs to JPEG")
 
     with _pil_image_module.open(BytesIO(data)) as pil_image:  # type: ignore[attr-defined]
-        return _encode_with_pillow(pil_image)
+        target = _fit_within(pil_image.size, max_dimension)
+        if target is not None and pil_image.format == "JPEG":
+            # Let libjpeg decode at a reduced DCT scale instead of full resolution.
+            pil_image.draft("RGB", target)
+        return _encode_with_pillow(
+            pil_image, quality=quality, subsampling=subsampling, max_dimension=max_dimension
+        )
 
 
 def _read_file_like(stream: Any) -> bytes:
@@ -50,52 +127,257 @@ def _read_file_like(stream: Any) -> bytes:
     return data
 
 
-def _encode_with_pillow(pil_image: Any) -> bytes:
-    buffer = BytesIO()
-    pil_image.convert("RGB").save(buffer, format="JPEG", quality=95)
-    return buffer.getvalue()
+def _output_buffer() -> BytesIO:
+    """Return this thread's reusable encode buffer, rewound to the start.
 
+    The buffer is overwritten rather than truncated so its allocation is kept
+    between frames; callers copy out only the bytes written.
+    """
 
-def _encode_numpy(array: Any) -> bytes:
-    if _numpy_module is None:
-        raise RuntimeError("numpy is required to encode numpy arrays to JPEG")
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None:
+        buffer = _local.buffer = BytesIO()
+    buffer.seek(0)
+    return buffer
+
+
+def _encode_with_pillow(
+    pil_image: Any,
+    *,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    subsampling: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> bytes:
+    if pil_image.mode != "RGB":
+        pil_image = pil_image.convert("RGB")
+    target = _fit_within(pil_image.size, max_dimension)
+    if target is not None:
+        pil_image = pil_image.resize(target, reducing_gap=2.0)
+    options: dict = {"quality": quality}
+    if subsampling is not None:
+        options["subsampling"] = subsampling
+    buffer = _output_buffer()
+    pil_image.save(buffer, format="JPEG", **options)
+    size = buffer.tell()
+    with buffer.getbuffer() as view:
+        return bytes(view[:size])
 
-    if array.ndim not in (2, 3):
+
+def _validate_frame_shape(ndim: int, shape: Sequence[int]) -> None:
+    if ndim not in (2, 3):
         raise ValueError("numpy array must have 2 or 3 dimensions")
-    if array.ndim == 3 and array.shape[2] not in (1, 3):
+    if ndim == 3 and shape[2] not in (1, 3):
         raise ValueError("numpy array must have shape (H, W, 3) or (H, W, 1)")
+
+
+def _as_uint8(array: Any) -> Any:
+    return array if array.dtype == _numpy_module.uint8 else array.astype("uint8")  # type: ignore[union-attr]
+
+
+def _encode_frame(
+    frame: Any,
+    *,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    subsampling: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> bytes:
+    """Encode a validated ``uint8`` ``(H, W)``/``(H, W, 1)``/``(H, W, 3)`` array."""
+
     if _pil_image_module is None:
         raise RuntimeError("Pillow is required to encode numpy arrays to JPEG")
+    if frame.ndim == 3 and frame.shape[2] == 1:
+        frame = frame[:, :, 0]
+    image = _pil_image_module.fromarray(frame)
+    return _encode_with_pillow(image, quality=quality, subsampling=subsampling, max_dimension=max_dimension)
 
-    if array.ndim == 3 and array.shape[2] == 3:
-        rgb = array.astype("uint8")
-    else:  # grayscale
-        rgb = array.squeeze().astype("uint8")
 
-    image = _pil_image_module.fromarray(rgb)
-    return _encode_with_pillow(image)
+def _encode_numpy(
+    array: Any,
+    *,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    subsampling: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> bytes:
+    if _numpy_module is None:
+        raise RuntimeError("numpy is required to encode numpy arrays to JPEG")
+
+    _validate_frame_shape(array.ndim, array.shape)
+    if _pil_image_module is None:
+        raise RuntimeError("Pillow is required to encode numpy arrays to JPEG")
+
+    return _encode_frame(_as_uint8(array), quality=quality, subsampling=subsampling, max_dimension=max_dimension)
 
 
-def to_jpeg_bytes(image: ImageLike) -> bytes:
-    """Normalise supported image inputs into a JPEG byte payload."""
+def to_jpeg_bytes(
+    image: ImageLike,
+    *,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    subsampling: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> bytes:
+    """Normalise supported image inputs into a JPEG byte payload.
+
+    ``quality`` and ``subsampling`` (Pillow's ``0`` = 4:4:4, ``1`` = 4:2:2,
+    ``2`` = 4:2:0) apply whenever the input has to be encoded. With
+    ``max_dimension`` set, images whose long side is larger are downscaled to
+    it before encoding. Inputs that are already JPEG and small enough, judged
+    from their header alone, are passed through untouched.
+    """
+
+    options: dict = {"quality": quality, "subsampling": subsampling, "max_dimension": max_dimension}
 
     pil_image_class = getattr(_pil_image_module, "Image", None)
     if pil_image_class is not None and isinstance(image, pil_image_class):
-        return _encode_with_pillow(image)
+        return _encode_with_pillow(image, **options)
 
     ndarray_class = getattr(_numpy_module, "ndarray", None)
     if ndarray_class is not None and isinstance(image, ndarray_class):
-        return _encode_numpy(image)
+        return _encode_numpy(image, **options)
+
+    if isinstance(image, bytes):
+        return _ensure_jpeg_bytes(image, **options)
 
-    if isinstance(image, (bytes, bytearray)):
-        return _ensure_jpeg_bytes(bytes(image))
+    if isinstance(image, (bytearray, memoryview, mmap.mmap)):
+        with memoryview(image) as view:
+            return _ensure_jpeg_bytes(view, **options)
 
     if hasattr(image, "read") and callable(image.read):  # file-like object
         data = _read_file_like(image)
-        return _ensure_jpeg_bytes(data)
+        return _ensure_jpeg_bytes(data, **options)
 
     if isinstance(image, (str, Path)):
         data = Path(image).read_bytes()
-        return _ensure_jpeg_bytes(data)
+        return _ensure_jpeg_bytes(data, **options)
 
     raise TypeError("Unsupported image type")
+
+
+def _hash_pixels(pil_image: Any, hash_size: int) -> int:
+    box = _pil_image_module.Resampling.BOX  # type: ignore[union-attr]
+    grey = pil_image.convert("L").resize((hash_size + 1, hash_size), box)
+    pixels = _numpy_module.asarray(grey)  # type: ignore[union-attr]
+    bits = pixels[:, 1:] > pixels[:, :-1]
+    return int.from_bytes(_numpy_module.packbits(bits).tobytes(), "big")  # type: ignore[union-attr]
+
+
+def perceptual_hash(image: ImageLike, *, hash_size: int = 8) -> int:
+    """Return the difference hash (dHash) of ``image`` as a ``hash_size ** 2`` bit integer.
+
+    The frame is reduced to a ``(hash_size + 1) x hash_size`` greyscale
+    thumbnail and each bit records whether a pixel is brighter than its left
+    neighbour, so near-identical frames differ in only a few bits. JPEG inputs
+    are decoded at a reduced DCT scale, which keeps hashing a 4K frame cheap.
+    """
+
+    if _pil_image_module is None or _numpy_module is None:
+        raise RuntimeError("Pillow and numpy are required to hash images")
+
+    pil_image_class = getattr(_pil_image_module, "Image", None)
+    if pil_image_class is not None and isinstance(image, pil_image_class):
+        return _hash_pixels(image, hash_size)
+
+    if isinstance(image, _numpy_module.ndarray):
+        _validate_frame_shape(image.ndim, image.shape)
+        frame = _as_uint8(image)
+        if frame.ndim == 3 and frame.shape[2] == 1:
+            frame = frame[:, :, 0]
+        return _hash_pixels(_pil_image_module.fromarray(frame), hash_size)
+
+    if isinstance(image, (bytes, bytearray, memoryview, mmap.mmap)):
+        stream: Any = BytesIO(image)
+    elif hasattr(image, "read") and callable(image.read):
+        stream = BytesIO(_read_file_like(image))
+    elif isinstance(image, (str, Path)):
+        stream = Path(image)
+    else:
+        raise TypeError("Unsupported image type")
+
+    with _pil_image_module.open(stream) as pil_image:
+        if pil_image.format == "JPEG":
+            pil_image.draft("L", (hash_size * 8, hash_size * 8))
+        return _hash_pixels(pil_image, hash_size)
+
+
+def _peek_header(stream: Any) -> Optional[bytes]:
+    """Read the first bytes of a seekable stream without moving its position."""
+
+    try:
+        position = stream.tell()
+        header = stream.read(JPEG_HEADER_PROBE_SIZE)
+        stream.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return header if isinstance(header, bytes) else None
+
+
+def fit_upload(
+    source: "UploadSource", *, max_dimension: int, quality: int = DEFAULT_JPEG_QUALITY
+) -> "UploadSource":
+    """Return ``source`` downscaled so its long side is at most ``max_dimension``.
+
+    JPEG buffers and seekable files whose header already reports a small
+    enough frame are returned as-is, so they keep the zero-copy upload path;
+    anything else is decoded, resized and re-encoded at ``quality``.
+    """
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        with memoryview(source) as view:
+            dimensions = jpeg_dimensions(view[:JPEG_HEADER_PROBE_SIZE])
+    elif hasattr(source, "read") and callable(source.read):
+        header = _peek_header(source)
+        dimensions = jpeg_dimensions(header) if header is not None else None
+    else:
+        raise TypeError("Unsupported upload type")
+
+    if dimensions is not None and _fit_within(dimensions, max_dimension) is None:
+        return source
+    return to_jpeg_bytes(source, quality=quality, max_dimension=max_dimension)
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="intellioptics-jpeg"
+            )
+        return _batch_executor
+
+
+def to_jpeg_bytes_batch(
+    frames: Union[ndarray, Sequence[ImageLike]],
+    *,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    subsampling: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[bytes]:
+    """Encode many frames to JPEG in parallel, returning payloads in input order.
+
+    ``frames`` is either a stacked ``(N, H, W)``/``(N, H, W, C)`` numpy array,
+    which is validated and converted to ``uint8`` once for the whole batch, or
+    a sequence of anything :func:`to_jpeg_bytes` accepts. Pillow releases the
+    GIL while encoding, so the default shared thread pool (one worker per CPU)
+    scales across cores; pass ``executor`` to use a specific pool instead,
+    including a :class:`~concurrent.futures.ProcessPoolExecutor`. Each worker
+    thread reuses its own output buffer between frames.
+    """
+
+    options: dict = {"quality": quality, "subsampling": subsampling, "max_dimension": max_dimension}
+
+    ndarray_class = getattr(_numpy_module, "ndarray", None)
+    if ndarray_class is not None and isinstance(frames, ndarray_class):
+        _validate_frame_shape(frames.ndim - 1, frames.shape[1:])
+        stacked = _as_uint8(frames)
+        items: Sequence[Any] = [stacked[index] for index in range(stacked.shape[0])]
+        encode: Any = _encode_frame
+    else:
+        items = list(frames)
+        encode = to_jpeg_bytes
+
+    if len(items) <= 1:
+        return [encode(item, **options) for item in items]
+
+    pool = executor if executor is not None else _shared_executor()
+    futures = [pool.submit(encode, item, **options) for item in items]
+    return [future.result() for future in futures]
@@ -0,0 +1,72 @@
+"""Zero-copy upload bodies for the IntelliOptics SDK."""
+
+from __future__ import annotations
+
+import mmap
+from contextlib import contextmanager
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedIOBase
+from typing import IO, Iterator, Union
+
+UploadSource = Union[bytes, bytearray, memoryview, mmap.mmap, IO[bytes], BufferedIOBase]
+
+
+class _BufferReader:
+    """Read-only, seekable file view over a buffer that hands out zero-copy slices.
+
+    ``httpx`` streams multipart file fields by calling ``read()`` in fixed-size
+    chunks and measures them with ``seek``/``tell``, so wrapping a buffer in
+    this reader uploads it without ever materialising a ``bytes`` copy.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view.cast("B") if view.format != "B" or view.ndim != 1 else view
+        self._position = 0
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        chunk = self._view[self._position : end]
+        self._position = end
+        return chunk
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, min(offset, len(self._view)))
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._view.release()
+
+
+@contextmanager
+def upload_body(source: UploadSource) -> Iterator[Union[bytes, IO[bytes], _BufferReader]]:
+    """Yield ``source`` in a form ``httpx`` can stream into a multipart body without copying.
+
+    ``bytes`` and open binary file handles are yielded unchanged; ``httpx``
+    reads the latter in 64 KiB chunks. ``bytearray``, ``memoryview`` and
+    ``mmap`` objects are exposed through a reader of memoryview slices whose
+    export is released on exit, so an ``mmap`` can be closed afterwards.
+    """
+
+    if isinstance(source, bytes):
+        yield source
+        return
+
+    if isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        reader = _BufferReader(memoryview(source))
+        try:
+            yield reader
+        finally:
+            reader.close()
+        return
+
+    if hasattr(source, "read") and callable(source.read):
+        yield source
+        return
+
+    raise TypeError("Unsupported upload type")
@@ -3,28 +3,299 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import mmap
+import threading
 import time
-from typing import Awaitable, Callable, Optional, Sequence
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import httpx
 
+from ._upload import UploadSource, upload_body
+from .dedup import FrameDeduplicator
+from .pooling import PoolOptions, PoolStats, PoolWaitRecorder, pooled_client_options
+from .resilience import (
+    AsyncResilientTransport,
+    CircuitBreaker,
+    Resilience,
+    ResilienceStats,
+    ResilientTransport,
+    RetryPolicy,
+)
 from .models import (
     AlertEvent,
     Detector,
     DetectorCreate,
+    FrameOutcome,
+    FrameSubmission,
     ImageQuery,
     ImageQueryResult,
+    ImageQuerySubmission,
     parse_alerts,
     parse_detectors,
 )
 
 USER_AGENT = "intellioptics-sdk/0.1"
+BATCH_SUBMIT_LIMIT = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+ETAG_CACHE_SIZE = 256
+PIPELINE_CONCURRENCY = 64
+LONG_POLL_SECONDS = 10.0
+LONG_POLL_GRACE_SECONDS = 5.0
+MAX_POLL_INTERVAL_SECONDS = 8.0
 
 
 class IntelliOpticsError(RuntimeError):
     """Base error raised by the SDK."""
 
 
+class BatchSubmitError(IntelliOpticsError):
+    """Raised when some chunks of :meth:`submit_image_queries` failed after others were committed.
+
+    ``ids`` lines up with the submitted queries: each entry is the created image
+    query identifier, or ``None`` when that query's chunk failed. The first
+    chunk failure is chained as ``__cause__``.
+    """
+
+    def __init__(self, ids: List[Optional[str]]) -> None:
+        failed = sum(identifier is None for identifier in ids)
+        super().__init__(f"{failed} of {len(ids)} image queries were not submitted")
+        self.ids = ids
+
+
+class _ServerSentEventParser:
+    """Incremental parser for ``text/event-stream`` bodies."""
+
+    def __init__(self) -> None:
+        self._event = "message"
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[Tuple[str, str]]:
+        """Consume one line, returning ``(event, data)`` when an event is complete."""
+
+        if not line:
+            if not self._data:
+                self._event = "message"
+                return None
+            completed = (self._event, "\n".join(self._data))
+            self._event, self._data = "message", []
+            return completed
+        if line.startswith(":"):
+            return None
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        return None
+
+
+class _ConditionalCache:
+    """Remember ``ETag``-validated GET results so unchanged resources come back as ``304``.
+
+    Entries are keyed by path and query string and bounded to ``maxsize`` in LRU order;
+    a size of ``0`` disables conditional requests.  A cached value is handed to every
+    caller that gets a ``304`` for it, so ``parse`` must build immutable results (frozen
+    models and tuples, as :func:`parse_detectors` does).
+    """
+
+    def __init__(self, maxsize: int = ETAG_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return str(httpx.URL(path, params=params))
+
+    def headers(self, key: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        return {"If-None-Match": entry[0]} if entry is not None else {}
+
+    def evicted(self, key: str, response: httpx.Response) -> bool:
+        """Whether ``response`` is a ``304`` for an entry dropped since the request was sent."""
+
+        with self._lock:
+            return response.status_code == 304 and key not in self._entries
+
+    def resolve(self, key: str, response: httpx.Response, parse: Callable[[Any], Any]) -> Any:
+        """Return the cached value for a ``304`` or parse, remember and return a fresh body."""
+
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+            if entry is not None:
+                return entry[1]
+        response.raise_for_status()
+        value = parse(response.json())
+        etag = response.headers.get("ETag")
+        with self._lock:
+            if etag and self.maxsize > 0:
+                self._entries[key] = (etag, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.pop(key, None)
+        return value
+
+
+def _chunked(items: Sequence[ImageQuerySubmission], size: int) -> List[Sequence[ImageQuerySubmission]]:
+    if not 1 <= size <= BATCH_SUBMIT_LIMIT:
+        raise ValueError(f"chunk_size must be between 1 and {BATCH_SUBMIT_LIMIT}")
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _detector_filters(
+    page_size: int, is_active: Optional[bool], mode: Optional[str], name_prefix: Optional[str]
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"limit": page_size}
+    if is_active is not None:
+        params["is_active"] = "true" if is_active else "false"
+    if mode is not None:
+        params["mode"] = mode
+    if name_prefix is not None:
+        params["name_prefix"] = name_prefix
+    return params
+
+
+def _fit_image(image: UploadSource, max_dimension: Optional[int], quality: Optional[int]) -> UploadSource:
+    if max_dimension is None:
+        return image
+    from ._img import fit_upload  # deferred so plain uploads never import Pillow/numpy
+
+    if quality is None:
+        return fit_upload(image, max_dimension=max_dimension)
+    return fit_upload(image, max_dimension=max_dimension, quality=quality)
+
+
+def _prepare_frame(image: Any, max_dimension: Optional[int], quality: Optional[int]) -> UploadSource:
+    """Turn a :class:`FrameSubmission` image into an upload body; CPU-bound, run off the event loop."""
+
+    if isinstance(image, (bytes, bytearray, memoryview, mmap.mmap)) or callable(getattr(image, "read", None)):
+        return _fit_image(image, max_dimension, quality)
+    from ._img import to_jpeg_bytes  # deferred so plain uploads never import Pillow/numpy
+
+    if quality is None:
+        return to_jpeg_bytes(image, max_dimension=max_dimension)
+    return to_jpeg_bytes(image, max_dimension=max_dimension, quality=quality)
+
+
+async def _iterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _completed_result(payload: Dict[str, Any]) -> Optional[ImageQueryResult]:
+    """Return the answer from a ``/wait`` response, or ``None`` while it is pending.
+
+    Accepts the ``{"status", "result"}`` envelope as well as a bare image query.
+    """
+
+    if "status" in payload:
+        result = payload.get("result")
+        return ImageQueryResult.from_dict(result) if payload["status"] == "complete" and result else None
+    return ImageQueryResult.from_dict(payload) if payload.get("answer") else None
+
+
+def _stream_timeout(timeout: httpx.Timeout, read_timeout: Optional[float]) -> httpx.Timeout:
+    return httpx.Timeout(connect=timeout.connect, read=read_timeout, write=timeout.write, pool=timeout.pool)
+
+
+class _LongPollSchedule:
+    """Deadline and backoff bookkeeping shared by the long-polling wait methods.
+
+    Each request lets the server hold it for up to ``long_poll`` seconds and
+    the server returns as soon as an answer lands. If it answers "pending"
+    sooner than the current backoff (starting at ``poll_interval`` and
+    doubling up to ``max_poll_interval``), the caller sleeps for the rest of
+    it before asking again; after a full long-poll it asks again at once.
+    """
+
+    def __init__(self, *, timeout: float, poll_interval: float, long_poll: float, max_poll_interval: float) -> None:
+        self.deadline = time.monotonic() + timeout
+        self.poll_interval = poll_interval
+        self.long_poll = long_poll
+        self.max_poll_interval = max_poll_interval
+        self._backoff = poll_interval
+        self._started = 0.0
+        self._hold = 0.0
+
+    def begin(self) -> Dict[str, float]:
+        """Start a request and return its ``timeout``/``poll`` query parameters."""
+
+        self._started = time.monotonic()
+        self._hold = min(self.long_poll, max(0.0, self.deadline - self._started))
+        return {"timeout": self._hold, "poll": self.poll_interval}
+
+    def request_timeout(self, timeout: httpx.Timeout) -> httpx.Timeout:
+        return _stream_timeout(timeout, self._hold + LONG_POLL_GRACE_SECONDS)
+
+    def pause(self) -> Optional[float]:
+        """Return how long to sleep before the next request, or ``None`` past the deadline."""
+
+        now = time.monotonic()
+        if now >= self.deadline:
+            return None
+        pause = min(self._backoff - (now - self._started), self.deadline - now)
+        self._backoff = min(self._backoff * 2, self.max_poll_interval)
+        return max(pause, 0.0)
+
+
+class _WaitManyState:
+    """Answers collected by ``wait_for_image_queries`` across long-poll rounds."""
+
+    def __init__(self, query_ids: Sequence[str], mode: str) -> None:
+        if mode not in ("any", "all"):
+            raise ValueError("mode must be 'any' or 'all'")
+        self.query_ids = list(dict.fromkeys(query_ids))
+        self.mode = mode
+        self._results: Dict[str, ImageQueryResult] = {}
+
+    def payload(self) -> Dict[str, Any]:
+        pending = [query_id for query_id in self.query_ids if query_id not in self._results]
+        return {"ids": pending[:BATCH_SUBMIT_LIMIT], "mode": self.mode}
+
+    def update(self, payload: Dict[str, Any]) -> bool:
+        """Record the answers in a ``:wait`` response and return whether ``mode`` is satisfied."""
+
+        for item in payload.get("results", ()):
+            result = ImageQueryResult.from_dict(item)
+            self._results[result.id] = result
+        if self.mode == "any":
+            return bool(self._results)
+        return len(self._results) == len(self.query_ids)
+
+    def results(self) -> Dict[str, ImageQueryResult]:
+        return {query_id: self._results[query_id] for query_id in self.query_ids if query_id in self._results}
+
+
 class IntelliOpticsClient:
     """Synchronous client for interacting with the IntelliOptics API."""
 
@@ -35,16 +306,54 @@ class IntelliOpticsClient:
         *,
         timeout: float = 10.0,
         transport: Optional[httpx.BaseTransport] = None,
+        etag_cache_size: int = ETAG_CACHE_SIZE,
+        max_image_dimension: Optional[int] = None,
+        jpeg_quality: Optional[int] = None,
+        deduplicator: Optional[FrameDeduplicator] = None,
+        pool: Optional[PoolOptions] = None,
+        share_pool: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         headers = {"User-Agent": USER_AGENT}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
+        self._pool_waits = PoolWaitRecorder()
+        self._resilience = Resilience(retry, circuit_breaker)
+        pooling = pooled_client_options(
+            pool,
+            share=share_pool and transport is None,
+            recorder=self._pool_waits,
+            asynchronous=False,
+            transport=transport,
+            wrap=(
+                (lambda inner: ResilientTransport(inner, self._resilience))
+                if retry is not None or circuit_breaker is not None
+                else None
+            ),
+        )
         self._client = httpx.Client(
             base_url=base_url.rstrip("/"),
             timeout=timeout,
             headers=headers,
-            transport=transport,
+            **pooling,
         )
+        self._conditional = _ConditionalCache(etag_cache_size)
+        self._max_image_dimension = max_image_dimension
+        self._jpeg_quality = jpeg_quality
+        self.deduplicator = deduplicator
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """How long this client's requests waited for a pooled connection."""
+
+        return self._pool_waits.stats
+
+    @property
+    def resilience_stats(self) -> ResilienceStats:
+        """Retries, fail-fast rejections and circuit openings seen by this client."""
+
+        return self._resilience.stats
 
     def close(self) -> None:
         self._client.close()
@@ -58,9 +367,41 @@ class IntelliOpticsClient:
         raise IntelliOpticsError(f"Unexpected status from /health: {response.status_code}")
 
     def list_detectors(self) -> Sequence[Detector]:
-        response = self._client.get("/v1/detectors")
-        response.raise_for_status()
-        return parse_detectors(response.json())
+        """Return every detector, following ``X-Next-Cursor`` until the last page.
+
+        The first page is revalidated with ``If-None-Match``; use
+        :meth:`iter_detectors` to stop early or filter on the server.
+        """
+
+        first_page, response = self._get_conditional("/v1/detectors", parse_detectors)
+        detectors = list(first_page)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        while cursor:
+            response = self._client.get("/v1/detectors", params={"cursor": cursor})
+            response.raise_for_status()
+            detectors.extend(parse_detectors(response.json()))
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        return detectors
+
+    def iter_detectors(
+        self,
+        *,
+        page_size: int = 100,
+        is_active: Optional[bool] = None,
+        mode: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+    ) -> Iterator[Detector]:
+        """Lazily page through detectors, fetching the next page only when needed."""
+
+        params = _detector_filters(page_size, is_active, mode, name_prefix)
+        while True:
+            response = self._client.get("/v1/detectors", params=params)
+            response.raise_for_status()
+            yield from parse_detectors(response.json())
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return
+            params["cursor"] = cursor
 
     def create_detector(self, detector: DetectorCreate) -> Detector:
         response = self._client.post("/v1/detectors", json=detector.to_payload())
@@ -68,26 +409,91 @@ class IntelliOpticsClient:
         return Detector.from_dict(response.json())
 
     def get_detector(self, detector_id: str) -> Detector:
-        response = self._client.get(f"/v1/detectors/{detector_id}")
-        response.raise_for_status()
-        return Detector.from_dict(response.json())
+        """Fetch a detector, revalidating a previously fetched copy with ``If-None-Match``."""
+
+        detector, _ = self._get_conditional(f"/v1/detectors/{detector_id}", Detector.from_dict)
+        return detector
+
+    def _get_conditional(self, path: str, parse: Callable[[Any], Any]) -> Tuple[Any, httpx.Response]:
+        key = self._conditional.key(path)
+        response = self._client.get(path, headers=self._conditional.headers(key))
+        if self._conditional.evicted(key, response):
+            response = self._client.get(path)
+        return self._conditional.resolve(key, response, parse), response
 
     def submit_image_query(
         self,
         detector_id: str,
         *,
-        image_bytes: Optional[bytes] = None,
+        image_bytes: Optional[UploadSource] = None,
         snapshot_url: Optional[str] = None,
+        rtsp_source_id: Optional[str] = None,
+        max_dimension: Optional[int] = None,
+        jpeg_quality: Optional[int] = None,
     ) -> ImageQuery:
+        """Submit an image query, streaming ``image_bytes`` into the multipart body.
+
+        ``image_bytes`` may be ``bytes``, ``bytearray``, ``memoryview``, ``mmap`` or
+        an open binary file; none of them are copied into an intermediate buffer.
+        ``max_dimension`` and ``jpeg_quality`` override the client's resize
+        settings for this call. With a ``deduplicator`` configured, a frame that
+        nearly matches a recent one for the same detector and stream returns
+        the earlier image query without uploading.
+        """
+
         payload = {"detector_id": detector_id}
-        files = None
-        if image_bytes is not None:
-            files = {"file": ("snapshot.jpg", image_bytes, "image/jpeg")}
         if snapshot_url is not None:
             payload["snapshot_url"] = snapshot_url
-        response = self._client.post("/v1/image-queries", data=payload, files=files)
+        if rtsp_source_id is not None:
+            payload["rtsp_source_id"] = rtsp_source_id
+        dedup_key = (detector_id, rtsp_source_id)
+        frame_hash = None
+        if image_bytes is not None and self.deduplicator is not None:
+            frame_hash = self.deduplicator.fingerprint(image_bytes)
+            reused = self.deduplicator.lookup(dedup_key, frame_hash)
+            if reused is not None:
+                return reused
+        if image_bytes is not None:
+            image_bytes = _fit_image(
+                image_bytes,
+                max_dimension if max_dimension is not None else self._max_image_dimension,
+                jpeg_quality if jpeg_quality is not None else self._jpeg_quality,
+            )
+        if image_bytes is None:
+            response = self._client.post("/v1/image-queries", data=payload)
+        else:
+            with upload_body(image_bytes) as body:
+                files = {"file": ("snapshot.jpg", body, "image/jpeg")}
+                response = self._client.post("/v1/image-queries", data=payload, files=files)
         response.raise_for_status()
-        return ImageQuery.from_dict(response.json())
+        image_query = ImageQuery.from_dict(response.json())
+        if frame_hash is not None and self.deduplicator is not None:
+            self.deduplicator.remember(dedup_key, frame_hash, image_query)
+        return image_query
+
+    def submit_image_queries(
+        self, queries: Sequence[ImageQuerySubmission], *, chunk_size: int = BATCH_SUBMIT_LIMIT
+    ) -> List[str]:
+        """Submit many image queries, splitting them into batch requests of ``chunk_size``.
+
+        Returns the created image query identifiers in submission order. If a
+        chunk fails, the chunks after it are not sent and :class:`BatchSubmitError`
+        reports the identifiers of the ones already committed.
+        """
+
+        ids: List[str] = []
+        for chunk in _chunked(queries, chunk_size):
+            try:
+                response = self._client.post(
+                    "/v1/image-queries:batch", json={"queries": [query.to_payload() for query in chunk]}
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                if not ids:
+                    raise
+                raise BatchSubmitError([*ids, *[None] * (len(queries) - len(ids))]) from exc
+            ids.extend(response.json()["ids"])
+        return ids
 
     def wait_for_image_query(
         self,
@@ -96,19 +502,99 @@ class IntelliOpticsClient:
         poll_interval: float = 1.0,
         timeout: float = 30.0,
         sleep_fn: Callable[[float], None] = time.sleep,
+        long_poll: float = LONG_POLL_SECONDS,
+        max_poll_interval: float = MAX_POLL_INTERVAL_SECONDS,
     ) -> ImageQueryResult:
-        deadline = time.monotonic() + timeout
+        """Wait for an answer, letting the server hold each request for up to ``long_poll`` seconds.
+
+        The server returns as soon as the answer lands. If it answers "pending"
+        sooner than the current backoff (starting at ``poll_interval`` and
+        doubling up to ``max_poll_interval``), the client sleeps for the rest
+        of it before asking again; after a full long-poll it asks again at once.
+        """
+
+        schedule = _LongPollSchedule(
+            timeout=timeout, poll_interval=poll_interval, long_poll=long_poll, max_poll_interval=max_poll_interval
+        )
         while True:
-            response = self._client.get(f"/v1/image-queries/{query_id}/wait")
+            response = self._client.get(
+                f"/v1/image-queries/{query_id}/wait",
+                params=schedule.begin(),
+                timeout=schedule.request_timeout(self._client.timeout),
+            )
             if response.status_code == 404:
                 raise IntelliOpticsError(f"Image query {query_id} not found")
             response.raise_for_status()
-            payload = response.json()
-            if payload.get("answer"):
-                return ImageQueryResult.from_dict(payload)
-            if time.monotonic() >= deadline:
+            result = _completed_result(response.json())
+            if result is not None:
+                return result
+            pause = schedule.pause()
+            if pause is None:
                 raise IntelliOpticsError("Timed out waiting for image query result")
-            sleep_fn(poll_interval)
+            if pause > 0:
+                sleep_fn(pause)
+
+    def wait_for_image_queries(
+        self,
+        query_ids: Sequence[str],
+        *,
+        mode: str = "any",
+        poll_interval: float = 1.0,
+        timeout: float = 30.0,
+        sleep_fn: Callable[[float], None] = time.sleep,
+        long_poll: float = LONG_POLL_SECONDS,
+        max_poll_interval: float = MAX_POLL_INTERVAL_SECONDS,
+    ) -> Dict[str, ImageQueryResult]:
+        """Wait until ``any`` or ``all`` of ``query_ids`` are answered, keyed by id in request order.
+
+        Each round is one long-polled ``POST /v1/image-queries:wait`` for the
+        ids still pending (at most ``BATCH_SUBMIT_LIMIT`` at a time), with the
+        same backoff as :meth:`wait_for_image_query`.
+        """
+
+        state = _WaitManyState(query_ids, mode)
+        if not state.query_ids:
+            return {}
+        schedule = _LongPollSchedule(
+            timeout=timeout, poll_interval=poll_interval, long_poll=long_poll, max_poll_interval=max_poll_interval
+        )
+        while True:
+            response = self._client.post(
+                "/v1/image-queries:wait",
+                params=schedule.begin(),
+                json=state.payload(),
+                timeout=schedule.request_timeout(self._client.timeout),
+            )
+            if response.status_code == 404:
+                raise IntelliOpticsError("Image query not found")
+            response.raise_for_status()
+            if state.update(response.json()):
+                return state.results()
+            pause = schedule.pause()
+            if pause is None:
+                raise IntelliOpticsError("Timed out waiting for image query results")
+            if pause > 0:
+                sleep_fn(pause)
+
+    def stream_answers(
+        self, detector_id: str, *, read_timeout: Optional[float] = None
+    ) -> Iterator[ImageQueryResult]:
+        """Yield answers for ``detector_id`` as they land over a single server-sent event stream."""
+
+        with self._client.stream(
+            "GET",
+            f"/v1/detectors/{detector_id}/answers/stream",
+            headers={"Accept": "text/event-stream"},
+            timeout=_stream_timeout(self._client.timeout, read_timeout),
+        ) as response:
+            if response.status_code == 404:
+                raise IntelliOpticsError(f"Detector {detector_id} not found")
+            response.raise_for_status()
+            parser = _ServerSentEventParser()
+            for line in response.iter_lines():
+                event = parser.feed(line)
+                if event is not None and event[0] == "answer":
+                    yield ImageQueryResult.from_dict(json.loads(event[1]))
 
     def recent_alerts(self, limit: int = 20) -> Sequence[AlertEvent]:
         response = self._client.get("/v1/alerts/events/recent", params={"limit": limit})
@@ -132,16 +618,54 @@ class IntelliOpticsAsyncClient:
         *,
         timeout: float = 10.0,
         transport: Optional[httpx.AsyncBaseTransport] = None,
+        etag_cache_size: int = ETAG_CACHE_SIZE,
+        max_image_dimension: Optional[int] = None,
+        jpeg_quality: Optional[int] = None,
+        deduplicator: Optional[FrameDeduplicator] = None,
+        pool: Optional[PoolOptions] = None,
+        share_pool: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         headers = {"User-Agent": USER_AGENT}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
+        self._pool_waits = PoolWaitRecorder()
+        self._resilience = Resilience(retry, circuit_breaker)
+        pooling = pooled_client_options(
+            pool,
+            share=share_pool and transport is None,
+            recorder=self._pool_waits,
+            asynchronous=True,
+            transport=transport,
+            wrap=(
+                (lambda inner: AsyncResilientTransport(inner, self._resilience))
+                if retry is not None or circuit_breaker is not None
+                else None
+            ),
+        )
         self._client = httpx.AsyncClient(
             base_url=base_url.rstrip("/"),
             timeout=timeout,
             headers=headers,
-            transport=transport,
+            **pooling,
         )
+        self._conditional = _ConditionalCache(etag_cache_size)
+        self._max_image_dimension = max_image_dimension
+        self._jpeg_quality = jpeg_quality
+        self.deduplicator = deduplicator
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """How long this client's requests waited for a pooled connection."""
+
+        return self._pool_waits.stats
+
+    @property
+    def resilience_stats(self) -> ResilienceStats:
+        """Retries, fail-fast rejections and circuit openings seen by this client."""
+
+        return self._resilience.stats
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -155,31 +679,226 @@ class IntelliOpticsAsyncClient:
         raise IntelliOpticsError(f"Unexpected status from /health: {response.status_code}")
 
     async def list_detectors(self) -> Sequence[Detector]:
-        response = await self._client.get("/v1/detectors")
-        response.raise_for_status()
-        return parse_detectors(response.json())
+        """Return every detector, following ``X-Next-Cursor`` until the last page.
+
+        The first page is revalidated with ``If-None-Match``; use
+        :meth:`iter_detectors` to stop early or filter on the server.
+        """
+
+        first_page, response = await self._get_conditional("/v1/detectors", parse_detectors)
+        detectors = list(first_page)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        while cursor:
+            response = await self._client.get("/v1/detectors", params={"cursor": cursor})
+            response.raise_for_status()
+            detectors.extend(parse_detectors(response.json()))
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        return detectors
+
+    async def iter_detectors(
+        self,
+        *,
+        page_size: int = 100,
+        is_active: Optional[bool] = None,
+        mode: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+    ) -> AsyncIterator[Detector]:
+        """Lazily page through detectors, fetching the next page only when needed."""
+
+        params = _detector_filters(page_size, is_active, mode, name_prefix)
+        while True:
+            response = await self._client.get("/v1/detectors", params=params)
+            response.raise_for_status()
+            for detector in parse_detectors(response.json()):
+                yield detector
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return
+            params["cursor"] = cursor
 
     async def create_detector(self, detector: DetectorCreate) -> Detector:
         response = await self._client.post("/v1/detectors", json=detector.to_payload())
         response.raise_for_status()
         return Detector.from_dict(response.json())
 
+    async def get_detector(self, detector_id: str) -> Detector:
+        """Fetch a detector, revalidating a previously fetched copy with ``If-None-Match``."""
+
+        detector, _ = await self._get_conditional(f"/v1/detectors/{detector_id}", Detector.from_dict)
+        return detector
+
+    async def _get_conditional(self, path: str, parse: Callable[[Any], Any]) -> Tuple[Any, httpx.Response]:
+        key = self._conditional.key(path)
+        response = await self._client.get(path, headers=self._conditional.headers(key))
+        if self._conditional.evicted(key, response):
+            response = await self._client.get(path)
+        return self._conditional.resolve(key, response, parse), response
+
     async def submit_image_query(
         self,
         detector_id: str,
         *,
-        image_bytes: Optional[bytes] = None,
+        image_bytes: Optional[UploadSource] = None,
         snapshot_url: Optional[str] = None,
+        rtsp_source_id: Optional[str] = None,
+        max_dimension: Optional[int] = None,
+        jpeg_quality: Optional[int] = None,
     ) -> ImageQuery:
+        """Submit an image query, streaming ``image_bytes`` into the multipart body.
+
+        ``image_bytes`` may be ``bytes``, ``bytearray``, ``memoryview``, ``mmap`` or
+        an open binary file; none of them are copied into an intermediate buffer.
+        ``max_dimension`` and ``jpeg_quality`` override the client's resize
+        settings for this call. With a ``deduplicator`` configured, a frame that
+        nearly matches a recent one for the same detector and stream returns
+        the earlier image query without uploading. Fingerprinting and resizing
+        run on the loop's default thread pool.
+        """
+
         payload = {"detector_id": detector_id}
-        files = None
-        if image_bytes is not None:
-            files = {"file": ("snapshot.jpg", image_bytes, "image/jpeg")}
         if snapshot_url is not None:
             payload["snapshot_url"] = snapshot_url
-        response = await self._client.post("/v1/image-queries", data=payload, files=files)
+        if rtsp_source_id is not None:
+            payload["rtsp_source_id"] = rtsp_source_id
+        dedup_key = (detector_id, rtsp_source_id)
+        frame_hash = None
+        loop = asyncio.get_running_loop()
+        if image_bytes is not None and self.deduplicator is not None:
+            frame_hash = await loop.run_in_executor(None, self.deduplicator.fingerprint, image_bytes)
+            reused = self.deduplicator.lookup(dedup_key, frame_hash)
+            if reused is not None:
+                return reused
+        max_dimension = max_dimension if max_dimension is not None else self._max_image_dimension
+        if image_bytes is not None and max_dimension is not None:
+            image_bytes = await loop.run_in_executor(
+                None,
+                _fit_image,
+                image_bytes,
+                max_dimension,
+                jpeg_quality if jpeg_quality is not None else self._jpeg_quality,
+            )
+        if image_bytes is None:
+            response = await self._client.post("/v1/image-queries", data=payload)
+        else:
+            with upload_body(image_bytes) as body:
+                files = {"file": ("snapshot.jpg", body, "image/jpeg")}
+                response = await self._client.post("/v1/image-queries", data=payload, files=files)
         response.raise_for_status()
-        return ImageQuery.from_dict(response.json())
+        image_query = ImageQuery.from_dict(response.json())
+        if frame_hash is not None and self.deduplicator is not None:
+            self.deduplicator.remember(dedup_key, frame_hash, image_query)
+        return image_query
+
+    async def submit_image_queries(
+        self, queries: Sequence[ImageQuerySubmission], *, chunk_size: int = BATCH_SUBMIT_LIMIT
+    ) -> List[str]:
+        """Submit many image queries, sending the ``chunk_size`` batches concurrently.
+
+        Returns the created image query identifiers in submission order. If any
+        chunk fails after others were committed, :class:`BatchSubmitError`
+        reports the identifiers of the committed ones.
+        """
+
+        async def _submit(chunk: Sequence[ImageQuerySubmission]) -> List[str]:
+            response = await self._client.post(
+                "/v1/image-queries:batch", json={"queries": [query.to_payload() for query in chunk]}
+            )
+            response.raise_for_status()
+            return response.json()["ids"]
+
+        chunks = _chunked(queries, chunk_size)
+        batches = await asyncio.gather(*(_submit(chunk) for chunk in chunks), return_exceptions=True)
+        errors = [batch for batch in batches if isinstance(batch, BaseException)]
+        if not errors:
+            return [identifier for batch in batches for identifier in batch]  # type: ignore[union-attr]
+        if len(errors) == len(batches) or not all(isinstance(error, httpx.HTTPError) for error in errors):
+            raise errors[0]
+        ids: List[Optional[str]] = []
+        for chunk, batch in zip(chunks, batches):
+            ids.extend([None] * len(chunk) if isinstance(batch, BaseException) else batch)
+        raise BatchSubmitError(ids) from errors[0]
+
+    async def _submit_and_wait_one(
+        self,
+        index: int,
+        submission: FrameSubmission,
+        *,
+        poll_interval: float,
+        timeout: float,
+        encode_executor: Optional[Executor],
+    ) -> FrameOutcome:
+        image_query: Optional[ImageQuery] = None
+        try:
+            body = await asyncio.get_running_loop().run_in_executor(
+                encode_executor, _prepare_frame, submission.image, self._max_image_dimension, self._jpeg_quality
+            )
+            image_query = await self.submit_image_query(
+                submission.detector_id, image_bytes=body, rtsp_source_id=submission.rtsp_source_id
+            )
+            del body  # drop the encoded frame before the (long) wait
+            result = await self.wait_for_image_query(image_query.id, poll_interval=poll_interval, timeout=timeout)
+        except Exception as exc:  # noqa: BLE001 - reported on the outcome so the pipeline keeps going
+            return FrameOutcome(index=index, image_query=image_query, error=exc)
+        return FrameOutcome(index=index, image_query=image_query, result=result)
+
+    async def submit_and_wait_many(
+        self,
+        submissions: Union[Iterable[FrameSubmission], AsyncIterable[FrameSubmission]],
+        *,
+        concurrency: int = PIPELINE_CONCURRENCY,
+        poll_interval: float = 1.0,
+        timeout: float = 30.0,
+        encode_executor: Optional[Executor] = None,
+    ) -> AsyncIterator[FrameOutcome]:
+        """Encode, upload and wait on many frames, yielding outcomes as they complete.
+
+        At most ``concurrency`` submissions are in flight; the next one is only
+        pulled from ``submissions`` (which may be a lazy or async iterable) when
+        a slot frees up, so memory is bounded by ``concurrency`` frames no matter
+        how long the input is. Encoding and resizing run on ``encode_executor``
+        (the loop's default thread pool if ``None``) while other submissions
+        upload and wait. Failures are reported on :attr:`FrameOutcome.error`
+        rather than raised; outcomes carry the submission's input ``index``.
+        Closing the iterator early cancels the submissions still in flight.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        source = _iterate(submissions)
+        in_flight: Set["asyncio.Future[FrameOutcome]"] = set()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < concurrency:
+                    try:
+                        submission = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    in_flight.add(
+                        asyncio.ensure_future(
+                            self._submit_and_wait_one(
+                                index,
+                                submission,
+                                poll_interval=poll_interval,
+                                timeout=timeout,
+                                encode_executor=encode_executor,
+                            )
+                        )
+                    )
+                    index += 1
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
     async def wait_for_image_query(
         self,
@@ -188,19 +907,99 @@ class IntelliOpticsAsyncClient:
         poll_interval: float = 1.0,
         timeout: float = 30.0,
         sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        long_poll: float = LONG_POLL_SECONDS,
+        max_poll_interval: float = MAX_POLL_INTERVAL_SECONDS,
     ) -> ImageQueryResult:
-        deadline = time.monotonic() + timeout
+        """Wait for an answer, letting the server hold each request for up to ``long_poll`` seconds.
+
+        The server returns as soon as the answer lands. If it answers "pending"
+        sooner than the current backoff (starting at ``poll_interval`` and
+        doubling up to ``max_poll_interval``), the client sleeps for the rest
+        of it before asking again; after a full long-poll it asks again at once.
+        """
+
+        schedule = _LongPollSchedule(
+            timeout=timeout, poll_interval=poll_interval, long_poll=long_poll, max_poll_interval=max_poll_interval
+        )
         while True:
-            response = await self._client.get(f"/v1/image-queries/{query_id}/wait")
+            response = await self._client.get(
+                f"/v1/image-queries/{query_id}/wait",
+                params=schedule.begin(),
+                timeout=schedule.request_timeout(self._client.timeout),
+            )
             if response.status_code == 404:
                 raise IntelliOpticsError(f"Image query {query_id} not found")
             response.raise_for_status()
-            payload = response.json()
-            if payload.get("answer"):
-                return ImageQueryResult.from_dict(payload)
-            if time.monotonic() >= deadline:
+            result = _completed_result(response.json())
+            if result is not None:
+                return result
+            pause = schedule.pause()
+            if pause is None:
                 raise IntelliOpticsError("Timed out waiting for image query result")
-            await sleep_fn(poll_interval)
+            if pause > 0:
+                await sleep_fn(pause)
+
+    async def wait_for_image_queries(
+        self,
+        query_ids: Sequence[str],
+        *,
+        mode: str = "any",
+        poll_interval: float = 1.0,
+        timeout: float = 30.0,
+        sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        long_poll: float = LONG_POLL_SECONDS,
+        max_poll_interval: float = MAX_POLL_INTERVAL_SECONDS,
+    ) -> Dict[str, ImageQueryResult]:
+        """Wait until ``any`` or ``all`` of ``query_ids`` are answered, keyed by id in request order.
+
+        Each round is one long-polled ``POST /v1/image-queries:wait`` for the
+        ids still pending (at most ``BATCH_SUBMIT_LIMIT`` at a time), with the
+        same backoff as :meth:`wait_for_image_query`.
+        """
+
+        state = _WaitManyState(query_ids, mode)
+        if not state.query_ids:
+            return {}
+        schedule = _LongPollSchedule(
+            timeout=timeout, poll_interval=poll_interval, long_poll=long_poll, max_poll_interval=max_poll_interval
+        )
+        while True:
+            response = await self._client.post(
+                "/v1/image-queries:wait",
+                params=schedule.begin(),
+                json=state.payload(),
+                timeout=schedule.request_timeout(self._client.timeout),
+            )
+            if response.status_code == 404:
+                raise IntelliOpticsError("Image query not found")
+            response.raise_for_status()
+            if state.update(response.json()):
+                return state.results()
+            pause = schedule.pause()
+            if pause is None:
+                raise IntelliOpticsError("Timed out waiting for image query results")
+            if pause > 0:
+                await sleep_fn(pause)
+
+    async def stream_answers(
+        self, detector_id: str, *, read_timeout: Optional[float] = None
+    ) -> AsyncIterator[ImageQueryResult]:
+        """Async iterator over answers for ``detector_id`` from a server-sent event stream."""
+
+        async with self._client.stream(
+            "GET",
+            f"/v1/detectors/{detector_id}/answers/stream",
+            headers={"Accept": "text/event-stream"},
+            timeout=_stream_timeout(self._client.timeout, read_timeout),
+        ) as response:
+            if response.status_code == 404:
+                raise IntelliOpticsError(f"Detector {detector_id} not found")
+            response.raise_for_status()
+            parser = _ServerSentEventParser()
+            async for line in response.aiter_lines():
+                event = parser.feed(line)
+                if event is not None and event[0] == "answer":
+                    yield ImageQueryResult.from_dict(json.loads(event[1]))
 
     async def recent_alerts(self, limit: int = 20) -> Sequence[AlertEvent]:
         response = await self._client.get("/v1/alerts/events/recent", params={"limit": limit})
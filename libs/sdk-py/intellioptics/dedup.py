@@ -0,0 +1,94 @@
+"""Near-duplicate frame suppression for image query submissions."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Hashable, Optional, Tuple
+
+from .models import ImageQuery
+
+DEFAULT_MAX_DISTANCE = 4
+DEFAULT_HISTORY = 8
+
+
+@dataclass(frozen=True)
+class DedupStats:
+    """Counters describing how often submissions were answered from history."""
+
+    checked: int = 0
+    reused: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.checked if self.checked else 0.0
+
+
+class FrameDeduplicator:
+    """Remember recent frame hashes per detector and stream and match near-duplicates.
+
+    Each frame is reduced to a ``hash_size ** 2`` bit perceptual hash. A frame
+    whose hash is within ``max_distance`` differing bits of one of the last
+    ``history`` frames submitted for the same detector and stream reuses that
+    frame's :class:`ImageQuery` instead of being uploaded again. Requires
+    Pillow and numpy.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        history: int = DEFAULT_HISTORY,
+        hash_size: int = 8,
+    ) -> None:
+        if history < 1:
+            raise ValueError("history must be at least 1")
+        self.max_distance = max_distance
+        self.history = history
+        self.hash_size = hash_size
+        self._recent: Dict[Hashable, Deque[Tuple[int, ImageQuery]]] = {}
+        self._checked = 0
+        self._reused = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> DedupStats:
+        with self._lock:
+            return DedupStats(checked=self._checked, reused=self._reused)
+
+    def fingerprint(self, image: Any) -> int:
+        """Return the perceptual hash of ``image`` (any input ``to_jpeg_bytes`` accepts)."""
+
+        from ._img import perceptual_hash  # deferred so the SDK imports without Pillow/numpy
+
+        return perceptual_hash(image, hash_size=self.hash_size)
+
+    def lookup(self, key: Hashable, frame_hash: int) -> Optional[ImageQuery]:
+        """Return the most recent image query for ``key`` whose frame matches ``frame_hash``."""
+
+        with self._lock:
+            self._checked += 1
+            for previous_hash, image_query in reversed(self._recent.get(key, ())):
+                if bin(previous_hash ^ frame_hash).count("1") <= self.max_distance:
+                    self._reused += 1
+                    return image_query
+            return None
+
+    def remember(self, key: Hashable, frame_hash: int, image_query: ImageQuery) -> None:
+        """Record a submitted frame so later near-duplicates can reuse ``image_query``."""
+
+        with self._lock:
+            recent = self._recent.get(key)
+            if recent is None:
+                recent = self._recent[key] = deque(maxlen=self.history)
+            recent.append((frame_hash, image_query))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._checked = 0
+            self._reused = 0
+
+
+__all__ = ["DedupStats", "FrameDeduplicator"]
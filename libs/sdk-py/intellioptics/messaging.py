@@ -4,14 +4,33 @@ These types mirror the `inference-jobs` and `inference-results` topics used by
 the edge workers and cloud fallback processors.  They provide light-weight
 helpers for serialising payloads to and from dictionaries so the same schema
 can be reused by the API, edge apps, and any tooling built on top of the SDK.
+
+For high-rate topics the messages also have a compact, versioned binary
+encoding (``to_bytes``/``from_bytes`` and the batch helpers
+:func:`encode_many`/:func:`decode_many`). Every buffer starts with the
+``MAGIC`` bytes and a format version. Each message then carries a fixed-size
+part followed by its UTF-8 string fields back to back. The fixed-size part
+holds:
+
+* a one-byte type code and a flags byte marking which optional fields are set;
+* timestamps as signed 64-bit microseconds since the Unix epoch (decoded as
+  UTC, so the original offset is not preserved);
+* answers as one-byte enum codes and scores as 64-bit floats;
+* the byte length of every string field, unsigned 16-bit (32-bit for URLs and
+  the JSON-encoded ``trace``).
+
+All integers are little-endian. Batches add a 32-bit message count after the
+header.
 """
 
 from __future__ import annotations
 
+import json
+import struct
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 class InferenceAnswer(str, Enum):
@@ -44,6 +63,60 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     return _ensure_aware(parsed)
 
 
+MAGIC = b"IO"
+CODEC_VERSION = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_HEADER = struct.Struct("<2sB")
+_COUNT = struct.Struct("<I")
+# type, flags, deadline, then lengths of job_id, model_id, detector_id,
+# requested_by, image_blob_url, rtsp_ref and trace.
+_JOB_FIXED = struct.Struct("<BBqHHHHIII")
+# type, flags, answer, score, processed_at, then lengths of job_id and model_revision.
+_RESULT_FIXED = struct.Struct("<BBBdqHH")
+
+_JOB_TYPE = 1
+_RESULT_TYPE = 2
+
+_HAS_IMAGE_BLOB_URL = 0x01
+_HAS_RTSP_REF = 0x02
+_HAS_DEADLINE = 0x04
+_HAS_TRACE = 0x08
+_HAS_MODEL_REVISION = 0x01
+_HAS_PROCESSED_AT = 0x02
+
+
+class MessageDecodeError(ValueError):
+    """Raised when a buffer is not a supported binary message encoding."""
+
+
+def _to_micros(dt: datetime) -> int:
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    try:
+        return _EPOCH + timedelta(microseconds=value)
+    except OverflowError as exc:
+        raise MessageDecodeError(f"Timestamp {value} is out of range") from exc
+
+
+def _unpack_strs(buffer: bytes, offset: int, lengths: Tuple[int, ...]) -> Tuple[List[str], int]:
+    end = offset + sum(lengths)
+    if end > len(buffer):
+        raise MessageDecodeError("Truncated message")
+    values = []
+    try:
+        for size in lengths:
+            values.append(str(buffer[offset : offset + size], "utf-8"))
+            offset += size
+    except UnicodeDecodeError as exc:
+        raise MessageDecodeError("String field is not valid UTF-8") from exc
+    return values, end
+
+
 @dataclass(slots=True)
 class InferenceJobMessage:
     """Payload published to the `inference-jobs` topic."""
@@ -85,6 +158,61 @@ class InferenceJobMessage:
             trace=data.get("trace") or {},
         )
 
+    def to_bytes(self) -> bytes:
+        """Encode the message in the compact binary format described in the module docstring."""
+
+        parts = [_HEADER.pack(MAGIC, CODEC_VERSION)]
+        self._pack(parts)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InferenceJobMessage":
+        message = decode(data)
+        if not isinstance(message, cls):
+            raise MessageDecodeError("Buffer does not hold an inference job message")
+        return message
+
+    def _pack(self, parts: List[bytes]) -> None:
+        flags = (
+            (_HAS_IMAGE_BLOB_URL if self.image_blob_url is not None else 0)
+            | (_HAS_RTSP_REF if self.rtsp_ref is not None else 0)
+            | (_HAS_DEADLINE if self.deadline is not None else 0)
+            | (_HAS_TRACE if self.trace else 0)
+        )
+        deadline = _to_micros(self.deadline) if self.deadline is not None else 0
+        strings = [
+            self.job_id.encode(),
+            self.model_id.encode(),
+            self.detector_id.encode(),
+            self.requested_by.encode(),
+            (self.image_blob_url or "").encode(),
+            (self.rtsp_ref or "").encode(),
+            json.dumps(self.trace, separators=(",", ":")).encode() if self.trace else b"",
+        ]
+        parts.append(_JOB_FIXED.pack(_JOB_TYPE, flags, deadline, *map(len, strings)))
+        parts.extend(strings)
+
+    @classmethod
+    def _unpack(cls, buffer: bytes, offset: int) -> Tuple["InferenceJobMessage", int]:
+        _, flags, deadline, *lengths = _JOB_FIXED.unpack_from(buffer, offset)
+        strings, offset = _unpack_strs(buffer, offset + _JOB_FIXED.size, tuple(lengths))
+        job_id, model_id, detector_id, requested_by, image_blob_url, rtsp_ref, trace = strings
+        try:
+            decoded_trace = json.loads(trace) if flags & _HAS_TRACE else {}
+        except ValueError as exc:
+            raise MessageDecodeError("Trace is not valid JSON") from exc
+        message = cls(
+            job_id=job_id,
+            model_id=model_id,
+            detector_id=detector_id,
+            requested_by=requested_by,
+            image_blob_url=image_blob_url if flags & _HAS_IMAGE_BLOB_URL else None,
+            rtsp_ref=rtsp_ref if flags & _HAS_RTSP_REF else None,
+            deadline=_from_micros(deadline) if flags & _HAS_DEADLINE else None,
+            trace=decoded_trace,
+        )
+        return message, offset
+
 
 @dataclass(slots=True)
 class InferenceResultMessage:
@@ -118,3 +246,181 @@ class InferenceResultMessage:
             processed_at=_parse_datetime(data.get("processed_at")),
         )
 
+    def to_bytes(self) -> bytes:
+        """Encode the message in the compact binary format described in the module docstring."""
+
+        parts = [_HEADER.pack(MAGIC, CODEC_VERSION)]
+        self._pack(parts)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InferenceResultMessage":
+        message = decode(data)
+        if not isinstance(message, cls):
+            raise MessageDecodeError("Buffer does not hold an inference result message")
+        return message
+
+    def _pack(self, parts: List[bytes]) -> None:
+        flags = (_HAS_MODEL_REVISION if self.model_revision is not None else 0) | (
+            _HAS_PROCESSED_AT if self.processed_at is not None else 0
+        )
+        processed_at = _to_micros(self.processed_at) if self.processed_at is not None else 0
+        job_id = self.job_id.encode()
+        model_revision = (self.model_revision or "").encode()
+        parts.append(
+            _RESULT_FIXED.pack(
+                _RESULT_TYPE,
+                flags,
+                _ANSWER_CODES[self.answer],
+                self.score,
+                processed_at,
+                len(job_id),
+                len(model_revision),
+            )
+        )
+        parts.append(job_id)
+        parts.append(model_revision)
+
+    @classmethod
+    def _unpack(cls, buffer: bytes, offset: int) -> Tuple["InferenceResultMessage", int]:
+        _, flags, answer, score, processed_at, *lengths = _RESULT_FIXED.unpack_from(buffer, offset)
+        (job_id, model_revision), offset = _unpack_strs(buffer, offset + _RESULT_FIXED.size, tuple(lengths))
+        try:
+            decoded_answer = _ANSWERS_BY_CODE[answer]
+        except IndexError as exc:
+            raise MessageDecodeError(f"Unknown answer code {answer}") from exc
+        message = cls(
+            job_id=job_id,
+            answer=decoded_answer,
+            score=score,
+            model_revision=model_revision if flags & _HAS_MODEL_REVISION else None,
+            processed_at=_from_micros(processed_at) if flags & _HAS_PROCESSED_AT else None,
+        )
+        return message, offset
+
+
+# Codes are part of the wire format: append new answers, never reorder.
+_ANSWERS_BY_CODE: Tuple[InferenceAnswer, ...] = (InferenceAnswer.YES, InferenceAnswer.NO, InferenceAnswer.UNKNOWN)
+_ANSWER_CODES: Dict[InferenceAnswer, int] = {answer: code for code, answer in enumerate(_ANSWERS_BY_CODE)}
+
+Message = Union[InferenceJobMessage, InferenceResultMessage]
+
+_UNPACKERS: Dict[int, Callable[[bytes, int], Tuple[Any, int]]] = {
+    _JOB_TYPE: InferenceJobMessage._unpack,
+    _RESULT_TYPE: InferenceResultMessage._unpack,
+}
+
+
+def _check_header(buffer: bytes) -> int:
+    try:
+        magic, version = _HEADER.unpack_from(buffer, 0)
+    except struct.error as exc:
+        raise MessageDecodeError("Truncated message") from exc
+    if magic != MAGIC:
+        raise MessageDecodeError("Not a binary IntelliOptics message")
+    if version != CODEC_VERSION:
+        raise MessageDecodeError(f"Unsupported message encoding version {version}")
+    return _HEADER.size
+
+
+def _unpack_message(buffer: bytes, offset: int) -> Tuple[Message, int]:
+    if offset >= len(buffer):
+        raise MessageDecodeError("Truncated message")
+    unpack = _UNPACKERS.get(buffer[offset])
+    if unpack is None:
+        raise MessageDecodeError(f"Unknown message type {buffer[offset]}")
+    try:
+        return unpack(buffer, offset)
+    except struct.error as exc:
+        raise MessageDecodeError("Truncated message") from exc
+
+
+def decode(data: bytes) -> Message:
+    """Decode a single message produced by ``to_bytes``."""
+
+    message, offset = _unpack_message(data, _check_header(data))
+    if offset != len(data):
+        raise MessageDecodeError("Trailing bytes after message")
+    return message
+
+
+def encode_many(messages: Iterable[Message]) -> bytes:
+    """Encode jobs and/or results into one buffer: header, message count, then each message."""
+
+    parts = [b""]
+    count = 0
+    for message in messages:
+        message._pack(parts)
+        count += 1
+    parts[0] = _HEADER.pack(MAGIC, CODEC_VERSION) + _COUNT.pack(count)
+    return b"".join(parts)
+
+
+def decode_many(data: bytes) -> List[Message]:
+    """Decode a buffer produced by :func:`encode_many`, preserving message order."""
+
+    offset = _check_header(data)
+    try:
+        (count,) = _COUNT.unpack_from(data, offset)
+    except struct.error as exc:
+        raise MessageDecodeError("Truncated message") from exc
+    offset += _COUNT.size
+    messages: List[Message] = []
+    for _ in range(count):
+        message, offset = _unpack_message(data, offset)
+        messages.append(message)
+    if offset != len(data):
+        raise MessageDecodeError("Trailing bytes after messages")
+    return messages
+
+
+@dataclass(slots=True)
+class InferenceResultBatch:
+    """Envelope carrying many results in a single `inference-results` message.
+
+    Publishing results in batches lets consumers apply them with one bulk
+    write per batch instead of one per message.
+    """
+
+    results: List[InferenceResultMessage] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[InferenceResultMessage]:
+        return iter(self.results)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"results": [result.to_dict() for result in self.results]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InferenceResultBatch":
+        return cls(results=[InferenceResultMessage.from_dict(item) for item in data.get("results") or ()])
+
+    def to_bytes(self) -> bytes:
+        """Encode the batch with :func:`encode_many`."""
+
+        return encode_many(self.results)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InferenceResultBatch":
+        results = decode_many(data)
+        if not all(isinstance(result, InferenceResultMessage) for result in results):
+            raise MessageDecodeError("Result batch contains a message that is not an inference result")
+        return cls(results=results)  # type: ignore[arg-type]
+
+
+__all__ = [
+    "CODEC_VERSION",
+    "MAGIC",
+    "InferenceAnswer",
+    "InferenceJobMessage",
+    "InferenceResultBatch",
+    "InferenceResultMessage",
+    "Message",
+    "MessageDecodeError",
+    "decode",
+    "decode_many",
+    "encode_many",
+]
+
@@ -84,6 +84,21 @@ class ImageQuery:
         )
 
 
+@dataclass(frozen=True)
+class ImageQuerySubmission:
+    """A single entry of a batch image query submission."""
+
+    detector_id: str
+    snapshot_url: str
+    rtsp_source_id: Optional[str] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"detector_id": self.detector_id, "snapshot_url": self.snapshot_url}
+        if self.rtsp_source_id is not None:
+            payload["rtsp_source_id"] = self.rtsp_source_id
+        return payload
+
+
 @dataclass(frozen=True)
 class ImageQueryResult:
     """Final answer returned from the API when an image query completes."""
@@ -98,11 +113,38 @@ class ImageQueryResult:
         return cls(
             id=payload["id"],
             answer=payload.get("answer", "UNKNOWN"),
-            score=payload.get("score"),
+            score=payload.get("score", payload.get("answer_score")),
             processed_at=_parse_datetime(payload.get("processed_at")),
         )
 
 
+@dataclass(frozen=True)
+class FrameSubmission:
+    """A frame to submit through :meth:`IntelliOpticsAsyncClient.submit_and_wait_many`.
+
+    ``image`` is anything the upload path or ``to_jpeg_bytes`` accepts: encoded
+    bytes, a buffer, an open binary file, a path, a PIL image or a numpy array.
+    """
+
+    detector_id: str
+    image: Any
+    rtsp_source_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class FrameOutcome:
+    """Result of one :class:`FrameSubmission`, identified by its position in the input."""
+
+    index: int
+    image_query: Optional[ImageQuery] = None
+    result: Optional[ImageQueryResult] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 @dataclass(frozen=True)
 class AlertEvent:
     """Simplified alert event representation returned from the API."""
@@ -0,0 +1,298 @@
+"""Connection pool configuration, sharing and wait metrics for the SDK clients."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import threading
+import time
+from dataclasses import dataclass
+from urllib.request import getproxies
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+@dataclass(frozen=True)
+class PoolOptions:
+    """Connection pool settings for the ``httpx`` transports behind the clients.
+
+    ``http2`` multiplexes concurrent requests over one connection per host and
+    requires the ``h2`` package (``pip install intellioptics[http2]``).
+    """
+
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of how long requests waited for a pooled connection."""
+
+    requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class PoolWaitRecorder:
+    """Measure the time between sending a request and the pool handing it a connection.
+
+    ``httpcore`` emits no trace events while a request is queued for a
+    connection, so the first event it does emit (opening a new connection or
+    writing headers on a reused one) marks the end of the wait. The recorder is
+    installed as a ``request`` event hook and sets the ``trace`` extension.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(requests=self._requests, total_wait_seconds=self._total, max_wait_seconds=self._max)
+
+    def record(self, wait: float) -> None:
+        with self._lock:
+            self._requests += 1
+            self._total += wait
+            self._max = max(self._max, wait)
+
+    def _tracer(self) -> Callable[[str, Dict[str, Any]], None]:
+        started = self._clock()
+        pending = [True]
+
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if pending and event_name.endswith(".started"):
+                pending.clear()
+                self.record(self._clock() - started)
+
+        return trace
+
+    def request_hook(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._tracer()
+
+    async def async_request_hook(self, request: httpx.Request) -> None:
+        trace = self._tracer()
+
+        async def async_trace(event_name: str, info: Dict[str, Any]) -> None:
+            trace(event_name, info)
+
+        request.extensions["trace"] = async_trace
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Reference-counted view of a pooled transport shared between clients."""
+
+    def __init__(self, key: Tuple[Any, ...], transport: httpx.HTTPTransport) -> None:
+        self._key = key
+        self._transport = transport
+        self._closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            _release(self._key)
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`_SharedTransport`.
+
+    Async connections belong to the event loop that opened them, so the pool is
+    picked on the first request from those shared by clients on the same loop.
+    """
+
+    def __init__(self, options: PoolOptions, verify: Any) -> None:
+        self._options = options
+        self._verify = verify
+        self._key: Optional[Tuple[Any, ...]] = None
+        self._transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            options, verify = self._options, self._verify
+            self._key = ("async", options, verify, asyncio.get_running_loop())
+            self._transport = _acquire(
+                self._key,
+                lambda: httpx.AsyncHTTPTransport(limits=options.limits(), http2=options.http2, verify=verify),
+            )
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            if self._key is None:
+                return
+            transport = _release(self._key)
+            if transport is not None:
+                await transport.aclose()
+
+
+_shared: Dict[Tuple[Any, ...], Any] = {}
+_shared_counts: Dict[Tuple[Any, ...], int] = {}
+_shared_lock = threading.Lock()
+
+
+def _release(key: Tuple[Any, ...]) -> Optional[Any]:
+    """Drop one reference to a shared transport, closing it with the last one.
+
+    Sync transports are closed here; the last async transport is returned so
+    the caller can await its ``aclose()``.
+    """
+
+    with _shared_lock:
+        _shared_counts[key] -= 1
+        if _shared_counts[key]:
+            return None
+        del _shared_counts[key]
+        transport = _shared.pop(key)
+    if isinstance(transport, httpx.HTTPTransport):
+        transport.close()
+        return None
+    return transport
+
+
+def _acquire(key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+    with _shared_lock:
+        transport = _shared.get(key)
+        if transport is None:
+            transport = _shared[key] = factory()
+        _shared_counts[key] = _shared_counts.get(key, 0) + 1
+        return transport
+
+
+def shared_transport(options: PoolOptions, *, verify: Any = True) -> httpx.BaseTransport:
+    """Return a handle on the process-wide sync pool for ``options``.
+
+    Every client built with the same options and TLS settings reuses one set
+    of connections; the pool is closed when the last client using it closes.
+    """
+
+    key = ("sync", options, verify)
+    transport = _acquire(
+        key, lambda: httpx.HTTPTransport(limits=options.limits(), http2=options.http2, verify=verify)
+    )
+    return _SharedTransport(key, transport)
+
+
+def shared_async_transport(options: PoolOptions, *, verify: Any = True) -> httpx.AsyncBaseTransport:
+    """Async counterpart of :func:`shared_transport`.
+
+    Only clients running on the same event loop share connections; clients on
+    other loops, such as worker threads each calling ``asyncio.run``, get a
+    pool of their own.
+    """
+
+    return _SharedAsyncTransport(options, verify)
+
+
+def _no_proxy_pattern(host: str) -> str:
+    # Same NO_PROXY matching as clients built without a transport:
+    # ".example.com" skips subdomains only, "example.com" the domain too.
+    if "://" in host:
+        return host
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return f"all://{host}" if host.lower() == "localhost" else f"all://*{host}"
+    return f"all://[{host}]" if address.version == 6 else f"all://{host}"
+
+
+def _environment_proxies() -> Dict[str, Optional[str]]:
+    """Return the ``HTTP(S)_PROXY``/``ALL_PROXY``/``NO_PROXY`` mount patterns httpx would apply."""
+
+    proxies = getproxies()
+    mounts: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        proxy = proxies.get(scheme)
+        if proxy:
+            mounts[f"{scheme}://"] = proxy if "://" in proxy else f"http://{proxy}"
+    for host in (host.strip() for host in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if host:
+            mounts[_no_proxy_pattern(host)] = None
+    return mounts
+
+
+def pooled_client_options(
+    options: Optional[PoolOptions],
+    *,
+    share: bool,
+    recorder: PoolWaitRecorder,
+    asynchronous: bool,
+    verify: Any = True,
+    transport: Any = None,
+    wrap: Optional[Callable[[Any], Any]] = None,
+) -> Dict[str, Any]:
+    """Return the ``httpx.Client``/``AsyncClient`` keyword arguments for a pool configuration.
+
+    Unless a pool is shared or transports are wrapped (``wrap``, e.g. for
+    retries), the pool settings are passed as ``limits``/``http2`` so httpx
+    builds its transports itself and keeps honouring proxy environment
+    variables. Otherwise the transports are built here: the default one plus one
+    per proxy mount from the environment, each passed through ``wrap``. Proxied
+    connections are never shared between clients. An explicit ``transport`` is
+    used as is (wrapped if requested) and, as with httpx, disables environment
+    proxies.
+    """
+
+    options = options or PoolOptions()
+    hook: Callable[[httpx.Request], Any] = recorder.async_request_hook if asynchronous else recorder.request_hook
+    kwargs: Dict[str, Any] = {"event_hooks": {"request": [hook]}, "verify": verify}
+    if transport is None and not share and wrap is None:
+        kwargs.update(limits=options.limits(), http2=options.http2)
+        return kwargs
+
+    wrap = wrap or (lambda inner: inner)
+    if transport is not None:
+        kwargs["transport"] = wrap(transport)
+        return kwargs
+
+    transport_class: Callable[..., Any] = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+    if share:
+        factory: Callable[..., Any] = shared_async_transport if asynchronous else shared_transport
+        kwargs["transport"] = wrap(factory(options, verify=verify))
+    else:
+        kwargs["transport"] = wrap(transport_class(limits=options.limits(), http2=options.http2, verify=verify))
+    kwargs["mounts"] = {
+        pattern: None
+        if proxy is None
+        else wrap(transport_class(limits=options.limits(), http2=options.http2, verify=verify, proxy=proxy))
+        for pattern, proxy in _environment_proxies().items()
+    }
+    return kwargs
+
+
+__all__ = [
+    "PoolOptions",
+    "PoolStats",
+    "PoolWaitRecorder",
+    "pooled_client_options",
+    "shared_async_transport",
+    "shared_transport",
+]
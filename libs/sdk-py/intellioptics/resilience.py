@@ -0,0 +1,349 @@
+"""Retry, backoff and circuit breaking for the SDK's HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Mapping, Optional
+
+import httpx
+
+from .errors import IntelliOpticsClientError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+class CircuitOpenError(IntelliOpticsClientError):
+    """Raised without sending a request while the circuit for a host is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: Optional[str], *, now: Optional[datetime] = None) -> Optional[float]:
+    """Return the delay in seconds requested by a ``Retry-After`` header, if any."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(tz=timezone.utc))).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which failures to retry and how long to back off between attempts.
+
+    Responses with a status in ``retry_statuses`` and transport errors are
+    retried up to ``max_attempts`` in total. Requests that may have reached the
+    server are only retried when idempotent: an idempotent method or an
+    ``Idempotency-Key`` header. Connection failures, where nothing was sent,
+    are retried for every method. Delays grow exponentially from
+    ``backoff_base`` up to ``backoff_max`` with full jitter, and a
+    ``Retry-After`` header replaces the computed delay (capped at
+    ``backoff_max``).
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 10.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+
+    def is_idempotent(self, method: str, headers: Mapping[str, str]) -> bool:
+        return method.upper() in self.idempotent_methods or IDEMPOTENCY_KEY_HEADER in headers
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return the delay before retry number ``attempt`` (starting at 0)."""
+
+        if retry_after is not None and self.respect_retry_after:
+            return min(retry_after, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+@dataclass
+class _HostCircuit:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-host circuit breaker that fails fast while an API is down.
+
+    After ``failure_threshold`` consecutive failures (transport errors or 5xx
+    responses) the host's circuit opens and requests raise
+    :class:`CircuitOpenError` without being sent. Once ``reset_timeout`` has
+    passed a single probe request is let through; its success closes the
+    circuit and its failure keeps it open for another ``reset_timeout``.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    _hosts: Dict[str, _HostCircuit] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return "closed"
+            return "half-open" if circuit.probing else "open"
+
+    def check(self, host: str) -> bool:
+        """Raise :class:`CircuitOpenError` unless a request to ``host`` may be sent now.
+
+        Returns whether the request is the half-open probe; a probe that ends
+        without a response or transport error must be handed back with
+        :meth:`release_probe`.
+        """
+
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return False
+            remaining = circuit.opened_at + self.reset_timeout - self.clock()
+            if remaining > 0 or circuit.probing:
+                raise CircuitOpenError(host, max(remaining, 0.0))
+            circuit.probing = True
+            return True
+
+    def release_probe(self, host: str) -> None:
+        """Let the next request probe ``host`` again after a probe was cancelled or failed locally."""
+
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is not None:
+                circuit.probing = False
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host: str) -> bool:
+        """Record a failure, returning whether it opened the circuit."""
+
+        with self._lock:
+            circuit = self._hosts.setdefault(host, _HostCircuit())
+            circuit.failures += 1
+            reopened = circuit.probing
+            circuit.probing = False
+            if reopened or (circuit.opened_at is None and circuit.failures >= self.failure_threshold):
+                circuit.opened_at = self.clock()
+                return True
+            return False
+
+
+@dataclass(frozen=True)
+class ResilienceStats:
+    """Counters of retried requests, fail-fast rejections and circuit openings."""
+
+    retries: int = 0
+    short_circuits: int = 0
+    circuit_opens: int = 0
+
+
+class Resilience:
+    """Apply a :class:`RetryPolicy` and :class:`CircuitBreaker` and count what they do.
+
+    Either part may be ``None`` to disable it. The transports below and the
+    ``requests`` based :class:`~intellioptics._http.HttpClient` drive their
+    own attempt loops through :meth:`check`, :meth:`record` and
+    :meth:`retry_delay`.
+    """
+
+    def __init__(self, retry: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None) -> None:
+        self.retry = retry
+        self.breaker = breaker
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._short_circuits = 0
+        self._circuit_opens = 0
+
+    @property
+    def stats(self) -> ResilienceStats:
+        with self._lock:
+            return ResilienceStats(
+                retries=self._retries, short_circuits=self._short_circuits, circuit_opens=self._circuit_opens
+            )
+
+    def check(self, host: str) -> bool:
+        """Raise :class:`CircuitOpenError` while ``host`` fails fast; return whether this is its probe."""
+
+        if self.breaker is None:
+            return False
+        try:
+            return self.breaker.check(host)
+        except CircuitOpenError:
+            with self._lock:
+                self._short_circuits += 1
+            raise
+
+    def release_probe(self, host: str) -> None:
+        if self.breaker is not None:
+            self.breaker.release_probe(host)
+
+    def record(self, host: str, *, failed: bool) -> None:
+        if self.breaker is None:
+            return
+        if not failed:
+            self.breaker.record_success(host)
+        elif self.breaker.record_failure(host):
+            with self._lock:
+                self._circuit_opens += 1
+
+    def retry_delay(
+        self,
+        attempt: int,
+        method: str,
+        headers: Mapping[str, str],
+        *,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        sent: bool = True,
+    ) -> Optional[float]:
+        """Return how long to wait before retrying, or ``None`` to give up.
+
+        ``status`` is the response status, or ``None`` for a transport error;
+        ``sent=False`` marks errors raised before the request left the client.
+        """
+
+        policy = self.retry
+        if policy is None or attempt + 1 >= policy.max_attempts:
+            return None
+        if status is not None and status not in policy.retry_statuses:
+            return None
+        if sent and not policy.is_idempotent(method, headers):
+            return None
+        with self._lock:
+            self._retries += 1
+        return policy.backoff(attempt, parse_retry_after(retry_after))
+
+
+def _is_failure(status: int) -> bool:
+    return status >= 500
+
+
+# Raised before any bytes of the request reach the server.
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class ResilientTransport(httpx.BaseTransport):
+    """``httpx`` transport that retries and circuit-breaks around another transport."""
+
+    def __init__(self, transport: httpx.BaseTransport, resilience: Resilience) -> None:
+        self._transport = transport
+        self._resilience = resilience
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        attempt = 0
+        while True:
+            probe = self._resilience.check(host)
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as exc:
+                self._resilience.record(host, failed=True)
+                delay = self._resilience.retry_delay(
+                    attempt, request.method, request.headers, sent=not isinstance(exc, _UNSENT_ERRORS)
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                if probe:
+                    self._resilience.release_probe(host)
+                raise
+            else:
+                self._resilience.record(host, failed=_is_failure(response.status_code))
+                delay = self._resilience.retry_delay(
+                    attempt,
+                    request.method,
+                    request.headers,
+                    status=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncResilientTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`ResilientTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, resilience: Resilience) -> None:
+        self._transport = transport
+        self._resilience = resilience
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        attempt = 0
+        while True:
+            probe = self._resilience.check(host)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as exc:
+                self._resilience.record(host, failed=True)
+                delay = self._resilience.retry_delay(
+                    attempt, request.method, request.headers, sent=not isinstance(exc, _UNSENT_ERRORS)
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                if probe:
+                    self._resilience.release_probe(host)
+                raise
+            else:
+                self._resilience.record(host, failed=_is_failure(response.status_code))
+                delay = self._resilience.retry_delay(
+                    attempt,
+                    request.method,
+                    request.headers,
+                    status=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "AsyncResilientTransport",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Resilience",
+    "ResilienceStats",
+    "ResilientTransport",
+    "RetryPolicy",
+    "parse_retry_after",
+]
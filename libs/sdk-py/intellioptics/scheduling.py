@@ -0,0 +1,261 @@
+"""Earliest-deadline-first scheduling for inference job consumers.
+
+:class:`DeadlineScheduler` hands out buffered jobs in order of their
+``deadline`` instead of arrival order, and sets aside jobs whose deadline has
+passed (or will pass within ``min_slack`` seconds) before any inference time is
+spent on them. Jobs without a deadline run after every job that has one, in
+arrival order. :class:`DeadlineJobSource` feeds a scheduler from a
+:class:`~intellioptics.transport.Transport` and settles expired deliveries, so
+an overloaded worker sheds the frames nobody is waiting for anymore.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from .messaging import InferenceJobMessage, MessageDecodeError
+from .transport import (
+    DEFAULT_LOCK_DURATION,
+    DEFAULT_RECEIVE_BATCH,
+    JOBS_TOPIC,
+    MessageLockLostError,
+    ReceivedMessage,
+    Transport,
+)
+
+T = TypeVar("T")
+
+DEADLINE_EXCEEDED = "DeadlineExceeded"
+EXPIRED_ACTIONS = ("dead_letter", "ack")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """Counts of jobs handed out on time, set aside as expired, and still buffered."""
+
+    on_time: int = 0
+    expired: int = 0
+    pending: int = 0
+
+
+@dataclass(frozen=True)
+class ScheduledJob(Generic[T]):
+    """A job together with whatever the caller needs to settle it later."""
+
+    job: InferenceJobMessage
+    item: T
+
+
+class DeadlineScheduler(Generic[T]):
+    """Thread-safe earliest-deadline-first buffer of inference jobs.
+
+    ``item`` travels with each job, typically the transport delivery to
+    acknowledge once the job is done.
+    """
+
+    def __init__(self, *, min_slack: float = 0.0, clock: Callable[[], datetime] = _utcnow) -> None:
+        if min_slack < 0:
+            raise ValueError("min_slack must not be negative")
+        self.min_slack = min_slack
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, ScheduledJob[T]]] = []
+        self._sequence = itertools.count()
+        self._expired: List[ScheduledJob[T]] = []
+        self._on_time = 0
+        self._expired_total = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    @property
+    def stats(self) -> SchedulerStats:
+        with self._lock:
+            return SchedulerStats(on_time=self._on_time, expired=self._expired_total, pending=len(self._heap))
+
+    def push(self, job: InferenceJobMessage, item: T) -> None:
+        """Buffer ``job``; one already past its deadline is set aside immediately."""
+
+        scheduled = ScheduledJob(job, item)
+        key = job.deadline.timestamp() if job.deadline is not None else math.inf
+        with self._lock:
+            if key - self.min_slack <= self._clock().timestamp():
+                self._expire(scheduled)
+            else:
+                heapq.heappush(self._heap, (key, next(self._sequence), scheduled))
+
+    def pop_batch(self, max_jobs: int) -> List[ScheduledJob[T]]:
+        """Return up to ``max_jobs`` jobs with the earliest deadlines that can still be met."""
+
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be at least 1")
+        with self._lock:
+            cutoff = self._clock().timestamp() + self.min_slack
+            batch: List[ScheduledJob[T]] = []
+            while self._heap and len(batch) < max_jobs:
+                key, _, scheduled = heapq.heappop(self._heap)
+                if key <= cutoff:
+                    self._expire(scheduled)
+                else:
+                    batch.append(scheduled)
+            self._on_time += len(batch)
+            return batch
+
+    def pop(self) -> Optional[ScheduledJob[T]]:
+        """Return the job with the earliest deadline that can still be met, if any."""
+
+        batch = self.pop_batch(1)
+        return batch[0] if batch else None
+
+    def discard(self, predicate: Callable[[T], bool]) -> int:
+        """Forget buffered jobs whose item matches ``predicate`` and return how many were dropped."""
+
+        with self._lock:
+            kept = [entry for entry in self._heap if not predicate(entry[2].item)]
+            dropped = len(self._heap) - len(kept)
+            if dropped:
+                heapq.heapify(kept)
+                self._heap = kept
+            return dropped
+
+    def take_expired(self) -> List[ScheduledJob[T]]:
+        """Return and forget the jobs set aside as expired since the last call."""
+
+        with self._lock:
+            expired, self._expired = self._expired, []
+            return expired
+
+    def _expire(self, scheduled: ScheduledJob[T]) -> None:
+        self._expired.append(scheduled)
+        self._expired_total += 1
+
+
+class DeadlineJobSource:
+    """Receive jobs from a transport and yield them earliest deadline first.
+
+    Each call to :meth:`next_batch` pulls waiting messages on ``topic`` into
+    the scheduler before choosing, so jobs received later can overtake ones
+    with looser deadlines. At most ``capacity`` jobs are buffered and the rest
+    stay on the transport. Jobs whose lock runs out while buffered are dropped,
+    since the transport delivers them again, and a redelivery of a job still
+    buffered replaces the older delivery. Expired jobs are dead-lettered with
+    the reason ``DeadlineExceeded`` (``expired_action="dead_letter"``) or
+    simply acknowledged and dropped (``expired_action="ack"``); undecodable
+    messages are always dead-lettered. Callers acknowledge the deliveries they return
+    once the work is done.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        *,
+        topic: str = JOBS_TOPIC,
+        scheduler: Optional[DeadlineScheduler[ReceivedMessage]] = None,
+        expired_action: str = "dead_letter",
+        receive_batch: int = DEFAULT_RECEIVE_BATCH,
+        capacity: int = DEFAULT_RECEIVE_BATCH,
+        lock_duration: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if expired_action not in EXPIRED_ACTIONS:
+            raise ValueError(f"expired_action must be one of {', '.join(EXPIRED_ACTIONS)}")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.transport = transport
+        self.topic = topic
+        self.scheduler: DeadlineScheduler[ReceivedMessage] = scheduler or DeadlineScheduler()
+        self.expired_action = expired_action
+        self.receive_batch = receive_batch
+        self.capacity = capacity
+        if lock_duration is None:
+            lock_duration = getattr(transport, "lock_duration", DEFAULT_LOCK_DURATION)
+        self.lock_duration = lock_duration
+        self._clock = clock
+        self._locked_until: Dict[int, float] = {}
+
+    @property
+    def stats(self) -> SchedulerStats:
+        return self.scheduler.stats
+
+    async def next_batch(self, max_jobs: int, *, timeout: float = 1.0) -> List[ScheduledJob[ReceivedMessage]]:
+        """Return up to ``max_jobs`` on-time jobs, waiting up to ``timeout`` seconds when none are buffered."""
+
+        wait = 0.0 if len(self.scheduler) else timeout
+        while True:
+            self._drop_lost_locks()
+            room = min(self.receive_batch, self.capacity - len(self.scheduler))
+            if room > 0:
+                locked_until = self._clock() + self.lock_duration
+                for message in await self.transport.receive(self.topic, max_messages=room, timeout=wait):
+                    try:
+                        job = InferenceJobMessage.from_bytes(message.body)
+                    except MessageDecodeError as exc:
+                        await self._settle(self.transport.dead_letter(message, str(exc)))
+                        continue
+                    if message.sequence_number in self._locked_until:
+                        self._forget({message.sequence_number})
+                    self._locked_until[message.sequence_number] = locked_until
+                    self.scheduler.push(job, message)
+            batch = self.scheduler.pop_batch(max_jobs)
+            for scheduled in batch:
+                self._locked_until.pop(scheduled.item.sequence_number, None)
+            await self._settle_expired()
+            if batch or wait == timeout:
+                return batch
+            wait = timeout
+
+    def _drop_lost_locks(self) -> None:
+        now = self._clock()
+        lost = {sequence_number for sequence_number, until in self._locked_until.items() if until <= now}
+        if lost:
+            self._forget(lost)
+
+    def _forget(self, sequence_numbers: Set[int]) -> None:
+        self.scheduler.discard(lambda message: message.sequence_number in sequence_numbers)
+        for sequence_number in sequence_numbers:
+            del self._locked_until[sequence_number]
+
+    async def _settle_expired(self) -> None:
+        expired = [scheduled.item for scheduled in self.scheduler.take_expired()]
+        for message in expired:
+            self._locked_until.pop(message.sequence_number, None)
+        if not expired:
+            return
+        if self.expired_action == "ack":
+            try:
+                await self.transport.ack_many(expired)
+            except MessageLockLostError:
+                for message in expired:
+                    await self._settle(self.transport.ack(message))
+        else:
+            for message in expired:
+                await self._settle(self.transport.dead_letter(message, DEADLINE_EXCEEDED))
+
+    @staticmethod
+    async def _settle(settlement: Awaitable[None]) -> None:
+        # A lock that ran out means the transport delivers the message again
+        # and a later receive settles that delivery instead.
+        try:
+            await settlement
+        except MessageLockLostError:
+            pass
+
+__all__ = [
+    "DEADLINE_EXCEEDED",
+    "DeadlineJobSource",
+    "DeadlineScheduler",
+    "ScheduledJob",
+    "SchedulerStats",
+]
@@ -0,0 +1,509 @@
+"""Pluggable transports for the ``inference-jobs`` and ``inference-results`` topics.
+
+:class:`Transport` is the small subset of Service Bus semantics the job pipeline
+relies on: publishing encoded messages, receiving them in batches under a
+peek-lock, and settling each delivery by acknowledging, abandoning or
+dead-lettering it. A delivery whose lock expires before it is settled becomes
+visible again, and one that has been delivered ``max_delivery_count`` times is
+moved to the dead-letter list instead of being handed out once more.
+
+Two local implementations let the API, edge workers and benchmarks run the
+whole job loop without a cloud dependency: :class:`InMemoryBroker` keeps
+everything in process memory and :class:`SQLiteBroker` persists messages to a
+SQLite file so they survive restarts and can be shared between processes.
+Bodies are opaque bytes; use the codecs in :mod:`intellioptics.messaging` to
+produce them.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import heapq
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .errors import IntelliOpticsClientError
+
+JOBS_TOPIC = "inference-jobs"
+RESULTS_TOPIC = "inference-results"
+
+DEFAULT_LOCK_DURATION = 30.0
+DEFAULT_MAX_DELIVERY_COUNT = 10
+DEFAULT_RECEIVE_BATCH = 32
+MAX_DELIVERY_COUNT_EXCEEDED = "MaxDeliveryCountExceeded"
+
+
+class MessageLockLostError(IntelliOpticsClientError):
+    """Raised when settling a delivery whose lock expired or that was already settled."""
+
+    def __init__(self, message: "ReceivedMessage") -> None:
+        super().__init__(f"Lock lost for message {message.sequence_number} on {message.topic}")
+        self.topic = message.topic
+        self.sequence_number = message.sequence_number
+
+
+@dataclass(frozen=True)
+class ReceivedMessage:
+    """One delivery of a message, locked to the receiver until it is settled."""
+
+    topic: str
+    sequence_number: int
+    body: bytes
+    delivery_count: int
+    lock_token: str
+    enqueued_at: float
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """A message moved aside after it was rejected or redelivered too often."""
+
+    topic: str
+    sequence_number: int
+    body: bytes
+    delivery_count: int
+    reason: str
+
+
+class Transport(abc.ABC):
+    """Publish, receive and settle messages on named topics."""
+
+    async def publish(self, topic: str, body: bytes) -> int:
+        """Publish one message and return its sequence number."""
+
+        (sequence_number,) = await self.publish_many(topic, [body])
+        return sequence_number
+
+    @abc.abstractmethod
+    async def publish_many(self, topic: str, bodies: Iterable[bytes]) -> List[int]:
+        """Publish several messages at once, returning their sequence numbers in order."""
+
+    @abc.abstractmethod
+    async def receive(
+        self, topic: str, *, max_messages: int = DEFAULT_RECEIVE_BATCH, timeout: float = 1.0
+    ) -> List[ReceivedMessage]:
+        """Lock and return up to ``max_messages`` deliveries, oldest first.
+
+        Waits up to ``timeout`` seconds for the first message and returns an
+        empty list if none arrives.
+        """
+
+    @abc.abstractmethod
+    async def ack(self, message: ReceivedMessage) -> None:
+        """Remove a delivered message from its topic."""
+
+    async def ack_many(self, messages: Iterable[ReceivedMessage]) -> None:
+        """Acknowledge several deliveries, raising for the first whose lock was lost."""
+
+        for message in messages:
+            await self.ack(message)
+
+    @abc.abstractmethod
+    async def abandon(self, message: ReceivedMessage) -> None:
+        """Release the lock so the message can be delivered again straight away."""
+
+    @abc.abstractmethod
+    async def dead_letter(self, message: ReceivedMessage, reason: str = "") -> None:
+        """Move a delivered message to the topic's dead-letter list."""
+
+    @abc.abstractmethod
+    async def dead_letters(self, topic: str) -> List[DeadLetter]:
+        """Return the dead-lettered messages of ``topic``, oldest first."""
+
+    async def close(self) -> None:
+        """Release resources held by the transport."""
+
+    async def __aenter__(self) -> "Transport":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+def _check_receive_args(max_messages: int, timeout: float) -> None:
+    if max_messages < 1:
+        raise ValueError("max_messages must be at least 1")
+    if timeout < 0:
+        raise ValueError("timeout must not be negative")
+
+
+@dataclass
+class _Entry:
+    sequence_number: int
+    body: bytes
+    enqueued_at: float
+    delivery_count: int = 0
+    lock_token: Optional[str] = None
+    locked_until: float = 0.0
+
+
+class _Topic:
+    """Ready heap, in-flight locks and dead letters of one in-memory topic."""
+
+    def __init__(self) -> None:
+        self.ready: List[Tuple[int, _Entry]] = []
+        self.locked: Dict[int, _Entry] = {}
+        self.expiries: List[Tuple[float, int, str]] = []
+        self.dead: List[DeadLetter] = []
+        self.available = asyncio.Condition()
+
+
+class InMemoryBroker(Transport):
+    """Asyncio broker keeping every topic in process memory.
+
+    All calls must come from the same event loop. Locks are timed with
+    ``clock``, which defaults to :func:`time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        *,
+        lock_duration: float = DEFAULT_LOCK_DURATION,
+        max_delivery_count: int = DEFAULT_MAX_DELIVERY_COUNT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.lock_duration = lock_duration
+        self.max_delivery_count = max_delivery_count
+        self._clock = clock
+        self._topics: Dict[str, _Topic] = {}
+        self._sequence = 0
+
+    def _topic(self, name: str) -> _Topic:
+        topic = self._topics.get(name)
+        if topic is None:
+            topic = self._topics[name] = _Topic()
+        return topic
+
+    def _release_expired(self, name: str, topic: _Topic) -> None:
+        now = self._clock()
+        while topic.expiries and topic.expiries[0][0] <= now:
+            _, sequence_number, lock_token = heapq.heappop(topic.expiries)
+            entry = topic.locked.get(sequence_number)
+            if entry is not None and entry.lock_token == lock_token:
+                del topic.locked[sequence_number]
+                self._make_ready(name, topic, entry)
+
+    def _make_ready(self, name: str, topic: _Topic, entry: _Entry) -> None:
+        entry.lock_token = None
+        if entry.delivery_count >= self.max_delivery_count:
+            topic.dead.append(_dead_letter(name, entry, MAX_DELIVERY_COUNT_EXCEEDED))
+        else:
+            heapq.heappush(topic.ready, (entry.sequence_number, entry))
+
+    def _take(self, name: str, topic: _Topic, max_messages: int) -> List[ReceivedMessage]:
+        locked_until = self._clock() + self.lock_duration
+        received: List[ReceivedMessage] = []
+        while topic.ready and len(received) < max_messages:
+            _, entry = heapq.heappop(topic.ready)
+            entry.delivery_count += 1
+            entry.lock_token = uuid.uuid4().hex
+            entry.locked_until = locked_until
+            topic.locked[entry.sequence_number] = entry
+            heapq.heappush(topic.expiries, (locked_until, entry.sequence_number, entry.lock_token))
+            received.append(
+                ReceivedMessage(
+                    topic=name,
+                    sequence_number=entry.sequence_number,
+                    body=entry.body,
+                    delivery_count=entry.delivery_count,
+                    lock_token=entry.lock_token,
+                    enqueued_at=entry.enqueued_at,
+                )
+            )
+        return received
+
+    def _settle(self, message: ReceivedMessage) -> Tuple[_Topic, _Entry]:
+        topic = self._topic(message.topic)
+        entry = topic.locked.get(message.sequence_number)
+        if entry is None or entry.lock_token != message.lock_token or entry.locked_until <= self._clock():
+            raise MessageLockLostError(message)
+        del topic.locked[message.sequence_number]
+        return topic, entry
+
+    async def publish_many(self, topic: str, bodies: Iterable[bytes]) -> List[int]:
+        state = self._topic(topic)
+        now = self._clock()
+        sequence_numbers: List[int] = []
+        for body in bodies:
+            self._sequence += 1
+            heapq.heappush(state.ready, (self._sequence, _Entry(self._sequence, bytes(body), now)))
+            sequence_numbers.append(self._sequence)
+        if sequence_numbers:
+            async with state.available:
+                state.available.notify_all()
+        return sequence_numbers
+
+    async def receive(
+        self, topic: str, *, max_messages: int = DEFAULT_RECEIVE_BATCH, timeout: float = 1.0
+    ) -> List[ReceivedMessage]:
+        _check_receive_args(max_messages, timeout)
+        state = self._topic(topic)
+        deadline = time.monotonic() + timeout
+        while True:
+            self._release_expired(topic, state)
+            if state.ready:
+                return self._take(topic, state, max_messages)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            if state.expiries:
+                # Wake up in time to hand out a delivery whose lock lapses first.
+                remaining = min(remaining, max(state.expiries[0][0] - self._clock(), 0.0))
+            async with state.available:
+                try:
+                    await asyncio.wait_for(state.available.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def ack(self, message: ReceivedMessage) -> None:
+        self._settle(message)
+
+    async def abandon(self, message: ReceivedMessage) -> None:
+        topic, entry = self._settle(message)
+        self._make_ready(message.topic, topic, entry)
+        async with topic.available:
+            topic.available.notify_all()
+
+    async def dead_letter(self, message: ReceivedMessage, reason: str = "") -> None:
+        topic, entry = self._settle(message)
+        topic.dead.append(_dead_letter(message.topic, entry, reason))
+
+    async def dead_letters(self, topic: str) -> List[DeadLetter]:
+        return list(self._topic(topic).dead)
+
+    def pending_count(self, topic: str) -> int:
+        """Return how many messages of ``topic`` are waiting or locked."""
+
+        state = self._topic(topic)
+        return len(state.ready) + len(state.locked)
+
+
+def _dead_letter(topic: str, entry: _Entry, reason: str) -> DeadLetter:
+    return DeadLetter(
+        topic=topic,
+        sequence_number=entry.sequence_number,
+        body=entry.body,
+        delivery_count=entry.delivery_count,
+        reason=reason,
+    )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    sequence_number INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    body BLOB NOT NULL,
+    enqueued_at REAL NOT NULL,
+    delivery_count INTEGER NOT NULL DEFAULT 0,
+    lock_token TEXT,
+    locked_until REAL NOT NULL DEFAULT 0,
+    dead_letter_reason TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_messages_active
+    ON messages (topic, sequence_number) WHERE dead_letter_reason IS NULL;
+"""
+
+
+class SQLiteBroker(Transport):
+    """Durable broker storing messages in a SQLite database file.
+
+    Unsettled messages survive restarts, and several processes can share one
+    file: receives lock rows inside an immediate transaction so a message is
+    never handed to two receivers at once. Receivers in this process are woken
+    as soon as it publishes; messages published by other processes are picked
+    up every ``poll_interval`` seconds. Locks are timed with ``clock``, which
+    defaults to wall-clock :func:`time.time` so they stay meaningful across
+    processes.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        lock_duration: float = DEFAULT_LOCK_DURATION,
+        max_delivery_count: int = DEFAULT_MAX_DELIVERY_COUNT,
+        poll_interval: float = 0.05,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.lock_duration = lock_duration
+        self.max_delivery_count = max_delivery_count
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._published: Optional[asyncio.Event] = None
+        self._connection = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False, timeout=30.0
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    async def _run(self, function: Callable[..., object], *args: object) -> object:
+        return await asyncio.to_thread(self._locked, function, *args)
+
+    def _locked(self, function: Callable[..., object], *args: object) -> object:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = function(*args)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+            return result
+
+    def _insert(self, topic: str, bodies: Sequence[bytes]) -> List[int]:
+        now = self._clock()
+        cursor = self._connection.cursor()
+        sequence_numbers: List[int] = []
+        for body in bodies:
+            cursor.execute(
+                "INSERT INTO messages (topic, body, enqueued_at) VALUES (?, ?, ?)", (topic, body, now)
+            )
+            sequence_numbers.append(int(cursor.lastrowid))
+        return sequence_numbers
+
+    def _lock_batch(self, topic: str, max_messages: int) -> List[ReceivedMessage]:
+        now = self._clock()
+        connection = self._connection
+        connection.execute(
+            "UPDATE messages SET dead_letter_reason = ?, lock_token = NULL "
+            "WHERE topic = ? AND dead_letter_reason IS NULL AND locked_until <= ? AND delivery_count >= ?",
+            (MAX_DELIVERY_COUNT_EXCEEDED, topic, now, self.max_delivery_count),
+        )
+        rows = connection.execute(
+            "SELECT sequence_number, body, delivery_count, enqueued_at FROM messages "
+            "WHERE topic = ? AND dead_letter_reason IS NULL AND locked_until <= ? "
+            "ORDER BY sequence_number LIMIT ?",
+            (topic, now, max_messages),
+        ).fetchall()
+        locked_until = now + self.lock_duration
+        received = [
+            ReceivedMessage(
+                topic=topic,
+                sequence_number=sequence_number,
+                body=bytes(body),
+                delivery_count=delivery_count + 1,
+                lock_token=uuid.uuid4().hex,
+                enqueued_at=enqueued_at,
+            )
+            for sequence_number, body, delivery_count, enqueued_at in rows
+        ]
+        connection.executemany(
+            "UPDATE messages SET delivery_count = ?, lock_token = ?, locked_until = ? WHERE sequence_number = ?",
+            [
+                (message.delivery_count, message.lock_token, locked_until, message.sequence_number)
+                for message in received
+            ],
+        )
+        return received
+
+    def _settle(self, message: ReceivedMessage, statement: str, *args: object) -> None:
+        cursor = self._connection.execute(
+            f"{statement} WHERE sequence_number = ? AND lock_token = ? AND locked_until > ?",
+            (*args, message.sequence_number, message.lock_token, self._clock()),
+        )
+        if cursor.rowcount != 1:
+            raise MessageLockLostError(message)
+
+    def _event(self) -> asyncio.Event:
+        if self._published is None:
+            self._published = asyncio.Event()
+        return self._published
+
+    async def publish_many(self, topic: str, bodies: Iterable[bytes]) -> List[int]:
+        payloads = [bytes(body) for body in bodies]
+        if not payloads:
+            return []
+        sequence_numbers = await self._run(self._insert, topic, payloads)
+        self._event().set()
+        return sequence_numbers  # type: ignore[return-value]
+
+    async def receive(
+        self, topic: str, *, max_messages: int = DEFAULT_RECEIVE_BATCH, timeout: float = 1.0
+    ) -> List[ReceivedMessage]:
+        _check_receive_args(max_messages, timeout)
+        deadline = time.monotonic() + timeout
+        published = self._event()
+        while True:
+            published.clear()
+            received: List[ReceivedMessage] = await self._run(  # type: ignore[assignment]
+                self._lock_batch, topic, max_messages
+            )
+            if received:
+                return received
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            try:
+                await asyncio.wait_for(published.wait(), min(remaining, self.poll_interval))
+            except asyncio.TimeoutError:
+                pass
+
+    async def ack(self, message: ReceivedMessage) -> None:
+        await self._run(self._settle, message, "DELETE FROM messages")
+
+    async def ack_many(self, messages: Iterable[ReceivedMessage]) -> None:
+        def _delete(batch: List[ReceivedMessage]) -> None:
+            for message in batch:
+                self._settle(message, "DELETE FROM messages")
+
+        batch = list(messages)
+        if batch:
+            await self._run(_delete, batch)
+
+    async def abandon(self, message: ReceivedMessage) -> None:
+        await self._run(
+            self._settle,
+            message,
+            "UPDATE messages SET lock_token = NULL, locked_until = 0, "
+            "dead_letter_reason = CASE WHEN delivery_count >= ? THEN ? END",
+            self.max_delivery_count,
+            MAX_DELIVERY_COUNT_EXCEEDED,
+        )
+        self._event().set()
+
+    async def dead_letter(self, message: ReceivedMessage, reason: str = "") -> None:
+        await self._run(
+            self._settle, message, "UPDATE messages SET lock_token = NULL, dead_letter_reason = ?", reason
+        )
+
+    async def dead_letters(self, topic: str) -> List[DeadLetter]:
+        def _select() -> List[DeadLetter]:
+            rows = self._connection.execute(
+                "SELECT sequence_number, body, delivery_count, dead_letter_reason FROM messages "
+                "WHERE topic = ? AND dead_letter_reason IS NOT NULL ORDER BY sequence_number",
+                (topic,),
+            ).fetchall()
+            return [
+                DeadLetter(topic, sequence_number, bytes(body), delivery_count, reason)
+                for sequence_number, body, delivery_count, reason in rows
+            ]
+
+        return await self._run(_select)  # type: ignore[return-value]
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+__all__ = [
+    "DEFAULT_LOCK_DURATION",
+    "DEFAULT_MAX_DELIVERY_COUNT",
+    "JOBS_TOPIC",
+    "MAX_DELIVERY_COUNT_EXCEEDED",
+    "RESULTS_TOPIC",
+    "DeadLetter",
+    "InMemoryBroker",
+    "MessageLockLostError",
+    "ReceivedMessage",
+    "SQLiteBroker",
+    "Transport",
+]
@@ -0,0 +1,24 @@
+"""Pytest fixtures shared by the SDK tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for the ``clock`` callables the SDK accepts; tests move ``now`` by hand."""
+
+    def __init__(self, now: Any = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> Any:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    """A clock frozen at ``0.0`` until the test advances ``clock.now``."""
+
+    return FakeClock()
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Tuple
+import json
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Any, Dict, Iterator, List, Tuple
 
 import httpx
+import numpy as np
 import pytest
+from PIL import Image
 
-from intellioptics.client import IntelliOpticsAsyncClient, IntelliOpticsClient, IntelliOpticsError
-from intellioptics.models import DetectorCreate
+from intellioptics._img import jpeg_dimensions
+from intellioptics.client import BatchSubmitError, IntelliOpticsAsyncClient, IntelliOpticsClient, IntelliOpticsError
+from intellioptics.dedup import DedupStats, FrameDeduplicator
+from intellioptics.models import DetectorCreate, FrameOutcome, FrameSubmission, ImageQuerySubmission
+from intellioptics.pooling import PoolOptions, PoolStats
+from intellioptics.resilience import ResilientTransport, RetryPolicy
 
 _ResponseKey = Tuple[str, str]
 _ResponseValue = Tuple[int, Any]
@@ -108,6 +121,99 @@ def test_wait_for_image_query_timeout(transport: httpx.MockTransport) -> None:
         client.wait_for_image_query("iq-1", poll_interval=0.0, timeout=0.0)
 
 
+def test_wait_for_image_query_long_polls_with_capped_backoff() -> None:
+    params: List[Dict[str, str]] = []
+    envelopes = [
+        {"status": "pending", "result": None},
+        {"status": "pending", "result": None},
+        {"status": "pending", "result": None},
+        {"status": "complete", "result": {"id": "iq-1", "answer": "NO", "answer_score": 0.7}},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params.append(dict(request.url.params))
+        return httpx.Response(200, json=envelopes.pop(0), request=request)
+
+    pauses: List[float] = []
+    client = IntelliOpticsClient("https://api.local", transport=httpx.MockTransport(handler))
+    result = client.wait_for_image_query(
+        "iq-1", poll_interval=0.5, max_poll_interval=0.8, timeout=60, long_poll=20, sleep_fn=pauses.append
+    )
+
+    assert (result.answer, result.score) == ("NO", 0.7)
+    assert [float(entry["timeout"]) for entry in params] == pytest.approx([20.0] * 4, abs=0.1)
+    assert params[0]["poll"] == "0.5"
+    assert pauses == pytest.approx([0.5, 0.8, 0.8], abs=0.05)
+
+
+def test_async_wait_for_image_query_reads_envelope() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = {"status": "complete", "result": {"id": "iq-9", "answer": "YES"}}
+        return httpx.Response(200, json=payload, request=request)
+
+    async def runner() -> str:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=httpx.MockTransport(handler)) as client:
+            return (await client.wait_for_image_query("iq-9", timeout=1)).answer
+
+    assert asyncio.run(runner()) == "YES"
+
+
+def _wait_many_transport(bodies: List[Dict[str, Any]]) -> httpx.MockTransport:
+    answers = {"iq-1": "YES", "iq-2": None, "iq-3": "NO"}
+    rounds = [0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        rounds[0] += 1
+        if rounds[0] > 1:
+            answers["iq-2"] = "YES"
+        results = [{"id": query_id, "answer": answers[query_id]} for query_id in body["ids"] if answers[query_id]]
+        pending = [query_id for query_id in body["ids"] if not answers[query_id]]
+        complete = not pending if body["mode"] == "all" else bool(results)
+        payload = {"status": "complete" if complete else "pending", "results": results, "pending": pending}
+        return httpx.Response(200, json=payload, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+def test_wait_for_image_queries_all_only_resends_pending_ids() -> None:
+    bodies: List[Dict[str, Any]] = []
+    client = IntelliOpticsClient("https://api.local", transport=_wait_many_transport(bodies))
+
+    results = client.wait_for_image_queries(
+        ["iq-3", "iq-1", "iq-2", "iq-1"], mode="all", poll_interval=0.0, timeout=5, sleep_fn=lambda _: None
+    )
+
+    assert list(results) == ["iq-3", "iq-1", "iq-2"]
+    assert results["iq-2"].answer == "YES"
+    assert bodies == [{"ids": ["iq-3", "iq-1", "iq-2"], "mode": "all"}, {"ids": ["iq-2"], "mode": "all"}]
+
+
+def test_async_wait_for_image_queries_any_returns_first_answers() -> None:
+    bodies: List[Dict[str, Any]] = []
+
+    async def runner() -> Dict[str, Any]:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=_wait_many_transport(bodies)) as client:
+            return await client.wait_for_image_queries(["iq-2", "iq-3"], timeout=5)
+
+    results = asyncio.run(runner())
+
+    assert list(results) == ["iq-3"]
+    assert len(bodies) == 1
+
+
+def test_wait_for_image_queries_times_out() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": "pending", "results": [], "pending": ["iq-1"]}, request=request)
+
+    client = IntelliOpticsClient("https://api.local", transport=httpx.MockTransport(handler))
+    with pytest.raises(IntelliOpticsError):
+        client.wait_for_image_queries(["iq-1"], timeout=0.0)
+    with pytest.raises(ValueError):
+        client.wait_for_image_queries(["iq-1"], mode="some")
+
+
 def test_async_health(transport: httpx.MockTransport) -> None:
     responder = transport.responder  # type: ignore[attr-defined]
     responder.add("GET", "/health", json={"status": "ok"}, status_code=200)
@@ -117,3 +223,528 @@ def test_async_health(transport: httpx.MockTransport) -> None:
             assert await client.health() is True
 
     asyncio.run(runner())
+
+
+def _answer_stream_transport() -> httpx.MockTransport:
+    body = (
+        ": connected\n\n"
+        'event: answer\nid: iq-1\ndata: {"id": "iq-1", "detector_id": "det-1", "answer": "YES", "answer_score": 0.9}\n\n'
+        ": keep-alive\n\n"
+        'event: answer\nid: iq-2\ndata: {"id": "iq-2", "detector_id": "det-1", "answer": "NO", "answer_score": 0.2}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/detectors/det-1/answers/stream"
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+
+    return httpx.MockTransport(handler)
+
+
+def test_stream_answers_parses_server_sent_events() -> None:
+    client = IntelliOpticsClient("https://api.local", transport=_answer_stream_transport())
+    results = list(client.stream_answers("det-1"))
+
+    assert [result.id for result in results] == ["iq-1", "iq-2"]
+    assert results[0].answer == "YES"
+    assert results[0].score == 0.9
+
+
+def test_async_stream_answers_parses_server_sent_events() -> None:
+    async def runner() -> List[str]:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=_answer_stream_transport()) as client:
+            return [result.answer async for result in client.stream_answers("det-1")]
+
+    assert asyncio.run(runner()) == ["YES", "NO"]
+
+
+def _batch_transport(calls: List[int]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/image-queries:batch"
+        queries = json.loads(request.content)["queries"]
+        calls.append(len(queries))
+        ids = [f"iq-{query['snapshot_url'].rsplit('/', 1)[1]}" for query in queries]
+        return httpx.Response(201, json={"ids": ids}, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+def _submissions(count: int) -> List[ImageQuerySubmission]:
+    return [ImageQuerySubmission(detector_id="det-1", snapshot_url=f"https://blob/{index}") for index in range(count)]
+
+
+def test_submit_image_queries_chunks_requests() -> None:
+    calls: List[int] = []
+    client = IntelliOpticsClient("https://api.local", transport=_batch_transport(calls))
+
+    ids = client.submit_image_queries(_submissions(7), chunk_size=3)
+
+    assert calls == [3, 3, 1]
+    assert ids == [f"iq-{index}" for index in range(7)]
+
+
+def test_async_submit_image_queries_preserves_order() -> None:
+    calls: List[int] = []
+
+    async def runner() -> List[str]:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=_batch_transport(calls)) as client:
+            return await client.submit_image_queries(_submissions(5), chunk_size=2)
+
+    assert asyncio.run(runner()) == [f"iq-{index}" for index in range(5)]
+    assert sorted(calls) == [1, 2, 2]
+
+
+def _failing_batch_transport(fail_from: int) -> httpx.MockTransport:
+    working = _batch_transport([])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries = json.loads(request.content)["queries"]
+        if int(queries[0]["snapshot_url"].rsplit("/", 1)[1]) >= fail_from:
+            return httpx.Response(503, json={"detail": "Unavailable"}, request=request)
+        return working.handle_request(request)
+
+    return httpx.MockTransport(handler)
+
+
+def test_submit_image_queries_reports_committed_ids_when_a_chunk_fails() -> None:
+    client = IntelliOpticsClient("https://api.local", transport=_failing_batch_transport(fail_from=3))
+
+    with pytest.raises(BatchSubmitError) as excinfo:
+        client.submit_image_queries(_submissions(7), chunk_size=3)
+
+    assert excinfo.value.ids == ["iq-0", "iq-1", "iq-2", None, None, None, None]
+    assert isinstance(excinfo.value.__cause__, httpx.HTTPStatusError)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.submit_image_queries(_submissions(7)[3:], chunk_size=3)
+
+
+def test_async_submit_image_queries_reports_committed_ids_when_a_chunk_fails() -> None:
+    async def runner() -> None:
+        transport = _failing_batch_transport(fail_from=2)
+        async with IntelliOpticsAsyncClient("https://api.local", transport=transport) as client:
+            await client.submit_image_queries(_submissions(5), chunk_size=2)
+
+    with pytest.raises(BatchSubmitError) as excinfo:
+        asyncio.run(runner())
+
+    assert excinfo.value.ids == ["iq-0", "iq-1", None, None, None]
+
+
+def _paged_detectors_transport(requests_seen: List[Dict[str, str]]) -> httpx.MockTransport:
+    pages = {
+        None: ([{"id": "det-3", "name": "c", "mode": "binary"}, {"id": "det-2", "name": "b", "mode": "binary"}], "det-2"),
+        "det-2": ([{"id": "det-1", "name": "a", "mode": "binary"}], None),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests_seen.append(params)
+        items, next_cursor = pages[params.get("cursor")]
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        return httpx.Response(200, json=items, headers=headers, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+def test_iter_detectors_follows_cursor_lazily() -> None:
+    requests_seen: List[Dict[str, str]] = []
+    client = IntelliOpticsClient("https://api.local", transport=_paged_detectors_transport(requests_seen))
+
+    iterator = client.iter_detectors(page_size=2, is_active=True, name_prefix="Gate")
+    assert next(iterator).id == "det-3"
+    assert len(requests_seen) == 1
+    assert requests_seen[0] == {"limit": "2", "is_active": "true", "name_prefix": "Gate"}
+
+    assert [detector.id for detector in iterator] == ["det-2", "det-1"]
+    assert requests_seen[1]["cursor"] == "det-2"
+
+
+def test_async_iter_detectors_follows_cursor() -> None:
+    requests_seen: List[Dict[str, str]] = []
+
+    async def runner() -> List[str]:
+        transport = _paged_detectors_transport(requests_seen)
+        async with IntelliOpticsAsyncClient("https://api.local", transport=transport) as client:
+            return [detector.id async for detector in client.iter_detectors(page_size=2)]
+
+    assert asyncio.run(runner()) == ["det-3", "det-2", "det-1"]
+    assert len(requests_seen) == 2
+
+
+def test_list_detectors_returns_every_page() -> None:
+    requests_seen: List[Dict[str, str]] = []
+    client = IntelliOpticsClient("https://api.local", transport=_paged_detectors_transport(requests_seen))
+
+    assert [detector.id for detector in client.list_detectors()] == ["det-3", "det-2", "det-1"]
+    assert requests_seen == [{}, {"cursor": "det-2"}]
+
+    async def runner() -> List[str]:
+        transport = _paged_detectors_transport(requests_seen)
+        async with IntelliOpticsAsyncClient("https://api.local", transport=transport) as client:
+            return [detector.id for detector in await client.list_detectors()]
+
+    assert asyncio.run(runner()) == ["det-3", "det-2", "det-1"]
+
+
+def _etag_transport(seen: List[str | None]) -> httpx.MockTransport:
+    body = {"id": "det-1", "name": "Demo", "mode": "binary", "query": "demo", "confidence_threshold": 0.5}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if_none_match = request.headers.get("If-None-Match")
+        seen.append(if_none_match)
+        if if_none_match == '"det-1.1"':
+            return httpx.Response(304, headers={"ETag": '"det-1.1"'}, request=request)
+        return httpx.Response(200, json=body, headers={"ETag": '"det-1.1"'}, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+def test_get_detector_revalidates_with_etag() -> None:
+    seen: List[str | None] = []
+    client = IntelliOpticsClient("https://api.local", transport=_etag_transport(seen))
+
+    first = client.get_detector("det-1")
+    second = client.get_detector("det-1")
+
+    assert seen == [None, '"det-1.1"']
+    assert second == first
+
+
+def test_etag_cache_shares_only_immutable_values_across_threads() -> None:
+    seen: List[str | None] = []
+    client = IntelliOpticsClient("https://api.local", transport=_etag_transport(seen), etag_cache_size=2)
+
+    with pytest.raises(FrozenInstanceError):
+        client.get_detector("det-1").name = "Renamed"  # type: ignore[misc]
+    assert client.get_detector("det-1").name == "Demo"
+
+    def fetch(index: int) -> str:
+        return client.get_detector(f"det-{index % 5}").id
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert set(executor.map(fetch, range(400))) == {"det-1"}
+
+
+def test_async_get_detector_revalidates_with_etag() -> None:
+    seen: List[str | None] = []
+
+    async def runner() -> None:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=_etag_transport(seen)) as client:
+            await client.get_detector("det-1")
+            assert (await client.get_detector("det-1")).id == "det-1"
+
+    asyncio.run(runner())
+    assert seen == [None, '"det-1.1"']
+
+
+def test_get_detector_refetches_when_entry_is_evicted_before_304() -> None:
+    seen: List[str | None] = []
+    etag_transport = _etag_transport(seen)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match"):
+            client._conditional._entries.clear()
+        return etag_transport.handle_request(request)
+
+    client = IntelliOpticsClient("https://api.local", transport=httpx.MockTransport(handler))
+
+    client.get_detector("det-1")
+    assert client.get_detector("det-1").id == "det-1"
+    assert seen == [None, '"det-1.1"', None]
+
+
+def test_etag_cache_can_be_disabled() -> None:
+    seen: List[str | None] = []
+    client = IntelliOpticsClient("https://api.local", transport=_etag_transport(seen), etag_cache_size=0)
+
+    client.get_detector("det-1")
+    client.get_detector("det-1")
+
+    assert seen == [None, None]
+
+
+_FRAME = b"\xff\xd8" + bytes(range(256)) * 600 + b"\xff\xd9"
+
+
+def _upload_transport(bodies: List[Tuple[str | None, bytes]]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.headers.get("Content-Length"), request.read()))
+        payload = {"id": "iq-1", "detector_id": "det-1", "snapshot_url": None}
+        return httpx.Response(201, json=payload, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.parametrize("kind", ["bytes", "bytearray", "memoryview", "mmap", "file"])
+def test_submit_image_query_streams_buffer_sources(kind: str, tmp_path) -> None:
+    path = tmp_path / "frame.jpg"
+    path.write_bytes(_FRAME)
+    bodies: List[Tuple[str | None, bytes]] = []
+    client = IntelliOpticsClient("https://api.local", transport=_upload_transport(bodies))
+
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        source = {
+            "bytes": _FRAME,
+            "bytearray": bytearray(_FRAME),
+            "memoryview": memoryview(_FRAME),
+            "mmap": mapped,
+            "file": handle,
+        }[kind]
+        image_query = client.submit_image_query("det-1", image_bytes=source)
+
+    assert image_query.id == "iq-1"
+    content_length, body = bodies[0]
+    assert _FRAME in body
+    assert content_length == str(len(body))
+
+
+def test_async_submit_image_query_streams_memoryview() -> None:
+    bodies: List[Tuple[str | None, bytes]] = []
+
+    async def runner() -> str:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=_upload_transport(bodies)) as client:
+            return (await client.submit_image_query("det-1", image_bytes=memoryview(bytearray(_FRAME)))).id
+
+    assert asyncio.run(runner()) == "iq-1"
+    assert _FRAME in bodies[0][1]
+
+
+def test_submit_image_query_resizes_to_max_dimension() -> None:
+    buffer = BytesIO()
+    Image.new("RGB", (2000, 1000)).save(buffer, format="JPEG")
+    bodies: List[Tuple[str | None, bytes]] = []
+    client = IntelliOpticsClient(
+        "https://api.local", transport=_upload_transport(bodies), max_image_dimension=1000, jpeg_quality=60
+    )
+
+    client.submit_image_query("det-1", image_bytes=buffer.getvalue())
+    client.submit_image_query("det-1", image_bytes=buffer.getvalue(), max_dimension=500)
+
+    sizes = []
+    for _, body in bodies:
+        jpeg = body[body.index(b"\xff\xd8") :]
+        sizes.append(jpeg_dimensions(jpeg))
+    assert sizes == [(1000, 500), (500, 250)]
+
+
+def _frame(seed: int) -> bytes:
+    pixels = np.random.default_rng(seed).integers(0, 255, size=(8, 8, 3), dtype=np.uint8)
+    buffer = BytesIO()
+    Image.fromarray(pixels).resize((128, 128)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_deduplicator_reuses_image_query_for_repeated_frames() -> None:
+    posts: List[Dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        index = len(posts)
+        posts.append({"body": request.read().decode("latin-1")})
+        payload = {"id": f"iq-{index}", "detector_id": "det-1", "snapshot_url": None}
+        return httpx.Response(201, json=payload, request=request)
+
+    deduplicator = FrameDeduplicator(max_distance=2, history=4)
+    client = IntelliOpticsClient(
+        "https://api.local", transport=httpx.MockTransport(handler), deduplicator=deduplicator
+    )
+
+    first = client.submit_image_query("det-1", image_bytes=_frame(1))
+    repeat = client.submit_image_query("det-1", image_bytes=_frame(1))
+    other_stream = client.submit_image_query("det-1", image_bytes=_frame(1), rtsp_source_id="str-2")
+    new_scene = client.submit_image_query("det-1", image_bytes=_frame(2))
+
+    assert repeat is first
+    assert [first.id, other_stream.id, new_scene.id] == ["iq-0", "iq-1", "iq-2"]
+    assert len(posts) == 3
+    assert "str-2" in posts[1]["body"]
+    assert deduplicator.stats == DedupStats(checked=4, reused=1)
+    assert deduplicator.stats.reuse_rate == 0.25
+
+
+def test_async_submit_image_query_hashes_and_resizes_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    from intellioptics import client as client_module
+
+    threads: Dict[str, int] = {}
+    fingerprint = FrameDeduplicator.fingerprint
+    fit_image = client_module._fit_image
+
+    def recording_fingerprint(self: FrameDeduplicator, image: Any) -> int:
+        threads["fingerprint"] = threading.get_ident()
+        return fingerprint(self, image)
+
+    def recording_fit_image(*args: Any) -> Any:
+        threads["fit"] = threading.get_ident()
+        return fit_image(*args)
+
+    monkeypatch.setattr(FrameDeduplicator, "fingerprint", recording_fingerprint)
+    monkeypatch.setattr(client_module, "_fit_image", recording_fit_image)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(201, json={"id": "iq-1", "detector_id": "det-1"}, request=request)
+
+    async def runner() -> int:
+        async with IntelliOpticsAsyncClient(
+            "https://api.local",
+            transport=httpx.MockTransport(handler),
+            deduplicator=FrameDeduplicator(),
+            max_image_dimension=64,
+        ) as client:
+            await client.submit_image_query("det-1", image_bytes=_frame(1))
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(runner())
+
+    assert set(threads) == {"fingerprint", "fit"}
+    assert loop_thread not in threads.values()
+
+
+def test_submit_and_wait_many_bounds_concurrency_and_reports_errors() -> None:
+    active = {"now": 0, "peak": 0}
+    pulled: List[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            body = (await request.aread()).decode("latin-1")
+            if "det-missing" in body:
+                return httpx.Response(400, json={"detail": "Detector not found"}, request=request)
+            payload = {"id": f"iq-{body.count('x')}", "detector_id": "det-1", "snapshot_url": None}
+            return httpx.Response(201, json=payload, request=request)
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        query_id = request.url.path.split("/")[3]
+        return httpx.Response(200, json={"id": query_id, "answer": "YES"}, request=request)
+
+    def submissions() -> Iterator[FrameSubmission]:
+        for index in range(12):
+            pulled.append(index)
+            detector_id = "det-missing" if index == 5 else "det-1"
+            yield FrameSubmission(detector_id=detector_id, image=b"\xff\xd8" + b"x" * index)
+
+    async def runner() -> List[FrameOutcome]:
+        async with IntelliOpticsAsyncClient("https://api.local", transport=httpx.MockTransport(handler)) as client:
+            outcomes = []
+            async for outcome in client.submit_and_wait_many(submissions(), concurrency=3, poll_interval=0):
+                assert len(pulled) - len(outcomes) <= 3
+                outcomes.append(outcome)
+            return outcomes
+
+    outcomes = asyncio.run(runner())
+
+    assert sorted(outcome.index for outcome in outcomes) == list(range(12))
+    assert active["peak"] <= 3
+    failed = [outcome for outcome in outcomes if not outcome.ok]
+    assert [outcome.index for outcome in failed] == [5]
+    assert isinstance(failed[0].error, httpx.HTTPStatusError)
+    for outcome in outcomes:
+        if outcome.ok:
+            assert outcome.result is not None and outcome.result.id == f"iq-{outcome.index}"
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture()
+def local_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_options_and_wait_metrics(local_server: str) -> None:
+    options = PoolOptions(max_connections=2, max_keepalive_connections=1)
+    with IntelliOpticsClient(local_server, pool=options) as client:
+        assert client.health() and client.health()
+        stats = client.pool_stats
+        pool = client._client._transport._pool  # type: ignore[attr-defined]
+
+    assert pool._max_connections == 2
+    assert stats.requests == 2
+    assert 0 <= stats.mean_wait_seconds <= stats.max_wait_seconds
+
+
+def test_shared_pool_outlives_individual_clients(local_server: str) -> None:
+    options = PoolOptions(max_connections=4)
+    first = IntelliOpticsClient(local_server, pool=options, share_pool=True)
+    second = IntelliOpticsClient(local_server, pool=options, share_pool=True)
+    shared = first._client._transport._transport  # type: ignore[attr-defined]
+    assert second._client._transport._transport is shared  # type: ignore[attr-defined]
+
+    assert first.health()
+    first.close()
+    assert second.health()
+    second.close()
+
+    third = IntelliOpticsClient(local_server, pool=options, share_pool=True)
+    assert third._client._transport._transport is not shared  # type: ignore[attr-defined]
+    third.close()
+
+
+def test_async_shared_pool_is_per_event_loop(local_server: str) -> None:
+    options = PoolOptions(max_connections=4)
+
+    async def runner() -> List[Any]:
+        first = IntelliOpticsAsyncClient(local_server, pool=options, share_pool=True)
+        second = IntelliOpticsAsyncClient(local_server, pool=options, share_pool=True)
+        try:
+            assert await first.health() and await second.health()
+            return [client._client._transport._transport for client in (first, second)]  # type: ignore[attr-defined]
+        finally:
+            await first.close()
+            await second.close()
+
+    same_loop = asyncio.run(runner())
+    assert same_loop[0] is same_loop[1]
+    other_loop = asyncio.run(runner())
+    assert other_loop[0] is not same_loop[0]
+
+
+def test_clients_honour_proxy_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+
+    def proxied(client: Any) -> Dict[str, Any]:
+        return {pattern.pattern: transport for pattern, transport in client._client._mounts.items()}
+
+    default = IntelliOpticsClient("https://api.example.com", pool=PoolOptions(max_connections=2))
+    retrying = IntelliOpticsClient("https://api.example.com", retry=RetryPolicy(max_attempts=2))
+    shared = IntelliOpticsAsyncClient("https://api.example.com", share_pool=True)
+    explicit = IntelliOpticsClient("https://api.example.com", transport=httpx.MockTransport(lambda request: None))
+    try:
+        for client in (default, retrying, shared):
+            mounts = proxied(client)
+            assert mounts["all://localhost"] is None
+            assert mounts["https://"] is not None
+        assert isinstance(proxied(retrying)["https://"], ResilientTransport)
+        assert proxied(explicit) == {}
+    finally:
+        for client in (default, retrying, explicit):
+            client.close()
+        asyncio.run(shared.close())
+
+
+def test_async_client_records_pool_waits(local_server: str) -> None:
+    async def runner() -> PoolStats:
+        async with IntelliOpticsAsyncClient(local_server, pool=PoolOptions(max_connections=1)) as client:
+            await asyncio.gather(*(client.health() for _ in range(3)))
+            return client.pool_stats
+
+    stats = asyncio.run(runner())
+    assert stats.requests == 3
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+import numpy as np
+import pytest
 from PIL import Image
 
-from intellioptics._img import to_jpeg_bytes
+from intellioptics._img import fit_upload, jpeg_dimensions, perceptual_hash, to_jpeg_bytes, to_jpeg_bytes_batch
 
 
-def _make_image_bytes(fmt: str, color: tuple[int, int, int] = (255, 0, 0)) -> bytes:
+def _make_image_bytes(
+    fmt: str, color: tuple[int, int, int] = (255, 0, 0), size: tuple[int, int] = (10, 10)
+) -> bytes:
     buffer = BytesIO()
-    image = Image.new("RGB", (10, 10), color=color)
+    image = Image.new("RGB", size, color=color)
     image.save(buffer, format=fmt)
     return buffer.getvalue()
 
@@ -48,3 +53,102 @@ def test_png_path_is_transcoded(tmp_path):
 
     with Image.open(BytesIO(jpeg_bytes)) as result:
         assert result.format == "JPEG"
+
+
+def test_batch_encodes_stacked_frames_in_order():
+    frames = np.zeros((4, 8, 12, 3), dtype=np.float32)
+    for index in range(4):
+        frames[index, :, :, 0] = index * 60
+
+    payloads = to_jpeg_bytes_batch(frames)
+
+    assert len(payloads) == 4
+    for index, payload in enumerate(payloads):
+        with Image.open(BytesIO(payload)) as result:
+            assert result.format == "JPEG"
+            assert result.size == (12, 8)
+            assert abs(result.getpixel((6, 4))[0] - index * 60) <= 4
+
+
+def test_batch_accepts_mixed_inputs_and_custom_executor():
+    jpeg_bytes = _make_image_bytes("JPEG")
+    inputs = [jpeg_bytes, _make_image_bytes("PNG"), Image.new("RGB", (5, 7))]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        payloads = to_jpeg_bytes_batch(inputs, executor=executor)
+
+    assert payloads[0] == jpeg_bytes
+    with Image.open(BytesIO(payloads[2])) as result:
+        assert result.size == (5, 7)
+
+
+def test_batch_quality_controls_output_size():
+    frames = np.random.default_rng(0).integers(0, 255, size=(2, 32, 32, 3), dtype=np.uint8)
+
+    low = to_jpeg_bytes_batch(frames, quality=20, subsampling=2)
+    high = to_jpeg_bytes_batch(frames, quality=95, subsampling=0)
+
+    assert all(len(small) < len(large) for small, large in zip(low, high))
+
+
+def test_batch_rejects_invalid_stacked_shape():
+    with pytest.raises(ValueError):
+        to_jpeg_bytes_batch(np.zeros((2, 4, 4, 4), dtype=np.uint8))
+
+
+def test_buffer_inputs_are_accepted_without_conversion():
+    jpeg_bytes = _make_image_bytes("JPEG")
+    png_view = memoryview(bytearray(_make_image_bytes("PNG")))
+
+    assert to_jpeg_bytes(bytearray(jpeg_bytes)) == jpeg_bytes
+    assert to_jpeg_bytes(memoryview(jpeg_bytes)) == jpeg_bytes
+    with Image.open(BytesIO(to_jpeg_bytes(png_view))) as result:
+        assert result.format == "JPEG"
+    png_view.release()
+
+
+def test_jpeg_dimensions_reads_header_only():
+    jpeg_bytes = _make_image_bytes("JPEG", size=(640, 360))
+
+    assert jpeg_dimensions(jpeg_bytes) == (640, 360)
+    assert jpeg_dimensions(jpeg_bytes[:40]) is None
+    assert jpeg_dimensions(_make_image_bytes("PNG")) is None
+
+
+def test_max_dimension_downscales_preserving_aspect_ratio():
+    for source in (_make_image_bytes("JPEG", size=(4000, 2000)), _make_image_bytes("PNG", size=(4000, 2000))):
+        with Image.open(BytesIO(to_jpeg_bytes(source, max_dimension=1000, quality=70))) as result:
+            assert result.size == (1000, 500)
+
+    frame = np.zeros((300, 1200, 3), dtype=np.uint8)
+    with Image.open(BytesIO(to_jpeg_bytes(frame, max_dimension=600))) as result:
+        assert result.size == (600, 150)
+
+
+def test_small_jpegs_skip_reencoding():
+    jpeg_bytes = _make_image_bytes("JPEG", size=(800, 600))
+    view = memoryview(jpeg_bytes)
+
+    assert to_jpeg_bytes(jpeg_bytes, max_dimension=1024) == jpeg_bytes
+    assert fit_upload(view, max_dimension=1024) is view
+    stream = BytesIO(jpeg_bytes)
+    assert fit_upload(stream, max_dimension=1024) is stream
+    assert stream.tell() == 0
+
+    resized = fit_upload(stream, max_dimension=400)
+    assert jpeg_dimensions(resized) == (400, 300)
+
+
+def test_perceptual_hash_tolerates_noise_but_not_scene_changes():
+    rng = np.random.default_rng(1)
+    frame = np.repeat(np.linspace(0, 255, 320, dtype=np.uint8)[None, :, None], 240, axis=0).repeat(3, axis=2)
+    frame[60:180, 80:240] = rng.integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+    noisy = np.clip(frame.astype(np.int16) + rng.integers(-3, 4, size=frame.shape), 0, 255).astype(np.uint8)
+    changed = frame[:, ::-1]
+
+    original = perceptual_hash(frame)
+    encoded = perceptual_hash(to_jpeg_bytes(frame, quality=80))
+
+    assert bin(original ^ perceptual_hash(noisy)).count("1") <= 4
+    assert bin(original ^ encoded).count("1") <= 4
+    assert bin(original ^ perceptual_hash(changed)).count("1") > 10
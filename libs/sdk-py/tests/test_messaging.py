@@ -1,11 +1,19 @@
-from datetime import datetime
+import json
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from intellioptics.messaging import (
+    CODEC_VERSION,
+    MAGIC,
     InferenceAnswer,
     InferenceJobMessage,
+    InferenceResultBatch,
     InferenceResultMessage,
+    MessageDecodeError,
+    decode,
+    decode_many,
+    encode_many,
 )
 
 
@@ -46,3 +54,110 @@ def test_inference_result_round_trip(answer: InferenceAnswer):
     restored = InferenceResultMessage.from_dict(payload)
     assert restored.answer is answer
     assert restored.score == pytest.approx(0.87)
+
+
+def _job(**overrides):
+    fields = {
+        "job_id": "job-123",
+        "model_id": "model-1",
+        "detector_id": "det-1",
+        "requested_by": "edge-1",
+        "image_blob_url": "https://example/blob.jpg",
+        "deadline": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "trace": {"corr": "abc", "hops": [1, 2]},
+    }
+    fields.update(overrides)
+    return InferenceJobMessage(**fields)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        _job(),
+        _job(image_blob_url=None, rtsp_ref="rtsp://cam-é/1", deadline=None, trace={}),
+        InferenceResultMessage(
+            job_id="job-123",
+            answer=InferenceAnswer.UNKNOWN,
+            score=0.125,
+            model_revision="v2",
+            processed_at=datetime(2024, 5, 1, 14, 30, tzinfo=timezone(timedelta(hours=2))),
+        ),
+        InferenceResultMessage(job_id="job-9", answer=InferenceAnswer.NO, score=1.0),
+    ],
+)
+def test_binary_round_trip(message):
+    encoded = message.to_bytes()
+
+    assert encoded[:2] == MAGIC and encoded[2] == CODEC_VERSION
+    assert type(message).from_bytes(encoded) == message
+    assert len(encoded) < len(json.dumps(message.to_dict()))
+
+
+def test_binary_timestamps_decode_as_utc():
+    deadline = datetime(2024, 5, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+
+    restored = InferenceJobMessage.from_bytes(_job(deadline=deadline).to_bytes())
+
+    assert restored.deadline == deadline
+    assert restored.deadline.utcoffset() == timedelta(0)
+
+
+def test_encode_many_round_trips_mixed_batches_in_order():
+    messages = [
+        _job(job_id=f"job-{index}")
+        if index % 2
+        else InferenceResultMessage(f"job-{index}", InferenceAnswer.YES, 0.5)
+        for index in range(50)
+    ]
+
+    encoded = encode_many(messages)
+
+    assert decode_many(encoded) == messages
+    assert decode_many(encode_many([])) == []
+
+
+@pytest.mark.parametrize(
+    ("mutate", "error"),
+    [
+        (lambda data: b"XX" + data[2:], "Not a binary"),
+        (lambda data: data[:2] + bytes([CODEC_VERSION + 1]) + data[3:], "Unsupported"),
+        (lambda data: data[:-3], "Truncated"),
+        (lambda data: data + b"\x00", "Trailing"),
+    ],
+)
+def test_decode_rejects_malformed_buffers(mutate, error):
+    data = InferenceResultMessage("job-1", InferenceAnswer.YES, 0.9, model_revision="v3").to_bytes()
+
+    with pytest.raises(MessageDecodeError, match=error):
+        decode(mutate(data))
+
+
+def test_from_bytes_checks_message_type():
+    with pytest.raises(MessageDecodeError):
+        InferenceResultMessage.from_bytes(_job().to_bytes())
+
+
+def test_result_batch_round_trips_through_dict_and_bytes():
+    processed_at = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    batch = InferenceResultBatch(
+        [
+            InferenceResultMessage(f"iq-{index}", InferenceAnswer.YES, index / 10, processed_at=processed_at)
+            for index in range(5)
+        ]
+    )
+
+    assert InferenceResultBatch.from_dict(json.loads(json.dumps(batch.to_dict()))) == batch
+    assert InferenceResultBatch.from_bytes(batch.to_bytes()) == batch
+    assert [result.job_id for result in batch] == [f"iq-{index}" for index in range(5)]
+    with pytest.raises(MessageDecodeError):
+        InferenceResultBatch.from_bytes(encode_many([_job()]))
+
+
+def test_decode_wraps_invalid_strings_and_trace_in_message_decode_error():
+    batch = InferenceResultBatch([InferenceResultMessage("job-1", InferenceAnswer.YES, 0.9)])
+    job = InferenceJobMessage("job-1", "model-1", "det-1", "edge-1", trace={"span": "abc"})
+
+    with pytest.raises(MessageDecodeError, match="UTF-8"):
+        InferenceResultBatch.from_bytes(batch.to_bytes().replace(b"job-1", b"job-\xff"))
+    with pytest.raises(MessageDecodeError, match="JSON"):
+        InferenceJobMessage.from_bytes(job.to_bytes().replace(b'"abc"', b'"abc;'))
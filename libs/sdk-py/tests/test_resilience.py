@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import httpx
+import pytest
+from conftest import FakeClock
+
+from intellioptics._http import AsyncHttpClient, HttpClient
+from intellioptics.client import IntelliOpticsClient
+from intellioptics.errors import IntelliOpticsClientError
+from intellioptics.resilience import (
+    AsyncResilientTransport,
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    ResilientTransport,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+FAST = RetryPolicy(max_attempts=3, backoff_base=0.001, jitter=False)
+
+
+def _flaky_transport(statuses: List[int], seen: List[str], **headers: str) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, json={"status": "ok"}, headers=headers, request=request)
+
+    return httpx.MockTransport(handler)
+
+
+def test_parse_retry_after_accepts_seconds_and_dates() -> None:
+    now = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    later = (now + timedelta(seconds=30)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(later, now=now) == 30.0
+    assert parse_retry_after("soon") is None
+
+
+def test_backoff_grows_exponentially_and_honours_retry_after() -> None:
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=False)
+
+    assert [policy.backoff(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
+    assert policy.backoff(0, retry_after=2.5) == 2.5
+    assert policy.backoff(0, retry_after=60) == 3.0
+    assert 0 <= RetryPolicy(backoff_base=0.5).backoff(2) <= 2.0
+
+
+def test_transient_statuses_are_retried_for_idempotent_requests_only() -> None:
+    seen: List[str] = []
+    statuses = [503, 502]
+    client = IntelliOpticsClient("https://api.local", transport=_flaky_transport(statuses, seen), retry=FAST)
+
+    assert client.health()
+    assert seen == ["GET", "GET", "GET"]
+    assert client.resilience_stats.retries == 2
+
+    seen.clear()
+    statuses.extend([503, 503])
+    post = client._client.post("/v1/image-queries:batch", json={"queries": []})
+    assert post.status_code == 503
+    assert seen == ["POST"]
+
+    seen.clear()
+    keyed = client._client.post("/v1/image-queries:batch", json={}, headers={"Idempotency-Key": "abc"})
+    assert keyed.status_code == 200
+    assert seen == ["POST", "POST"]
+
+
+def test_connection_errors_are_retried_even_for_posts() -> None:
+    attempts: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(201, json={"ids": []}, request=request)
+
+    client = IntelliOpticsClient("https://api.local", transport=httpx.MockTransport(handler), retry=FAST)
+
+    assert client._client.post("/v1/image-queries:batch", json={"queries": []}).status_code == 201
+    assert len(attempts) == 3
+    assert client.resilience_stats.retries == 2
+
+
+def test_circuit_breaker_fails_fast_and_probes_after_reset(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+    statuses = [500, 500, 500]
+    seen: List[str] = []
+    client = IntelliOpticsClient(
+        "https://api.local", transport=_flaky_transport(statuses, seen), circuit_breaker=breaker
+    )
+
+    assert client._client.get("/health").status_code == 500
+    assert client._client.get("/health").status_code == 500
+    assert breaker.state("api.local") == "open"
+    with pytest.raises(CircuitOpenError):
+        client.health()
+    assert len(seen) == 2
+
+    clock.now = 11.0
+    assert client._client.get("/health").status_code == 500  # failed probe re-opens
+    with pytest.raises(CircuitOpenError):
+        client.health()
+
+    clock.now = 22.0
+    assert client.health()
+    assert breaker.state("api.local") == "closed"
+    stats = client.resilience_stats
+    assert (stats.short_circuits, stats.circuit_opens) == (2, 2)
+
+
+def test_cancelled_or_crashed_probe_lets_the_next_request_probe(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    responses = [httpx.Response(500)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if not responses:
+            await asyncio.sleep(10)
+        return responses.pop(0)
+
+    async def runner() -> int:
+        async with httpx.AsyncClient(
+            base_url="https://api.local",
+            transport=AsyncResilientTransport(httpx.MockTransport(handler), Resilience(breaker=breaker)),
+        ) as client:
+            assert (await client.get("/health")).status_code == 500
+            clock.now = 11.0
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.get("/health"), 0.05)
+            responses.append(httpx.Response(200))
+            return (await client.get("/health")).status_code
+
+    assert asyncio.run(runner()) == 200
+    assert breaker.state("api.local") == "closed"
+
+    def crash(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("handler bug")
+
+    breaker.record_failure("api.local")
+    clock.now = 30.0
+    crashing = httpx.Client(transport=ResilientTransport(httpx.MockTransport(crash), Resilience(breaker=breaker)))
+    with pytest.raises(RuntimeError):
+        crashing.get("https://api.local/health")
+    assert breaker.state("api.local") == "open"
+    breaker.check("api.local")
+    assert breaker.state("api.local") == "half-open"
+
+
+def test_async_http_client_retries_by_default() -> None:
+    seen: List[str] = []
+
+    async def runner() -> Any:
+        client = AsyncHttpClient("https://api.local", "token", retry=FAST)
+        inner = client._client._transport
+        inner._transport = _flaky_transport([503], seen)  # type: ignore[attr-defined]
+        try:
+            return await client.get_json("/health"), client.resilience_stats.retries
+        finally:
+            await client.close()
+
+    assert asyncio.run(runner()) == ({"status": "ok"}, 1)
+    assert seen == ["GET", "GET"]
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses: List[int] = []
+
+    def _reply(self) -> None:
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture()
+def flaky_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_http_client_retries_and_raises_after_giving_up(flaky_server: str) -> None:
+    client = HttpClient(flaky_server, "token", retry=FAST)
+
+    _FlakyHandler.statuses = [429, 503]
+    assert client.get_json("/health") == {"ok": True}
+    assert client.resilience_stats.retries == 2
+
+    _FlakyHandler.statuses = [503, 503, 503]
+    with pytest.raises(IntelliOpticsClientError, match="503"):
+        client.get_json("/health")
+
+    _FlakyHandler.statuses = [503]
+    with pytest.raises(IntelliOpticsClientError, match="503"):
+        client.post_json("/v1/image-queries", json={})
+    client.close()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+from conftest import FakeClock
+
+from intellioptics.messaging import InferenceJobMessage
+from intellioptics.scheduling import DEADLINE_EXCEEDED, DeadlineJobSource, DeadlineScheduler, SchedulerStats
+from intellioptics.transport import JOBS_TOPIC, InMemoryBroker
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _job(job_id: str, seconds: Optional[float]) -> InferenceJobMessage:
+    deadline = NOW + timedelta(seconds=seconds) if seconds is not None else None
+    return InferenceJobMessage(job_id, "model-1", "det-1", "edge-1", deadline=deadline)
+
+
+def test_scheduler_orders_by_deadline_and_sets_aside_expired_jobs() -> None:
+    clock = FakeClock(NOW)
+    scheduler: DeadlineScheduler[int] = DeadlineScheduler(clock=clock)
+    for index, (job_id, seconds) in enumerate(
+        [("none-1", None), ("late", 30), ("stale", -1), ("soon", 2), ("none-2", None), ("mid", 10)]
+    ):
+        scheduler.push(_job(job_id, seconds), index)
+
+    assert [scheduled.job.job_id for scheduled in scheduler.pop_batch(2)] == ["soon", "mid"]
+    clock.now += timedelta(seconds=31)
+    assert [scheduled.job.job_id for scheduled in scheduler.pop_batch(5)] == ["none-1", "none-2"]
+    assert [scheduled.item for scheduled in scheduler.take_expired()] == [2, 1]
+    assert scheduler.take_expired() == []
+    assert scheduler.pop() is None
+    assert scheduler.stats == SchedulerStats(on_time=4, expired=2, pending=0)
+
+
+def test_scheduler_min_slack_expires_jobs_that_cannot_finish_in_time() -> None:
+    scheduler: DeadlineScheduler[None] = DeadlineScheduler(min_slack=0.5, clock=FakeClock(NOW))
+    scheduler.push(_job("tight", 0.4), None)
+    scheduler.push(_job("ok", 0.6), None)
+
+    assert [scheduled.job.job_id for scheduled in scheduler.pop_batch(5)] == ["ok"]
+    assert scheduler.stats.expired == 1
+    with pytest.raises(ValueError):
+        DeadlineScheduler(min_slack=-1)
+
+
+@pytest.mark.parametrize("expired_action", ["dead_letter", "ack"])
+def test_job_source_yields_earliest_deadline_and_settles_expired(expired_action: str) -> None:
+    now = datetime.now(tz=timezone.utc)
+
+    async def runner() -> None:
+        broker = InMemoryBroker()
+        jobs = [
+            InferenceJobMessage("late", "m", "d", "e", deadline=now + timedelta(minutes=5)),
+            InferenceJobMessage("expired", "m", "d", "e", deadline=now - timedelta(seconds=1)),
+            InferenceJobMessage("soon", "m", "d", "e", deadline=now + timedelta(minutes=1)),
+        ]
+        await broker.publish_many(JOBS_TOPIC, [job.to_bytes() for job in jobs] + [b"garbage"])
+        source = DeadlineJobSource(broker, expired_action=expired_action)
+
+        first = await source.next_batch(1, timeout=0.1)
+        second = await source.next_batch(5, timeout=0.1)
+        assert [scheduled.job.job_id for scheduled in first + second] == ["soon", "late"]
+        await broker.ack_many(scheduled.item for scheduled in first + second)
+        assert await source.next_batch(5, timeout=0.01) == []
+
+        assert source.stats == SchedulerStats(on_time=2, expired=1, pending=0)
+        dead = {letter.body: letter.reason for letter in await broker.dead_letters(JOBS_TOPIC)}
+        assert set(dead) == ({b"garbage", jobs[1].to_bytes()} if expired_action == "dead_letter" else {b"garbage"})
+        if expired_action == "dead_letter":
+            assert dead[jobs[1].to_bytes()] == DEADLINE_EXCEEDED
+        assert broker.pending_count(JOBS_TOPIC) == 0
+
+    asyncio.run(runner())
+
+
+def test_job_source_buffers_up_to_capacity_and_drops_lost_locks(clock: FakeClock) -> None:
+    now = datetime.now(tz=timezone.utc)
+
+    async def runner() -> None:
+        broker = InMemoryBroker(lock_duration=10.0, clock=clock)
+        jobs = [
+            InferenceJobMessage(f"j{index}", "m", "d", "e", deadline=now + timedelta(minutes=index + 1))
+            for index in range(4)
+        ]
+        await broker.publish_many(JOBS_TOPIC, [job.to_bytes() for job in jobs])
+        source = DeadlineJobSource(broker, capacity=3, clock=clock)
+
+        first = await source.next_batch(1, timeout=0.01)
+        assert [scheduled.job.job_id for scheduled in first] == ["j0"]
+        assert len(source.scheduler) == 2
+
+        clock.now = 11.0
+        second = await source.next_batch(4, timeout=0.01)
+        assert [scheduled.job.job_id for scheduled in second] == ["j0", "j1", "j2"]
+        await broker.ack_many(scheduled.item for scheduled in second)
+        third = await source.next_batch(4, timeout=0.01)
+        assert [scheduled.job.job_id for scheduled in third] == ["j3"]
+        await broker.ack_many(scheduled.item for scheduled in third)
+        assert broker.pending_count(JOBS_TOPIC) == 0
+
+    asyncio.run(runner())
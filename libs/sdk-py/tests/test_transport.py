@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+from conftest import FakeClock
+
+from intellioptics.messaging import InferenceAnswer, InferenceResultBatch, InferenceResultMessage
+from intellioptics.transport import (
+    JOBS_TOPIC,
+    MAX_DELIVERY_COUNT_EXCEEDED,
+    RESULTS_TOPIC,
+    InMemoryBroker,
+    MessageLockLostError,
+    SQLiteBroker,
+    Transport,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_broker(request: pytest.FixtureRequest, tmp_path: Path) -> Callable[..., Transport]:
+    def factory(**kwargs) -> Transport:
+        if request.param == "memory":
+            return InMemoryBroker(**kwargs)
+        return SQLiteBroker(tmp_path / "broker.db", poll_interval=0.01, **kwargs)
+
+    return factory
+
+
+def test_receive_returns_batches_in_order_and_ack_removes(make_broker) -> None:
+    async def runner() -> List[bytes]:
+        async with make_broker() as broker:
+            assert await broker.publish_many(JOBS_TOPIC, [b"a", b"b", b"c"]) == [1, 2, 3]
+            await broker.publish(RESULTS_TOPIC, b"other")
+            first = await broker.receive(JOBS_TOPIC, max_messages=2, timeout=0)
+            second = await broker.receive(JOBS_TOPIC, max_messages=2, timeout=0)
+            await broker.ack_many(first)
+            await broker.ack(second[0])
+            assert await broker.receive(JOBS_TOPIC, timeout=0) == []
+            with pytest.raises(MessageLockLostError):
+                await broker.ack(first[0])
+            return [message.body for message in first + second]
+
+    assert asyncio.run(runner()) == [b"a", b"b", b"c"]
+
+
+def test_receive_waits_for_publish(make_broker) -> None:
+    async def runner() -> List[bytes]:
+        async with make_broker() as broker:
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, lambda: asyncio.ensure_future(broker.publish(JOBS_TOPIC, b"late")))
+            received = await broker.receive(JOBS_TOPIC, timeout=2.0)
+            assert await broker.receive(RESULTS_TOPIC, timeout=0.02) == []
+            return [message.body for message in received]
+
+    assert asyncio.run(runner()) == [b"late"]
+
+
+def test_expired_lock_is_redelivered_and_old_token_rejected(make_broker, clock: FakeClock) -> None:
+    async def runner() -> None:
+        async with make_broker(lock_duration=10.0, clock=clock) as broker:
+            await broker.publish(JOBS_TOPIC, b"job")
+            (first,) = await broker.receive(JOBS_TOPIC, timeout=0)
+            assert await broker.receive(JOBS_TOPIC, timeout=0) == []
+            clock.now += 11.0
+            (second,) = await broker.receive(JOBS_TOPIC, timeout=0)
+            assert (second.sequence_number, second.delivery_count) == (first.sequence_number, 2)
+            with pytest.raises(MessageLockLostError):
+                await broker.ack(first)
+            await broker.ack(second)
+
+    asyncio.run(runner())
+
+
+def test_abandon_and_dead_letter(make_broker) -> None:
+    async def runner() -> None:
+        async with make_broker(max_delivery_count=2) as broker:
+            await broker.publish_many(JOBS_TOPIC, [b"poison", b"bad"])
+            poison, bad = await broker.receive(JOBS_TOPIC, timeout=0)
+            await broker.dead_letter(bad, "undecodable")
+            await broker.abandon(poison)
+            (again,) = await broker.receive(JOBS_TOPIC, timeout=0)
+            assert again.delivery_count == 2
+            await broker.abandon(again)
+            assert await broker.receive(JOBS_TOPIC, timeout=0) == []
+
+            dead = await broker.dead_letters(JOBS_TOPIC)
+            assert sorted((letter.body, letter.reason) for letter in dead) == [
+                (b"bad", "undecodable"),
+                (b"poison", MAX_DELIVERY_COUNT_EXCEEDED),
+            ]
+            assert await broker.dead_letters(RESULTS_TOPIC) == []
+
+    asyncio.run(runner())
+
+
+def test_sqlite_broker_keeps_unsettled_messages_across_restarts(tmp_path: Path) -> None:
+    batch = InferenceResultBatch([InferenceResultMessage("iq-1", InferenceAnswer.YES, 0.9)])
+
+    async def runner() -> InferenceResultBatch:
+        async with SQLiteBroker(tmp_path / "broker.db") as broker:
+            await broker.publish_many(RESULTS_TOPIC, [batch.to_bytes(), b"acked"])
+            _, acked = await broker.receive(RESULTS_TOPIC, timeout=0)
+            await broker.ack(acked)
+        # A new process sees the unsettled message again once its lock has lapsed.
+        async with SQLiteBroker(tmp_path / "broker.db", clock=lambda: time.time() + 60) as broker:
+            (message,) = await broker.receive(RESULTS_TOPIC, timeout=0)
+            return InferenceResultBatch.from_bytes(message.body)
+
+    assert asyncio.run(runner()) == batch